@@ -1 +1,28 @@
-from monopoly.engines import StandAloneEngine
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from monopoly.engines import StandAloneEngine
+    from monopoly.servers import AsyncServerEngine, ShardedServerEngine
+
+__all__ = ["AsyncServerEngine", "ShardedServerEngine", "StandAloneEngine"]
+
+# engines pull in every model, loader, server and asyncio, so they load on first use instead of on import
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "AsyncServerEngine": "monopoly.servers",
+    "ShardedServerEngine": "monopoly.servers",
+    "StandAloneEngine": "monopoly.engines",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
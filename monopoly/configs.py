@@ -28,8 +28,53 @@ HOUSE_DISCOUNT_RATE: float = .9
 # 股票漲跌隨機值基數
 STOCK_SHUFFLE_BASE: int = 100
 
+# 市值型 ETF 每隔幾次開市重新計算成分股權重(0 為不調整)
+ETF_REBALANCE_OPENINGS: int = 5
+
+# 抽卡後是否放回牌堆(否則抽完一輪才重新洗牌)
+CARD_DRAWING_REPLACEMENT: bool = False
+
 # 遊戲狀態儲存資料夾
 GAME_SAVE_FOLDER: str = "save"
 
 # 遊戲狀態儲存副檔名
 GAME_SAVE_SUFFIX: str = ".sav"
+
+# 遊戲存檔的壓縮方式(raw/zlib/zlib-dict/lzma/bz2)
+GAME_SAVE_CODEC: str = "zlib"
+
+# 遊戲存檔索引的檔案名稱
+GAME_SAVE_CATALOG: str = "catalog.sqlite3"
+
+# 遊戲存檔列表每頁的數量
+GAME_SAVE_PAGE_SIZE: int = 20
+
+# 每隔幾回合自動存檔(0 為關閉)
+AUTO_SAVING_TURNS: int = 10
+
+# 自動存檔輪替保留的檔案數量
+AUTO_SAVING_ROTATION: int = 3
+
+# 是否量測各階段的執行時間(關閉時幾乎沒有額外負擔)
+INSTRUMENTS_ENABLED: bool = False
+
+# 盤面雜湊把存款分組的級距(1 為精確金額)
+STATE_HASH_CASH_BUCKET: int = 100
+
+# 連線伺服器位址
+SERVER_HOST: str = "127.0.0.1"
+
+# 連線伺服器埠號
+SERVER_PORT: int = 4564
+
+# 連線伺服器同時進行的遊戲桌上限
+SERVER_MAX_TABLES: int = 5000
+
+# 遊戲桌閒置多久(秒)後收回成快照
+SERVER_IDLE_TIMEOUT: float = 300.
+
+# 玩家連線接收過慢多久(秒)後斷線
+SERVER_SEND_TIMEOUT: float = 30.
+
+# 連線伺服器分流的行程數量
+SERVER_SHARDS: int = 4
@@ -32,6 +32,20 @@ class DirectionAttr(str, enum.Enum):
     FORWARDS = "get_forwards"
 
 
+class EventType(str, enum.Enum):
+    BANKRUPTCY = "bankruptcy"
+    CARD_DRAWN = "card_drawn"
+    HOUSE_BUILT = "house_built"
+    HOUSE_DEMOLISHED = "house_demolished"
+    LAND_BOUGHT = "land_bought"
+    LAND_SOLD = "land_sold"
+    STOCK_BOUGHT = "stock_bought"
+    STOCK_SOLD = "stock_sold"
+    STOCK_TICK = "stock_tick"
+    TOLL_PAID = "toll_paid"
+    TURN_ENDED = "turn_ended"
+
+
 class FixturePath(str, enum.Enum):
     CARDS = "fixtures/cards.csv"
     ETFS = "fixtures/etfs.csv"
@@ -64,6 +78,7 @@ class SystemText(str, enum.Enum):
     PRESS_ENTER_TO_CONTINUE = "> Press enter to continue..."
     PROPERTY_CODE_ERROR = "代碼錯誤!!"
     REVERSE_FINISH = "翻轉完成!!"
+    SAVED_FILES_PAGING = "[<] 上一頁 [>] 下一頁 [?名稱] 搜尋名稱開頭 [!] 重建索引"
     SELLING_SUCCESS = "賣出成功!!"
     START_POINT_NAME = "臺灣起點"
     THREE_DICES_NAME = "骰子x3"
@@ -1,8 +1,11 @@
 import abc
 import contextlib
+import pickle
 import sys
 import typing
 
+import pydantic
+
 from . import configs
 from .constants import SystemText
 from .loaders import FixtureLoader
@@ -45,6 +48,26 @@ class BaseEngine(EnginelizeMenuInterface, abc.ABC):
 
 
 class StandAloneEngine(BaseEngine):
+    auto_saving_turns: int = configs.AUTO_SAVING_TURNS
+    auto_saving_rotation: int = configs.AUTO_SAVING_ROTATION
+
+    _autosaver: typing.Union["AutoSaver", None] = pydantic.PrivateAttr(None)
+
+    @property
+    def autosaver(self) -> "AutoSaver":
+        if self._autosaver is None:
+            # the writer thread and its queue are only paid for once a game autosaves
+            from .storages import AutoSaver
+            self._autosaver = AutoSaver(
+                Board.get_save_folder(),
+                self.auto_saving_turns,
+                self.auto_saving_rotation,
+                suffix=Board.SAVE_SUFFIX,
+                codec=Board.SAVE_CODEC,
+                catalog=Board.get_save_catalog(),
+            )
+        return self._autosaver
+
     def execute(self):
         try:
             with contextlib.suppress(
@@ -55,7 +78,36 @@ class StandAloneEngine(BaseEngine):
                 while self.board is None:
                     self.execute_menu(self.title)
                 while self.board.finished is False:
-                    self.board.run()
+                    self.execution_turn()
             print(SystemText.GAME_OVER.value)
         except Exception as error:
             self.handle_exception(error)
+        finally:
+            if self._autosaver is not None:
+                self._autosaver.close()
+
+    def execution_turn(self):
+        self.board.run()
+        if self.auto_saving_turns > 0:
+            self.autosaver.capture(self.board)
+
+
+class TableEngine(StandAloneEngine):
+    # tables keep their own turn snapshots, see AsyncServerEngine.evict
+    auto_saving_turns: int = 0
+    snapshot: typing.Union[bytes, None] = None
+
+    @property
+    def evicted(self) -> bool:
+        return self.board is not None and not self.board.finished
+
+    def handle_exception(self, error: Exception):
+        # ends this table only, it runs on a thread of the server and an exit would take every other table down
+        print(SystemText.UNEXPECTED_ERROR.value)
+        if configs.DEBUG_MODE:
+            raise error
+
+    def execution_turn(self):
+        # turn-boundary snapshot, an evicted table resumes from the start of this turn
+        self.snapshot = pickle.dumps(self.board)
+        super().execution_turn()
@@ -0,0 +1,72 @@
+import typing
+
+from monopoly.constants import EventType
+
+
+class Event:
+    # one record per event type is reused by every emit, copy the fields to keep them
+    __slots__ = ("type", "player", "subject", "value")
+
+    def __init__(self, event_type: EventType):
+        self.type = event_type
+        self.player: typing.Any = None
+        self.subject: typing.Any = None
+        self.value: int = 0
+
+    def __repr__(self) -> str:
+        return f"Event({self.type.value}, {self.player}, {self.subject}, {self.value})"
+
+
+Subscriber = typing.Callable[[Event], typing.Any]
+
+
+class EventBus:
+    def __init__(self):
+        self._records = {event_type: Event(event_type) for event_type in EventType}
+        # tuples are replaced, never mutated, so subscribing inside a callback is safe
+        self._subscribers: dict[EventType, tuple[Subscriber, ...]] = {event_type: () for event_type in EventType}
+
+    @classmethod
+    def __get_validators__(cls) -> typing.Generator[typing.Callable, None, None]:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: typing.Any) -> "EventBus":
+        if not isinstance(value, cls):
+            raise TypeError(f"{value!r} is not an EventBus")
+        return value
+
+    def emit(
+        self,
+        event_type: EventType,
+        player: typing.Any = None,
+        subject: typing.Any = None,
+        value: int = 0,
+    ):
+        subscribers = self._subscribers[event_type]
+        if not subscribers:
+            return
+
+        record = self._records[event_type]
+        record.player, record.subject, record.value = player, subject, value
+        for subscriber in subscribers:
+            subscriber(record)
+
+    def listening(self, event_type: EventType) -> bool:
+        return bool(self._subscribers[event_type])
+
+    def subscribe(self, subscriber: Subscriber, *event_types: EventType) -> Subscriber:
+        for event_type in event_types or tuple(EventType):
+            if subscriber not in self._subscribers[event_type]:
+                self._subscribers[event_type] += (subscriber,)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber, *event_types: EventType):
+        for event_type in event_types or tuple(EventType):
+            self._subscribers[event_type] = tuple(
+                other for other in self._subscribers[event_type] if other != subscriber
+            )
+
+    def __reduce__(self) -> tuple:
+        # subscribers belong to the running process, a loaded board starts with none
+        return (self.__class__, ())
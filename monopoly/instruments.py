@@ -0,0 +1,169 @@
+import bisect
+import contextlib
+import json
+import pathlib
+import threading
+import time
+import typing
+
+from monopoly import configs
+
+# seconds, doubling from 1us up to about 8s
+HISTOGRAM_BOUNDS: tuple[float, ...] = tuple(1e-6 * 2 ** idx for idx in range(24))
+
+
+class Histogram:
+    def __init__(self, bounds: tuple[float, ...] = HISTOGRAM_BOUNDS):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.
+
+    def observe(self, value: float):
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, rate: float) -> float:
+        # upper bound of the bucket holding the quantile, good enough to spot the slow phase
+        rank, seen = rate * self.count, 0
+        for bound, bucket in zip((*self.bounds, float("inf")), self.buckets):
+            seen += bucket
+            if seen >= rank and seen:
+                return bound
+        return 0.
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "p50": self.quantile(.5),
+            "p99": self.quantile(.99),
+            "buckets": dict(zip(map(str, (*self.bounds, "+Inf")), self.buckets)),
+        }
+
+
+class Registry:
+    # every counter and histogram of the process, the module functions work on the one below
+    def __init__(self, active: bool = False):
+        self.enabled = active
+        self.lock = threading.Lock()
+        self.counters: dict[tuple[str, str], int] = {}
+        self.histograms: dict[tuple[str, str], Histogram] = {}
+
+
+_registry = Registry(configs.INSTRUMENTS_ENABLED)
+
+
+class _Timer:
+    __slots__ = ("key", "started")
+
+    def __init__(self, key: tuple[str, str]):
+        self.key = key
+        self.started = 0.
+
+    def __enter__(self):
+        self.started = time.monotonic()
+        return self
+
+    def __exit__(self, *args):
+        observe(*self.key, time.monotonic() - self.started)
+
+
+_DISABLED_TIMER = contextlib.nullcontext()
+
+
+def count(name: str, label: str = "", value: int = 1):
+    if not _registry.enabled:
+        return
+    with _registry.lock:
+        _registry.counters[name, label] = _registry.counters.get((name, label), 0) + value
+
+
+def disable():
+    _registry.enabled = False
+
+
+def enable():
+    _registry.enabled = True
+
+
+def enabled() -> bool:
+    return _registry.enabled
+
+
+def observe(name: str, label: str, value: float):
+    with _registry.lock:
+        histogram = _registry.histograms.get((name, label))
+        if histogram is None:
+            histogram = _registry.histograms[name, label] = Histogram()
+        histogram.observe(value)
+
+
+def reset():
+    with _registry.lock:
+        _registry.counters.clear()
+        _registry.histograms.clear()
+
+
+def timer(name: str, label: str = "") -> typing.ContextManager:
+    # disabled timers cost one attribute lookup, no clock read and no allocation
+    if not _registry.enabled:
+        return _DISABLED_TIMER
+    return _Timer((name, label))
+
+
+def snapshot() -> dict[str, typing.Any]:
+    with _registry.lock:
+        return {
+            "counters": [
+                {"name": name, "label": label, "value": value}
+                for (name, label), value in sorted(_registry.counters.items())
+            ],
+            "histograms": [
+                {"name": name, "label": label, **histogram.to_dict()}
+                for (name, label), histogram in sorted(_registry.histograms.items())
+            ],
+        }
+
+
+def to_json() -> str:
+    return json.dumps(snapshot(), indent=2, ensure_ascii=False)
+
+
+def to_prometheus(prefix: str = "monopoly") -> str:
+    def _metric(name: str) -> str:
+        return f"{prefix}_{name.replace('.', '_')}"
+
+    def _labels(label: str, **extra) -> str:
+        pairs = ([f'kind="{label}"'] if label else []) + [f'{key}="{value}"' for key, value in extra.items()]
+        return "{{{}}}".format(",".join(pairs)) if pairs else ""
+
+    lines, data = [], snapshot()
+    for name in sorted({counter["name"] for counter in data["counters"]}):
+        lines.append(f"# TYPE {_metric(name)}_total counter")
+        lines.extend(
+            f"{_metric(name)}_total{_labels(counter['label'])} {counter['value']}"
+            for counter in data["counters"]
+            if counter["name"] == name
+        )
+    for name in sorted({histogram["name"] for histogram in data["histograms"]}):
+        lines.append(f"# TYPE {_metric(name)}_seconds histogram")
+        for histogram in data["histograms"]:
+            if histogram["name"] != name:
+                continue
+            cumulative = 0
+            for bound, bucket in histogram["buckets"].items():
+                cumulative += bucket
+                lines.append(f"{_metric(name)}_seconds_bucket{_labels(histogram['label'], le=bound)} {cumulative}")
+            lines.append(f"{_metric(name)}_seconds_sum{_labels(histogram['label'])} {histogram['sum']}")
+            lines.append(f"{_metric(name)}_seconds_count{_labels(histogram['label'])} {histogram['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def dump(filepath: pathlib.PosixPath):
+    # .prom files get the Prometheus text format, anything else JSON
+    if filepath.suffix == ".prom":
+        filepath.write_text(to_prometheus(), encoding="utf-8")
+    else:
+        filepath.write_text(to_json(), encoding="utf-8")
@@ -1 +1,2 @@
 from .fixture import FixtureLoader
+from .generated import BoardSpec, GeneratedLoader
@@ -7,6 +7,7 @@ class BaseLoader(abc.ABC):
     def execute(self, **kwargs) -> Board:
         board = Board()
         self._prepare_loading(**kwargs)
+        board.fixture_hash = self.get_fixture_hash(**kwargs)
 
         # load properties
         self.load_lands(board, **kwargs)
@@ -19,6 +20,9 @@ class BaseLoader(abc.ABC):
         self.load_players(board, **kwargs)
         return board
 
+    def get_fixture_hash(self, **kwargs) -> str:
+        return ""
+
     @abc.abstractmethod
     def load_cards(self, board: Board, **kwargs):
         raise NotImplementedError
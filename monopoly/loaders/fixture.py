@@ -1,21 +1,31 @@
 import contextlib
 import csv
+import hashlib
 import random
 
 import pydantic
 
 from monopoly.constants import Area, CardType, CashType, FixturePath, SystemText
 from monopoly.models.boards import Board, BoardPlayer, BoardSpace
-from monopoly.models.equipments import cards as card_models
+from monopoly.models.equipments import Deck
+from monopoly.models.equipments.cards import CARD_CLASSES
 from monopoly.models.equipments import spaces as space_models
 from monopoly.models.equipments.players import Player
 from monopoly.models.properties.lands import Land, Ocean
+from monopoly.models.properties.queries import StockIndex, parse_filters
 from monopoly.models.properties.stocks import ETF, Stock
 
 from .base import BaseLoader
 
 
 class FixtureLoader(BaseLoader):
+    def get_fixture_hash(self) -> str:
+        digest = hashlib.sha1()
+        for path in FixturePath:
+            with open(path.value, "rb") as file:
+                digest.update(file.read())
+        return digest.hexdigest()
+
     def load_cards(self, board: Board):
         with open(FixturePath.CARDS.value, "r", encoding="utf-8") as file:
             for data in csv.DictReader(file):
@@ -23,82 +33,24 @@ class FixtureLoader(BaseLoader):
                 if data["cash_type"]:
                     data["cash_type"] = CashType[data["cash_type"]]
 
-                board.cards[data["card_type"]].append(
-                    getattr(card_models, data["cls"]).parse_obj(data),
+                if data["card_type"] not in board.cards:
+                    board.cards[data["card_type"]] = Deck(card_type=data["card_type"])
+                board.cards[data["card_type"]].add(
+                    CARD_CLASSES[data["cls"]].parse_obj(data),
+                    float(data.get("weight") or 1),
                 )
 
     def load_etfs(self, board: Board):
         with open(FixturePath.ETFS.value, "r", encoding="utf-8") as file:
-            etfs = {}
+            etfs, index = {}, StockIndex(board.stocks.values())
             for data in csv.DictReader(file):
-                key = data["id"]
-                etf = ETF.parse_obj(data)
-
-                stocks = board.stocks.values()
-                for cond in data["filters"].split(","):
-                    if not cond:
-                        continue
-
-                    with contextlib.suppress(ValueError):
-                        stocks = [
-                            stock
-                            for stock in stocks
-                            if stock.land.area == Area(cond)
-                        ]
-                        continue
-
-                    field, number = cond.split("|")
-                    reverse, number = int(number) > 0, abs(int(number))
-                    if field == "市值":
-                        stocks = sorted(
-                            stocks,
-                            key=lambda stock: stock.amount * stock.value,
-                            reverse=reverse,
-                        )[:number]
-                    elif field == "低波動":
-                        stocks = sorted(
-                            stocks,
-                            key=lambda stock: -stock.beta,
-                            reverse=reverse,
-                        )[:number]
-                    elif field == "ESG":
-                        stocks = sorted(
-                            stocks,
-                            key=lambda stock: stock.esg_ratio,
-                            reverse=reverse,
-                        )[:number]
-                    elif field == "高股息":
-                        stocks = sorted(
-                            stocks,
-                            key=lambda stock: stock.payout_ratio,
-                            reverse=reverse,
-                        )[:number]
-
-                if data["index"] == "市值":
-                    summarize = sum(stock.amount * stock.value for stock in stocks)
-                    for stock in sorted(
-                        stocks,
-                        key=lambda stock: stock.amount * stock.value,
-                        reverse=True,
-                    ):
-                        etf.constituents.append(ETF.Constituent(
-                            stock=stock,
-                            percent=stock.amount * stock.value / summarize,
-                        ))
-                elif data["index"] == "高股息":
-                    summarize = sum(stock.payout_ratio for stock in stocks)
-                    for stock in sorted(
-                        stocks,
-                        key=lambda stock: stock.payout_ratio,
-                        reverse=True,
-                    ):
-                        etf.constituents.append(ETF.Constituent(
-                            stock=stock,
-                            percent=stock.payout_ratio / summarize,
-                        ))
+                etf = ETF.parse_obj({**data, "weighting": data["index"]})
+                stocks = index.select(parse_filters(data["filters"]))
+                for stock, percent in index.weigh(stocks, data["index"]):
+                    etf.constituents.append(ETF.Constituent(stock=stock, percent=percent))
 
                 etf.reset()
-                etfs[key] = etf
+                etfs[data["id"]] = etf
             board.stocks.update(etfs)
 
     def load_lands(self, board: Board):
@@ -180,4 +132,4 @@ class FixtureLoader(BaseLoader):
                 for forward in forwards:
                     spaces[key].set_forwards(spaces[forward])
 
-            board.start_space = spaces["STARTPOINT"]
+            board.start_space, board.spaces = spaces["STARTPOINT"], spaces
@@ -0,0 +1,207 @@
+import functools
+import hashlib
+import random
+import typing
+
+from monopoly.constants import Area, CardType, CashType
+from monopoly.models.boards import Board, BoardSpace
+from monopoly.models.equipments import Deck
+from monopoly.models.equipments.cards import CARD_CLASSES, CashCard
+from monopoly.models.equipments import spaces as space_models
+from monopoly.models.properties.lands import Land, Ocean
+from monopoly.models.properties.queries import STOCK_FIELDS, StockIndex, parse_filters
+from monopoly.models.properties.stocks import ETF, Stock
+
+from .fixture import FixtureLoader
+
+# space id prefix: (space class, name, weight among the non-land spaces), the same prefixes spaces.csv uses
+SPACE_KINDS: dict[str, tuple[str, typing.Any, int]] = {
+    "CHANCE": ("CardSpace", CardType.CHANCE, 4),
+    "COMMUNITY_CHEST": ("CardSpace", CardType.COMMUNITY_CHEST, 4),
+    "EARNING": ("CashSpace", CashType.EARNING, 2),
+    "COSTING": ("CashSpace", CashType.COSTING, 2),
+    "PAUSEPLAYER": ("PausePlayerSpace", None, 1),
+    "THREEDICES": ("ThreeDicesSpace", None, 1),
+    "TRANSTARTPOINT": ("TransportStartPointSpace", None, 1),
+}
+BUILDABLE_AREAS: tuple[Area, ...] = tuple(area for area in Area if area != Area.OCEAN)
+TOLL_RATES: tuple[float, ...] = (.08, .4, 1.2, 2.8, 4.2)
+
+
+class BoardSpec(typing.NamedTuple):
+    spaces: int = 40
+    # shares of the spaces that are lands, and of those lands that are oceans
+    lands: float = .7
+    oceans: float = .1
+    # detours of branch_length spaces forking off the ring, cycles rejoin it behind their fork
+    branches: int = 1
+    cycles: int = 0
+    branch_length: int = 4
+    etfs: int = 16
+    # cash cards per deck, on top of one of every other card
+    cards: int = 8
+    seed: int = 0
+
+    @classmethod
+    def scaled(cls, spaces: int, seed: int = 0) -> "BoardSpec":
+        # the classic proportions, one detour per 50 spaces and one ETF per 20
+        return cls(spaces=spaces, branches=spaces // 50, cycles=spaces // 200, etfs=max(spaces // 20, 16), seed=seed)
+
+
+class BoardLayout(typing.NamedTuple):
+    # one kind per space, "STARTPOINT", "LAND" or a SPACE_KINDS prefix, the start point first
+    kinds: tuple[str, ...]
+    # forwards links in the order they are chained, the ring link of a fork comes first
+    links: tuple[tuple[int, int], ...]
+
+
+@functools.lru_cache(maxsize=None)
+def generate_layout(spec: BoardSpec) -> BoardLayout:
+    detours = spec.branches + spec.cycles
+    ring = spec.spaces - detours * spec.branch_length
+    if spec.branch_length < 1 or ring < 4:
+        raise ValueError(f"無法在 {spec.spaces} 格內產生 {detours} 條長度 {spec.branch_length} 的岔路")
+
+    rng = random.Random(f"{spec.seed}:layout")
+    lands = round((spec.spaces - 1) * spec.lands)
+    others = rng.choices(
+        tuple(SPACE_KINDS),
+        weights=tuple(weight for _, _, weight in SPACE_KINDS.values()),
+        k=spec.spaces - 1 - lands,
+    )
+    kinds = ["LAND"] * lands + others
+    rng.shuffle(kinds)
+
+    links = [(idx, (idx + 1) % ring) for idx in range(ring)]
+    for detour in range(detours):
+        start = ring + detour * spec.branch_length
+        fork = rng.randrange(1, ring)
+        offset = rng.randint(2, min(2 * spec.branch_length, ring - 1))
+        join = (fork - offset if detour >= spec.branches else fork + offset) % ring
+        links.append((fork, start))
+        links.extend((idx, idx + 1) for idx in range(start, start + spec.branch_length - 1))
+        links.append((start + spec.branch_length - 1, join))
+    return BoardLayout(("STARTPOINT", *kinds), tuple(links))
+
+
+class GeneratedLoader(FixtureLoader):
+    def get_fixture_hash(self, spec: BoardSpec = BoardSpec()) -> str:
+        return hashlib.sha1(repr(spec).encode()).hexdigest()
+
+    def load_cards(self, board: Board, spec: BoardSpec = BoardSpec()):
+        rng = random.Random(f"{spec.seed}:cards")
+        for card_type in CardType:
+            deck = board.cards[card_type] = Deck(card_type=card_type)
+            for cls in CARD_CLASSES.values():
+                if cls is CashCard or cls.__fields__["card_type"].default != card_type:
+                    continue
+                if "cash_type" not in cls.__fields__:
+                    deck.add(cls())
+                    continue
+                for cash_type in CashType:
+                    deck.add(cls(cash_type=cash_type))
+
+            for _ in range(spec.cards):
+                deck.add(CashCard(
+                    card_type=card_type,
+                    cash_type=rng.choice(tuple(CashType)),
+                    value=rng.randint(1, 20) * 100,
+                ))
+
+    def load_etfs(self, board: Board, spec: BoardSpec = BoardSpec()):
+        rng = random.Random(f"{spec.seed}:etfs")
+        index = StockIndex(board.stocks.values())
+        if not index.stocks:
+            return
+
+        areas = sorted({stock.land.area.value for stock in index.stocks})
+        etfs = {}
+        for idx in range(1, spec.etfs + 1):
+            fields, count = rng.sample(tuple(STOCK_FIELDS), 2), rng.randint(5, 30)
+            filters = rng.choice((
+                rng.choice(areas),
+                "+".join(rng.sample(areas, min(len(areas), 2))),
+                f"{fields[0]}|{count}",
+                f"{rng.choice(areas)},{fields[0]}|{count}",
+                f"{fields[0]}|{2 * count},{fields[1]}|-{count}",
+            ))
+            weighting = rng.choice(("市值", "高股息", "等權重"))
+            etf = ETF(
+                id=f"0{idx:04}",
+                name=f"丟比生成{idx}",
+                amount=rng.randint(1, 5),
+                expense_ratio=rng.randint(1, 5) / 10000,
+                filters=filters,
+                weighting=weighting,
+            )
+            for stock, percent in index.weigh(index.select(parse_filters(filters)), weighting):
+                etf.constituents.append(ETF.Constituent(stock=stock, percent=percent))
+
+            etf.reset()
+            etfs[etf.id] = etf
+        board.stocks.update(etfs)
+
+    def load_lands(self, board: Board, spec: BoardSpec = BoardSpec()):
+        rng = random.Random(f"{spec.seed}:lands")
+        lands = generate_layout(spec).kinds.count("LAND")
+        oceans = set(rng.sample(range(lands), round(lands * spec.oceans)))
+        buildable, built = lands - len(oceans), 0
+
+        for idx in range(lands):
+            if idx in oceans:
+                land_price = rng.randint(10, 40) * 100
+                land = Ocean(id=f"9{idx:04}", name=f"海域{idx}", land_price=land_price, tolls=(land_price,))
+                board.lands[land.id] = land
+                continue
+
+            # areas come in runs along the ring, later areas cost more like the classic board
+            rank, built = built * len(BUILDABLE_AREAS) // buildable, built + 1
+            land_price = 2000 + 300 * rank + rng.randint(0, 10) * 100
+            data = {
+                "id": f"{rank + 1}{idx:04}",
+                "name": f"地產{idx}",
+                "area": BUILDABLE_AREAS[rank],
+                "land_price": land_price,
+                "house_price": land_price // 200 * 100,
+                "tolls": tuple(int(land_price * rate) // 10 * 10 for rate in TOLL_RATES),
+                "value": land_price,
+                "amount": rng.randint(1, 5),
+                "beta": rng.randint(5, 15) / 10,
+                "esg_ratio": rng.randint(1, 9) / 10,
+                "payout_ratio": rng.randint(1, 9) / 10,
+            }
+            land, stock = Land.parse_obj(data), Stock.parse_obj(data)
+            stock.land, land.stock = land, stock
+            board.lands[land.id], board.stocks[stock.id] = land, stock
+
+    def load_players(self, board: Board, **kwargs):
+        super().load_players(board)
+
+    def load_stocks(self, board: Board, **kwargs):
+        # already drawn from the seed in load_lands, no noise from the module random
+        pass
+
+    def load_spaces(self, board: Board, spec: BoardSpec = BoardSpec()):
+        layout = generate_layout(spec)
+        lands, counts = iter(board.lands.values()), dict.fromkeys(SPACE_KINDS, 0)
+        spaces = []
+        for kind in layout.kinds:
+            if kind == "STARTPOINT":
+                space = space_models.StartPointSpace(id=kind)
+            elif kind == "LAND":
+                land = next(lands)
+                space = space_models.LandSpace(id=land.id, name=land.name, land=land)
+            else:
+                cls, name, _ = SPACE_KINDS[kind]
+                counts[kind] += 1
+                data = {"id": f"{kind}{counts[kind]:04}"}
+                if name is not None:
+                    data["name"] = name
+                space = getattr(space_models, cls).parse_obj(data)
+            spaces.append(BoardSpace(board=board, space=space))
+
+        for backward, forward in layout.links:
+            spaces[backward].set_forwards(spaces[forward])
+            spaces[forward].set_backwards(spaces[backward])
+        board.start_space = spaces[0]
+        board.spaces = {space.space.id: space for space in spaces}
@@ -1,6 +1,5 @@
-import collections
 import contextlib
-import itertools
+import os
 import pathlib
 import pickle
 import random
@@ -8,45 +7,81 @@ import typing
 
 import pydantic
 
-from monopoly.constants import CardType, DirectionAttr, StockType, SystemText
+from monopoly import instruments
+from monopoly.constants import CardType, DirectionAttr, EventType, StockType, SystemText, TaxFee
+from monopoly.events import EventBus
+from monopoly.storages import Archive, decode, encode
 
-from .equipments import BaseCard, BasePlayer, BaseSpace
-from .equipments.players import PlayerLand
+from .equipments import BasePlayer, BaseSpace, Deck
+from .equipments.players import Ownership, PlayerLand
+from .hashes import StateHash, compute_state_hash
 from .interfaces import (
     ChainableInterface, PlayerListableInterface, PlayableMenuInterface,
     PropertyListableInterface, SavableMenuInterface,
 )
 from .properties import BaseLand, BaseStock
+from .properties.queries import StockIndex
 
 
 class Board(PlayerListableInterface, PropertyListableInterface, SavableMenuInterface):
     start_player: typing.Union["BoardPlayer", None] = None
     start_space: typing.Union["BoardSpace", None] = None
+    # every space by id, a pickled space keeps its neighbours as ids into this
+    spaces: dict[str, "BoardSpace"] = pydantic.Field(default_factory=dict)
 
     lands: dict[str, BaseLand] = {}
     stocks: dict[str, BaseStock] = {}
     players: list[BasePlayer] = pydantic.Field(default_factory=list)
 
-    cards: dict[CardType, list[BaseCard]] = collections.defaultdict(list)
-    credentials: dict[str, PlayerLand] = {}
+    cards: dict[CardType, Deck] = {}
+    ownership: Ownership = pydantic.Field(default_factory=Ownership)
+    # rates the cards charge, so a simulation can tune one board without touching TaxFee
+    fees: dict[TaxFee, float] = pydantic.Field(default_factory=lambda: {fee: fee.value for fee in TaxFee})
 
     current_player: typing.Union["BoardPlayer", None] = None
     direction: DirectionAttr = DirectionAttr.FORWARDS
 
     finished: bool = False
+    fixture_hash: str = ""
+    turns: int = 0
+
+    # shared with the shallow copies spaces and players keep of the board
+    events: EventBus = pydantic.Field(default_factory=EventBus)
+    # players by name on every space they stand on, in the order they arrived
+    occupants: dict[str, dict[str, "BoardPlayer"]] = pydantic.Field(default_factory=dict)
+    # kept up to date by every move, trade, construction, payment and opening once the board starts
+    state_hash: StateHash = pydantic.Field(default_factory=StateHash)
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        super().__setstate__(state)
+        # every copy of the board shares this state, the ones unpickled before the spaces skip it
+        for space in self.__dict__.get("spaces", {}).values():
+            space.relink(self.spaces)
 
     @classmethod
     def load(cls) -> typing.Union["Board", None]:
         return cls.load_menu()
 
     @classmethod
-    def loading(cls, filepath: pathlib.PosixPath) -> typing.Union["Board", None]:
+    def loading(
+        cls,
+        filepath: pathlib.PosixPath,
+        game_id: typing.Union[str, None] = None,
+    ) -> typing.Union["Board", None]:
         try:
-            return pickle.loads(filepath.read_bytes())
-        except (EOFError, pickle.UnpicklingError):
+            if game_id is None:
+                return pickle.loads(decode(filepath.read_bytes()))
+            # only the pages holding this game are mapped, not the whole archive
+            with Archive(filepath, readonly=True) as archive:
+                return pickle.loads(decode(archive.get(game_id)))
+        # storages.decode reports damaged compressed data as ValueError, whichever codec wrote it
+        except (EOFError, KeyError, ValueError, pickle.UnpicklingError):
             print(SystemText.LOADING_FAILED.value)
         return None
 
+    def archiving(self, archive: Archive, game_id: str):
+        archive.put(game_id, encode(pickle.dumps(self), self.SAVE_CODEC))
+
     @property
     def dice(self) -> int:
         return random.randint(1, 6)
@@ -93,20 +128,9 @@ class Board(PlayerListableInterface, PropertyListableInterface, SavableMenuInter
                 except KeyError:
                     print(SystemText.PROPERTY_CODE_ERROR.value)
 
-    def delete_or_skip_credential(self, land: BaseLand):
-        with contextlib.suppress(KeyError):
-            self.credentials.pop(land.id)
-
-    def get_or_create_credential(
-        self,
-        land: BaseLand,
-        credential: typing.Union[PlayerLand, None] = None,
-    ):
-        with contextlib.suppress(KeyError):
-            return self.credentials[land.id]
-
+    def get_credential(self, land: BaseLand) -> PlayerLand:
+        credential = self.ownership.get_credential(land)
         assert credential is not None
-        self.credentials[land.id] = credential
         return credential
 
     def get_the_most_player(
@@ -125,24 +149,24 @@ class Board(PlayerListableInterface, PropertyListableInterface, SavableMenuInter
         return result
 
     def list_land_detail(self, land: BaseLand) -> tuple:
-        credential = self.credentials.get(land.id)
-
-        player = getattr(credential, "player", SystemText.UNDEFINED.value)
-        houses = getattr(credential, "houses", SystemText.UNDEFINED.value)
-        if not land.buildable:
-            houses = SystemText.UNDEFINED.value
-
-        net_worth = getattr(credential, "net_worth", SystemText.UNDEFINED.value)
-        if isinstance(net_worth, int):
-            net_worth = f"{net_worth:,}"
+        credential = self.ownership.get_credential(land)
+        if credential is None:
+            return (
+                land.id,
+                land.name,
+                f"{land.land_price:,}",
+                SystemText.UNDEFINED.value,
+                SystemText.UNDEFINED.value,
+                SystemText.UNDEFINED.value,
+            )
 
         return (
             land.id,
             land.name,
             f"{land.land_price:,}",
-            str(player),
-            houses,
-            net_worth,
+            credential.player.name,
+            credential.houses if land.buildable else SystemText.UNDEFINED.value,
+            f"{credential.net_worth:,}",
         )
 
     def list_player_detail(self, player: BasePlayer) -> tuple:
@@ -168,40 +192,73 @@ class Board(PlayerListableInterface, PropertyListableInterface, SavableMenuInter
 
     def opening_stocks(self):
         print(SystemText.OPENING_STOCKS.value)
-        for stock in itertools.chain(
-            filter(lambda stock: stock.type == StockType.STOCK, self.stocks.values()),
-            filter(lambda stock: stock.type == StockType.ETF, self.stocks.values()),
-        ):
-            stock.opening(board=self)
+        stocks = [stock for stock in self.stocks.values() if stock.type == StockType.STOCK]
+        for stock in stocks:
+            self._opening_stock(stock)
+
+        # one index for every ETF rebalancing this opening, ranked by the prices just set
+        index = StockIndex(stocks)
+        for stock in self.stocks.values():
+            if stock.type == StockType.ETF:
+                self._opening_stock(stock, index=index)
+
+    def _opening_stock(self, stock: BaseStock, **kwargs):
+        value = stock.value
+        with instruments.timer("market.tick", stock.type.value):
+            stock.opening(board=self, **kwargs)
+        self.state_hash.swap("price", stock.id, old=value, new=stock.value)
+        self.events.emit(EventType.STOCK_TICK, subject=stock, value=stock.spread)
 
     def pause(self, player: BasePlayer, value: int):
         assert self.current_player.player == player
         self.current_player.unmovable += value
 
     def reverse_direction(self):
+        direction = self.direction
         if self.direction == DirectionAttr.FORWARDS:
             self.direction = DirectionAttr.BACKWARDS
         else:
             self.direction = DirectionAttr.FORWARDS
+        self.state_hash.swap("direction", old=direction.value, new=self.direction.value)
 
     def run(self):
-        self.show()
-        if self.current_player.playable:
-            self.current_player.play()
-
-        self.current_player = getattr(self.current_player, self.direction.value)()
+        with instruments.timer("board.run", "show"):
+            self.show()
+        with instruments.timer("board.run", "play"):
+            if self.current_player.playable:
+                self.current_player.play()
+        self.turns += 1
+        instruments.count("board.turns")
+        self.events.emit(EventType.TURN_ENDED, self.current_player.player, value=self.turns)
+
+        with instruments.timer("board.run", "advance"):
+            self.current_player = getattr(self.current_player, self.direction.value)()
         if self.current_player == self.start_player:
-            self.opening_stocks()
+            with instruments.timer("board.run", "opening_stocks"):
+                self.opening_stocks()
 
-        with contextlib.suppress(AssertionError):
+        with instruments.timer("board.run", "winner"), contextlib.suppress(AssertionError):
             print(f"{self.winner} 優勝!!")
             self.finished = True
 
     def save(self):
         self.save_menu()
 
+    @property
+    def save_summary(self) -> dict[str, typing.Any]:
+        return {
+            "players": ",".join(player.name for player in self.players),
+            "turns": self.turns,
+            "fixture_hash": self.fixture_hash,
+        }
+
     def saving(self, filepath: pathlib.PosixPath):
-        filepath.write_bytes(pickle.dumps(self))
+        snapshot = encode(pickle.dumps(self), self.SAVE_CODEC)
+        # recorded before it appears, a crash in between leaves only a temp file and an entry that fails to load
+        temppath = filepath.with_name(f".{filepath.name}.tmp")
+        temppath.write_bytes(snapshot)
+        self.record_saving(filepath, temppath.stat())
+        os.replace(temppath, filepath)
 
     def set_free_tolling(self, player: BasePlayer):
         assert self.current_player.player == player
@@ -219,7 +276,11 @@ class Board(PlayerListableInterface, PropertyListableInterface, SavableMenuInter
         self.current_player = self.start_player
         for player in self.board_players:
             self.players.append(player.player)
-            player.space = self.start_space
+            player.player.state_hash = self.state_hash
+            player.set_space(self.start_space)
+        self.ownership.register(self.lands.values(), self.players)
+        self.ownership.state_hash = self.state_hash
+        self.state_hash.value = compute_state_hash(self)
 
     def take_free_tolling(self, player: BasePlayer) -> bool:
         assert self.current_player.player == player
@@ -240,7 +301,7 @@ class Board(PlayerListableInterface, PropertyListableInterface, SavableMenuInter
         as_arrive: bool = False,
     ):
         assert self.current_player.player == player
-        self.current_player.space = self.start_space
+        self.current_player.set_space(self.start_space)
         self.current_player.pass_by()
         if as_arrive:
             self.current_player.arrive()
@@ -263,7 +324,8 @@ class BoardPlayer(ChainableInterface, PlayableMenuInterface):
         return not (self.player.bankruptcy or self.player.surrender)
 
     def arrive(self):
-        self.space.space.arrive(self.player, board=self.board)
+        with instruments.timer("space.arrive", type(self.space.space).__name__):
+            self.space.space.arrive(self.player, board=self.board)
 
     def get_backwards(self) -> typing.Union["BoardPlayer", None]:
         return self.backwards
@@ -287,13 +349,14 @@ class BoardPlayer(ChainableInterface, PlayableMenuInterface):
 
             point -= next_space.space.moving_point
             if point >= 0:
-                self.space = next_space
+                self.set_space(next_space)
                 self.pass_by()
 
         self.arrive()
 
     def pass_by(self):
-        self.space.space.pass_by(self.player, board=self.board)
+        with instruments.timer("space.pass_by", type(self.space.space).__name__):
+            self.space.space.pass_by(self.player, board=self.board)
 
     def play(self):
         if self.unmovable > 0:
@@ -331,6 +394,13 @@ class BoardPlayer(ChainableInterface, PlayableMenuInterface):
     def set_forwards(self, other: "BoardPlayer"):
         self.forwards = other
 
+    def set_space(self, space: "BoardSpace"):
+        previous = self.space.space.id if self.space is not None else None
+        self.player.state_hash.swap("space", self.player.name, old=previous, new=space.space.id)
+        self.board.occupants.get(previous, {}).pop(self.player.name, None)
+        self.board.occupants.setdefault(space.space.id, {})[self.player.name] = self
+        self.space = space
+
     def __eq__(self, other: "BoardPlayer") -> bool:
         return self.player == other.player
 
@@ -348,6 +418,10 @@ class BoardSpace(ChainableInterface):
     backwards: list["BoardSpace"] = pydantic.Field(default_factory=list)
     forwards: list["BoardSpace"] = pydantic.Field(default_factory=list)
 
+    @property
+    def occupants(self) -> list[BoardPlayer]:
+        return list(self.board.occupants.get(self.space.id, {}).values())
+
     def get_backwards(self) -> typing.Union[list["BoardSpace"], "BoardSpace", None]:
         if len(self.backwards) > 1:
             return self.backwards
@@ -362,12 +436,25 @@ class BoardSpace(ChainableInterface):
             return self.forwards[0]
         return None
 
+    def relink(self, spaces: dict[str, "BoardSpace"]):
+        for links in (self.backwards, self.forwards):
+            links[:] = [spaces.get(link, link) if isinstance(link, str) else link for link in links]
+
     def set_backwards(self, other: "BoardSpace"):
         self.backwards.append(other)
 
     def set_forwards(self, other: "BoardSpace"):
         self.forwards.append(other)
 
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # pickling the neighbours in place recurses once per space along the ring
+        state, spaces = super().__getstate__(), self.board.spaces
+        links = {
+            name: [link.space.id if spaces.get(link.space.id) is link else link for link in getattr(self, name)]
+            for name in ("backwards", "forwards")
+        }
+        return {**state, "__dict__": {**state["__dict__"], **links}}
+
     def __eq__(self, other: "BoardSpace") -> bool:
         return self.space == other.space
 
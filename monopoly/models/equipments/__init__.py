@@ -1,4 +1,4 @@
-from .cards import BaseCard
+from .cards import BaseCard, Deck
 from .players import BasePlayer
 from .spaces import BaseSpace
 
@@ -1,9 +1,13 @@
 import abc
 import contextlib
+import inspect
+import random
+import typing
 
 import pydantic
 
-from monopoly.constants import CardType, CashType, SystemText, TaxFee
+from monopoly import configs
+from monopoly.constants import CardType, CashType, EventType, SystemText, TaxFee
 
 
 class BaseCard(pydantic.BaseModel, abc.ABC):
@@ -66,14 +70,14 @@ class ForeclosePropertyCard(BaseCard):
             print(SystemText.PROPERTY_CODE_ERROR.value)
             return
 
-        value = int(land.land_price * TaxFee.FORECLOSE_FEE.value)
+        value = int(land.land_price * board.fees[TaxFee.FORECLOSE_FEE])
         with contextlib.suppress(AssertionError):
-            credential = board.get_or_create_credential(land)
+            credential = board.get_credential(land)
             if not (credential.player == player and land.buildable):
                 print("此不動產不得法拍")
                 return
 
-            value = int(land.house_price * TaxFee.FORECLOSE_FEE.value)
+            value = int(land.house_price * board.fees[TaxFee.FORECLOSE_FEE])
 
         print(f"{player} 需要支付 {land} 的法拍費 ${value} 向銀行購買 (Y/N)")
         if input("> ").upper() == "Y" and player.prepare_payment(board, value):
@@ -81,13 +85,13 @@ class ForeclosePropertyCard(BaseCard):
             if not land.has_owner:
                 land.buying(player, board, is_free=True)
             else:
-                credential = board.get_or_create_credential(land)
+                credential = board.get_credential(land)
                 credential.construction(board, is_free=True)
 
             raise board.Cancelled()
 
     def execute(self, player: "BasePlayer", *, board: "Board", **kwargs):
-        print(f"{player} 抽到可向銀行購買法拍不動產!!(買入價值 {int(100 * TaxFee.FORECLOSE_FEE.value)}%)")
+        print(f"{player} 抽到可向銀行購買法拍不動產!!(買入價值 {int(100 * board.fees[TaxFee.FORECLOSE_FEE])}%)")
         with contextlib.suppress(board.Cancelled):
             while True:
                 self._execute_logic(player, board)
@@ -146,31 +150,25 @@ class ImposePropertyCard(BaseCard):
             return
 
         try:
-            credential = board.get_or_create_credential(land)
+            credential = board.get_credential(land)
             assert credential.player != player
         except AssertionError:
             print("此不動產不得徵收!!")
             return
 
         owner = credential.player
-        value = int(credential.worth * TaxFee.IMPOSE_FEE.value)
+        value = int(credential.worth * board.fees[TaxFee.IMPOSE_FEE])
         print(f"{player} 需要支付 {land} 的徵收費 ${value} 給 {owner} (Y/N)")
         if input("> ").upper() == "Y" and player.prepare_payment(board, value):
             player.pay(value)
             owner.earn(value)
-
-            # delete owner credential
-            owner.delete_or_skip_player_land(land)
-            board.delete_or_skip_credential(land)
-
-            # create player credential
-            credential = player.get_or_create_player_land(land, houses=credential.houses)
-            board.get_or_create_credential(land, credential=credential)
+            board.ownership.transfer(land, player)
+            board.events.emit(EventType.LAND_BOUGHT, player, land, value)
 
             raise board.Cancelled()
 
     def execute(self, player: "BasePlayer", *, board: "Board", **kwargs):
-        print(f"{player} 抽到可向玩家徵收不動產!!(買入總價值 {int(100 * TaxFee.IMPOSE_FEE.value)}%)")
+        print(f"{player} 抽到可向玩家徵收不動產!!(買入總價值 {int(100 * board.fees[TaxFee.IMPOSE_FEE])}%)")
         with contextlib.suppress(board.Cancelled):
             while True:
                 self._execute_logic(player, board)
@@ -188,58 +186,124 @@ class BasePayingCard(BaseCard, abc.ABC):
     card_type: CardType = CardType.COMMUNITY_CHEST
 
     name: str
-    detail: str
+    basis: str
+    fee: TaxFee
 
-    def pay(self, player: "BasePlayer", board: "Board", value: int):
-        print(f"{player} 抽到需繳交 {self.name} ${value} ({self.detail})")
+    def pay(self, player: "BasePlayer", board: "Board", worth: int):
+        rate = board.fees[self.fee]
+        value = int(worth * rate)
+        print(f"{player} 抽到需繳交 {self.name} ${value} ({self.basis} {round(100 * rate, 4):g}%)")
         player.prepare_payment(board, value, force=True)
         player.pay(value)
 
 
 class HouseTaxCard(BasePayingCard):
     name: str = "房屋稅"
-    detail: str = f"房屋價值總額 {int(100 * TaxFee.HOUSE_TAX.value)}%"
+    basis: str = "房屋價值總額"
+    fee: TaxFee = TaxFee.HOUSE_TAX
 
     def execute(self, player: "BasePlayer", *, board: "Board", **kwargs):
-        self.pay(
-            player,
-            board,
-            int(player.house_worth * TaxFee.HOUSE_TAX.value),
-        )
+        self.pay(player, board, player.house_worth)
 
 
 class IncomeTaxCard(BasePayingCard):
     name: str = "所得稅"
-    detail: str = f"累積所得總額 {int(100 * TaxFee.INCOMING_TAX.value)}%"
+    basis: str = "累積所得總額"
+    fee: TaxFee = TaxFee.INCOMING_TAX
 
     def execute(self, player: "BasePlayer", *, board: "Board", **kwargs):
-        self.pay(
-            player,
-            board,
-            int(player.incoming * TaxFee.INCOMING_TAX.value),
-        )
+        self.pay(player, board, player.incoming)
         player.incoming = 0
 
 
 class LandValueTaxCard(BasePayingCard):
     name: str = "地價稅"
-    detail: str = f"土地價值總額 {int(100 * TaxFee.LAND_VALUE_TAX.value)}%"
+    basis: str = "土地價值總額"
+    fee: TaxFee = TaxFee.LAND_VALUE_TAX
 
     def execute(self, player: "BasePlayer", *, board: "Board", **kwargs):
-        self.pay(
-            player,
-            board,
-            int(player.land_worth * TaxFee.LAND_VALUE_TAX.value),
-        )
+        self.pay(player, board, player.land_worth)
 
 
 class StockHandlingFeeCard(BasePayingCard):
     name: str = "股票交易手續費"
-    detail: str = f"股票總額 {round(100 * TaxFee.STOCK_HANDLING_FEE.value, 4)}%"
+    basis: str = "股票總額"
+    fee: TaxFee = TaxFee.STOCK_HANDLING_FEE
 
     def execute(self, player: "BasePlayer", *, board: "Board", **kwargs):
-        self.pay(
-            player,
-            board,
-            int(player.stock_worth * TaxFee.STOCK_HANDLING_FEE.value),
-        )
+        self.pay(player, board, player.stock_worth)
+
+
+# resolved once here instead of a getattr per fixture row
+CARD_CLASSES: dict[str, type[BaseCard]] = {
+    name: value
+    for name, value in tuple(globals().items())
+    if inspect.isclass(value) and issubclass(value, BaseCard) and not inspect.isabstract(value)
+}
+
+
+class Deck(pydantic.BaseModel):
+    # once any two cards weigh differently every draw puts the card back, whatever replacement says
+    card_type: CardType
+    cards: list[BaseCard] = pydantic.Field(default_factory=list)
+    weights: list[float] = pydantic.Field(default_factory=list)
+    counts: list[int] = pydantic.Field(default_factory=list)
+    replacement: bool = configs.CARD_DRAWING_REPLACEMENT
+
+    # indexes left in the shuffled pile, drawn from the end
+    _pile: list[int] = pydantic.PrivateAttr(default_factory=list)
+    # Vose's alias tables, rebuilt lazily after the weights change
+    _alias: typing.Union[tuple[list[float], list[int]], None] = pydantic.PrivateAttr(None)
+    _weighted: bool = pydantic.PrivateAttr(False)
+
+    @property
+    def weighted(self) -> bool:
+        return self._weighted
+
+    def add(self, card: BaseCard, weight: float = 1.):
+        assert weight > 0
+        self.cards.append(card)
+        self.weights.append(weight)
+        self.counts.append(0)
+        self._pile.clear()
+        self._alias = None
+        self._weighted = self._weighted or weight != self.weights[0]
+
+    def draw(self, rng: typing.Union[random.Random, None] = None) -> BaseCard:
+        # the module random by default, so seeding it keeps games reproducible
+        rng = random if rng is None else rng
+        if self.weighted:
+            index = self._draw_weighted(rng)
+        elif self.replacement:
+            index = rng.randrange(len(self.cards))
+        else:
+            if not self._pile:
+                self._pile.extend(range(len(self.cards)))
+                rng.shuffle(self._pile)
+            index = self._pile.pop()
+
+        self.counts[index] += 1
+        return self.cards[index]
+
+    def _build_alias(self) -> tuple[list[float], list[int]]:
+        size, total = len(self.weights), sum(self.weights)
+        scaled = [weight * size / total for weight in self.weights]
+        probabilities, aliases = [1.] * size, list(range(size))
+        small = [index for index, value in enumerate(scaled) if value < 1]
+        large = [index for index, value in enumerate(scaled) if value >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probabilities[less], aliases[less] = scaled[less], more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        return probabilities, aliases
+
+    def _draw_weighted(self, rng: random.Random) -> int:
+        if self._alias is None:
+            self._alias = self._build_alias()
+        probabilities, aliases = self._alias
+        index = rng.randrange(len(probabilities))
+        return index if rng.random() < probabilities[index] else aliases[index]
+
+    def __len__(self) -> int:
+        return len(self.cards)
@@ -1,12 +1,16 @@
 import abc
+import array
+import collections
 import contextlib
 import itertools
+import typing
 
 import pydantic
 
 from monopoly import configs
-from monopoly.constants import Area, SystemText
+from monopoly.constants import Area, EventType, SystemText
 
+from ..hashes import StateHash
 from ..interfaces import (
     BuildableMenuInterface, PropertyListableInterface,
     PropertyTradingOffMenuInterface, ShowableModelInterface,
@@ -22,8 +26,11 @@ class BasePlayer(ShowableModelInterface, PropertyListableInterface, abc.ABC):
     bankruptcy: bool = False
     surrender: bool = False
 
+    # once seated, the very dict its seat holds in the board ownership
     lands: dict[str, "PlayerLand"] = {}
     stocks: dict[str, "PlayerStock"] = {}
+    # once seated, the hash of the board it sits at
+    state_hash: StateHash = pydantic.Field(default_factory=StateHash)
 
     @property
     def house_worth(self) -> int:
@@ -58,6 +65,7 @@ class BasePlayer(ShowableModelInterface, PropertyListableInterface, abc.ABC):
                 stock.stock.selling(self, board, silent=True)
 
         self.bankruptcy = True
+        board.events.emit(EventType.BANKRUPTCY, self)
         print(f"{self} 宣告破產!!")
 
     def count_area_lands(self, area: Area) -> int:
@@ -66,33 +74,17 @@ class BasePlayer(ShowableModelInterface, PropertyListableInterface, abc.ABC):
             self.lands.values(),
         )))
 
-    def delete_or_skip_player_land(self, land: BaseLand):
-        with contextlib.suppress(KeyError):
-            self.lands.pop(land.id)
-
     def delete_or_skip_player_stock(self, stock: BaseStock):
         with contextlib.suppress(KeyError):
             self.stocks.pop(stock.id)
 
     def earn(self, value: int, income_tax_free: bool = False):
+        bucket = self.cash // configs.STATE_HASH_CASH_BUCKET
         self.cash += value
+        self.state_hash.swap("cash", self.name, old=bucket, new=self.cash // configs.STATE_HASH_CASH_BUCKET)
         if not income_tax_free:
             self.incoming += value
 
-    def get_or_create_player_land(
-        self,
-        land: BaseLand,
-        *,
-        houses: int = 0,
-    ) -> "PlayerLand":
-        with contextlib.suppress(KeyError):
-            return self.lands[land.id]
-
-        self.lands[land.id] = PlayerLand(
-            player=self, land=land, houses=houses,
-        )
-        return self.lands[land.id]
-
     def get_or_create_player_stock(
         self,
         stock: BaseStock,
@@ -132,7 +124,9 @@ class BasePlayer(ShowableModelInterface, PropertyListableInterface, abc.ABC):
         )
 
     def pay(self, value: int):
+        bucket = self.cash // configs.STATE_HASH_CASH_BUCKET
         self.cash -= value
+        self.state_hash.swap("cash", self.name, old=bucket, new=self.cash // configs.STATE_HASH_CASH_BUCKET)
 
     def prepare_payment(
         self,
@@ -240,10 +234,106 @@ class Player(BasePlayer, PropertyTradingOffMenuInterface):
                     print(SystemText.PROPERTY_CODE_ERROR.value)
 
 
+class Holding(typing.NamedTuple):
+    # a seat's lands in the order they were acquired and how many of each area
+    credentials: dict[str, "PlayerLand"]
+    areas: collections.Counter
+
+
+class Ownership:
+    # every land has a slot in fixture order and every player a seat in turn order, the bank owns seat -1
+    def __init__(self):
+        self.ordinals: dict[str, int] = {}
+        self.lands: list[BaseLand] = []
+        self.owners = array.array("h")
+        self.houses = array.array("b")
+
+        self.seats: dict[str, int] = {}
+        self.holdings: list[Holding] = []
+        # once the board starts, its hash
+        self.state_hash = StateHash()
+
+    @classmethod
+    def __get_validators__(cls) -> typing.Generator[typing.Callable, None, None]:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: typing.Any) -> "Ownership":
+        if not isinstance(value, cls):
+            raise TypeError(f"{value!r} is not an Ownership")
+        return value
+
+    @property
+    def credentials(self) -> typing.Generator["PlayerLand", None, None]:
+        for holding in self.holdings:
+            yield from holding.credentials.values()
+
+    def get_credential(self, land: BaseLand) -> typing.Union["PlayerLand", None]:
+        seat = self.owners[self.ordinals[land.id]]
+        return self.holdings[seat].credentials[land.id] if seat >= 0 else None
+
+    def get_houses(self, land: BaseLand) -> int:
+        return self.houses[self.ordinals[land.id]]
+
+    def get_owner(self, land: BaseLand) -> typing.Union[BasePlayer, None]:
+        credential = self.get_credential(land)
+        return credential.player if credential is not None else None
+
+    def register(self, lands: typing.Iterable[BaseLand], players: typing.Iterable[BasePlayer]):
+        for land in lands:
+            if land.id not in self.ordinals:
+                self.ordinals[land.id] = len(self.lands)
+                self.lands.append(land)
+                self.owners.append(-1)
+                self.houses.append(0)
+
+        for player in players:
+            if player.name not in self.seats:
+                self.seats[player.name] = len(self.holdings)
+                self.holdings.append(Holding({}, collections.Counter()))
+            player.lands = self.holdings[self.seats[player.name]].credentials
+
+    def set_houses(self, land: BaseLand, houses: int):
+        assert 0 <= houses <= configs.BUILDING_UPPERBOUND
+        ordinal = self.ordinals[land.id]
+        self.state_hash.swap("houses", land.id, old=self.houses[ordinal], new=houses)
+        self.houses[ordinal] = houses
+
+    def transfer(self, land: BaseLand, player: typing.Union[BasePlayer, None]) -> typing.Union["PlayerLand", None]:
+        # houses stay with the land between players and are gone once the bank has it back
+        ordinal = self.ordinals[land.id]
+        if (previous := self.owners[ordinal]) >= 0:
+            self.holdings[previous].credentials.pop(land.id)
+            self.holdings[previous].areas[land.area] -= 1
+
+        seat = -1 if player is None else self.seats[player.name]
+        self.state_hash.swap("owner", land.id, old=previous, new=seat)
+        self.owners[ordinal], land.has_owner = seat, player is not None
+        if player is None:
+            self.set_houses(land, 0)
+            return None
+
+        credential = PlayerLand(ownership=self, ordinal=ordinal, seat=seat, player=player)
+        self.holdings[seat].credentials[land.id] = credential
+        self.holdings[seat].areas[land.area] += 1
+        return credential
+
+
 class PlayerLand(BuildableMenuInterface):
+    # a view of one holding, a land changing hands gets a new one while this keeps its player and tolls
+    ownership: Ownership
+    ordinal: int
+    seat: int
     player: BasePlayer
-    land: BaseLand
-    houses: int = pydantic.Field(0, ge=0, le=configs.BUILDING_UPPERBOUND)
+    tolls: int = 0
+
+    @property
+    def houses(self) -> int:
+        return self.ownership.houses[self.ordinal]
+
+    @property
+    def land(self) -> BaseLand:
+        return self.ownership.lands[self.ordinal]
 
     @property
     def house_worth(self) -> int:
@@ -268,7 +358,7 @@ class PlayerLand(BuildableMenuInterface):
     @property
     def tolling_value(self) -> int:
         base_value = self.land.tolls[self.houses]
-        area_count = self.player.count_area_lands(self.land.area)
+        area_count = self.ownership.holdings[self.seat].areas[self.land.area]
         addition_rate = (area_count - 1) * configs.AREA_ADDITION_RATE
         return int(base_value * (1 + addition_rate))
 
@@ -289,13 +379,14 @@ class PlayerLand(BuildableMenuInterface):
                 return
 
             try:
-                assert board.get_or_create_credential(self.land).player == self.player
+                assert board.get_credential(self.land).player == self.player
                 self.player.pay(self.land.house_price)
             except AssertionError as error:
                 raise self.Cancelled() from error
 
         self.land.stock.earn(self.land.house_price)
-        self.houses += 1
+        self.ownership.set_houses(self.land, self.houses + 1)
+        board.events.emit(EventType.HOUSE_BUILT, self.player, self.land, 0 if is_free else self.land.house_price)
         print(SystemText.CONSTRUCTION_SUCCESS.value)
         if not configs.UNLIMITED_BUILDING:
             raise self.Cancelled()
@@ -306,11 +397,12 @@ class PlayerLand(BuildableMenuInterface):
             while self.houses > 0:
                 self.demolish_menu(self.player, board)
 
-    def demolition(self, *args, silent: bool = False):
+    def demolition(self, board: "Board", *args, silent: bool = False):
         assert self.land.buildable and self.houses > 0
         self.player.earn(self.sale_value, income_tax_free=True)
         self.land.stock.pay(self.sale_value)
-        self.houses -= 1
+        self.ownership.set_houses(self.land, self.houses - 1)
+        board.events.emit(EventType.HOUSE_DEMOLISHED, self.player, self.land, self.sale_value)
         if not silent:
             print(SystemText.DEMOLITION_SUCCESS.value)
 
@@ -330,6 +422,8 @@ class PlayerLand(BuildableMenuInterface):
         player.prepare_payment(board, value, force=True)
         player.pay(value)
         self.player.earn(value)
+        self.tolls += value
+        board.events.emit(EventType.TOLL_PAID, player, self.land, value)
         if self.land.buildable:
             self.land.stock.earn(value)
 
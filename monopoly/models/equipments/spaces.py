@@ -1,10 +1,9 @@
 import abc
-import random
 
 import pydantic
 
-from monopoly import configs
-from monopoly.constants import CardType, CashType, SystemText
+from monopoly import configs, instruments
+from monopoly.constants import CardType, CashType, EventType, SystemText
 
 from ..properties import BaseLand
 
@@ -38,7 +37,10 @@ class CardSpace(BaseSpace):
     def arrive(self, player: "BasePlayer", *, board: "Board", **kwargs):
         print(f"{player} 抽取 {self.name.value} 一張")
         input(SystemText.PRESS_ENTER_TO_CONTINUE.value)
-        random.choice(board.cards[self.name]).execute(player, board=board)
+        card = board.cards[self.name].draw()
+        board.events.emit(EventType.CARD_DRAWN, player, card)
+        with instruments.timer("card.execute", type(card).__name__):
+            card.execute(player, board=board)
         input(SystemText.PRESS_ENTER_TO_CONTINUE.value)
 
     def pass_by(self, player: "BasePlayer", **kwargs):
@@ -70,7 +72,7 @@ class LandSpace(BaseSpace):
             self.land.buy(player, board)
             return
 
-        credential = board.get_or_create_credential(self.land)
+        credential = board.get_credential(self.land)
         if credential.player != player:
             credential.tolling(player, board)
             return
@@ -0,0 +1,53 @@
+import functools
+import hashlib
+import typing
+
+from monopoly import configs
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def state_key(*parts: typing.Hashable) -> int:
+    # the same 64 bits in every process, unlike hash() of a str
+    return int.from_bytes(hashlib.blake2b(repr(parts).encode(), digest_size=8).digest(), "little")
+
+
+class StateHash:
+    # zobrist hashing, every piece of state xors in the key of its current value
+    def __init__(self, value: int = 0):
+        self.value = value
+
+    @classmethod
+    def __get_validators__(cls) -> typing.Generator[typing.Callable, None, None]:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: typing.Any) -> "StateHash":
+        if not isinstance(value, cls):
+            raise TypeError(f"{value!r} is not a StateHash")
+        return value
+
+    def swap(self, *parts: typing.Hashable, old: typing.Hashable, new: typing.Hashable):
+        if old != new:
+            self.value ^= state_key(*parts, old) ^ state_key(*parts, new)
+
+    def toggle(self, *parts: typing.Hashable):
+        self.value ^= state_key(*parts)
+
+    def __repr__(self) -> str:
+        return f"StateHash({self.value:016x})"
+
+
+def compute_state_hash(board: "Board") -> int:
+    # from scratch, what the running hash of a started board must always equal
+    state_hash = StateHash()
+    state_hash.toggle("direction", board.direction.value)
+    for player in board.board_players:
+        space = player.space.space.id if player.space is not None else None
+        state_hash.toggle("space", player.player.name, space)
+        state_hash.toggle("cash", player.player.name, player.player.cash // configs.STATE_HASH_CASH_BUCKET)
+    for land_id, ordinal in board.ownership.ordinals.items():
+        state_hash.toggle("owner", land_id, board.ownership.owners[ordinal])
+        state_hash.toggle("houses", land_id, board.ownership.houses[ordinal])
+    for stock in board.stocks.values():
+        state_hash.toggle("price", stock.id, stock.value)
+    return state_hash.value
@@ -1,11 +1,57 @@
 import abc
+import functools
+import sys
 import typing
 
 import pydantic
 
 from monopoly.constants import SystemText
 
-from .models import BaseViewableModelInterface, CancelableModelInterface
+from .models import BaseViewableModelInterface, CancelableModelInterface, wide_length
+
+
+@functools.lru_cache(maxsize=4096)
+def render_column(column: str, width: int) -> str:
+    return f"{column:^{width - wide_length(column)}}"
+
+
+@functools.lru_cache(maxsize=1024)
+def render_columns(columns: tuple[str, ...], width: int) -> str:
+    return "|".join(render_column(column, width) for column in columns)
+
+
+def render_row(columns: typing.Iterable, width: int, static: int = 0) -> str:
+    columns = tuple(map(str, columns))
+    rendered = [render_column(column, width) for column in columns[static:]]
+    if static > 0:
+        # leading static columns (id, name, price...) are pre-rendered once per row
+        rendered.insert(0, render_columns(columns[:static], width))
+    return "|{}|".format("|".join(rendered))
+
+
+class TableRenderer:
+    def __init__(self, headers: tuple, width: int, static: int = 0):
+        self.width = width
+        self.static = static
+        self.divider = "+{}+".format("+".join("-" * width for _ in headers))
+        self.header = "|{}|".format(render_columns(tuple(map(str, headers)), width))
+
+    def render(self, rows: typing.Iterable[tuple]) -> str:
+        return "\n".join((
+            self.divider,
+            self.header,
+            self.divider,
+            *map(self.render_row, rows),
+            self.divider,
+        ))
+
+    def render_row(self, columns: typing.Iterable) -> str:
+        return render_row(columns, self.width, self.static)
+
+
+@functools.lru_cache(maxsize=None)
+def get_table_renderer(headers: tuple, width: int, static: int = 0) -> TableRenderer:
+    return TableRenderer(headers, width, static)
 
 
 class BaseListableInterface(BaseViewableModelInterface, CancelableModelInterface, abc.ABC):
@@ -19,14 +65,16 @@ class BaseListableInterface(BaseViewableModelInterface, CancelableModelInterface
             raise self.Cancelled()
         return command
 
-    def list_columns(self, columns: typing.Iterable):
-        print("|{}|".format("|".join(
-            f"{column:^{self._column_width - self.chinese_length(column)}}"
-            for column in columns
-        )))
+    def list_columns(self, columns: typing.Iterable, static: int = 0):
+        print(render_row(columns, self._column_width, static))
 
     def list_divider(self, headers: tuple):
-        print("+{}+".format("+".join("-" * self._column_width for _ in headers)))
+        print(get_table_renderer(headers, self._column_width).divider)
+
+    def list_table(self, headers: tuple, rows: typing.Iterable[tuple], static: int = 0):
+        # emit the whole table in a single write, each print is a round trip on remote terminals
+        table = get_table_renderer(headers, self._column_width, static).render(rows)
+        sys.stdout.write(f"{table}\n")
 
 
 class PlayerListableInterface(BaseListableInterface, abc.ABC):
@@ -41,12 +89,11 @@ class PlayerListableInterface(BaseListableInterface, abc.ABC):
         return ("名稱", "存款", "不動產", "股票", "淨值", "破產", "投降")
 
     def list_players(self):
-        self.list_divider(self.list_player_header)
-        self.list_columns(self.list_player_header)
-        self.list_divider(self.list_player_header)
-        for player in self.players:
-            self.list_columns(self.list_player_detail(player))
-        self.list_divider(self.list_player_header)
+        self.list_table(
+            self.list_player_header,
+            map(self.list_player_detail, self.players),
+            static=1,
+        )
 
 
 class PropertyListableInterface(BaseListableInterface, abc.ABC):
@@ -62,12 +109,11 @@ class PropertyListableInterface(BaseListableInterface, abc.ABC):
         return ("代碼", "名稱", "價格", "擁有者", "建數", "淨值")
 
     def list_lands(self):
-        self.list_divider(self.list_land_header)
-        self.list_columns(self.list_land_header)
-        self.list_divider(self.list_land_header)
-        for land in self.lands.values():
-            self.list_columns(self.list_land_detail(land))
-        self.list_divider(self.list_land_header)
+        self.list_table(
+            self.list_land_header,
+            map(self.list_land_detail, self.lands.values()),
+            static=3,
+        )
 
     @abc.abstractmethod
     def list_stock_detail(self, stock: typing.Any) -> tuple:
@@ -78,9 +124,8 @@ class PropertyListableInterface(BaseListableInterface, abc.ABC):
         return ("代碼", "名稱", "價格", "張數", "淨值", "損益")
 
     def list_stocks(self):
-        self.list_divider(self.list_stock_header)
-        self.list_columns(self.list_stock_header)
-        self.list_divider(self.list_stock_header)
-        for stock in self.stocks.values():
-            self.list_columns(self.list_stock_detail(stock))
-        self.list_divider(self.list_stock_header)
+        self.list_table(
+            self.list_stock_header,
+            map(self.list_stock_detail, self.stocks.values()),
+            static=2,
+        )
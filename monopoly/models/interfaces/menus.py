@@ -1,14 +1,19 @@
 import abc
 import contextlib
+import os
 import pathlib
 import time
 import typing
 
 from monopoly import configs
 from monopoly.constants import BASE_DIR, SystemText
+from monopoly.storages import SaveCatalog, SaveEntry
 
 from .models import CancelableModelInterface, ShowableModelInterface
 
+# one catalog a save folder for the whole process, opened again only when its file is gone
+_catalogs: dict[pathlib.PosixPath, SaveCatalog] = {}
+
 
 class BaseMenuInterface(CancelableModelInterface, abc.ABC):
     pass
@@ -205,12 +210,59 @@ class PropertyTradingOffMenuInterface(BaseMenuInterface, abc.ABC):
 
 
 class SavableMenuInterface(BaseMenuInterface, abc.ABC):
+    SAVE_CATALOG: typing.ClassVar[str] = configs.GAME_SAVE_CATALOG
+    SAVE_CODEC: typing.ClassVar[str] = configs.GAME_SAVE_CODEC
     SAVE_FOLDER: typing.ClassVar[str] = configs.GAME_SAVE_FOLDER
+    SAVE_PAGE_SIZE: typing.ClassVar[int] = configs.GAME_SAVE_PAGE_SIZE
     SAVE_SUFFIX: typing.ClassVar[str] = configs.GAME_SAVE_SUFFIX
 
+    @classmethod
+    def get_save_catalog(cls) -> SaveCatalog:
+        filepath = cls.get_save_folder() / cls.SAVE_CATALOG
+        catalog = _catalogs.get(filepath)
+        if catalog is None or not filepath.exists():
+            catalog = _catalogs[filepath] = SaveCatalog(filepath)
+            # saves written before the catalog existed, every later save is recorded before it appears
+            if catalog.created:
+                cls.repair_save_catalog()
+        return catalog
+
+    @classmethod
+    def get_save_folder(cls) -> pathlib.PosixPath:
+        return BASE_DIR / cls.SAVE_FOLDER
+
+    @classmethod
+    def repair_save_catalog(cls) -> int:
+        return cls.get_save_catalog().reconcile(cls.get_save_folder().glob(f"*{cls.SAVE_SUFFIX}"))
+
+    @classmethod
+    def _choose_saved_file(cls) -> str:
+        prefix, page = "", 0
+        while True:
+            saved_files: tuple = tuple(cls._get_saved_files(prefix, page))
+            if saved_files:
+                print("已儲存的檔案名稱:")
+                for idx, file in enumerate(saved_files, page * cls.SAVE_PAGE_SIZE + 1):
+                    print(f"[{idx:02}] {file}")
+            print(SystemText.SAVED_FILES_PAGING.value)
+
+            command: str = input("> ")
+            if command == ">":
+                last_page = max(cls.get_save_catalog().count(prefix) - 1, 0) // cls.SAVE_PAGE_SIZE
+                page = min(page + 1, last_page)
+            elif command == "<":
+                page = max(page - 1, 0)
+            elif command.startswith("?"):
+                prefix, page = command[1:], 0
+            elif command == "!":
+                cls.repair_save_catalog()
+                page = 0
+            else:
+                return command
+
     @classmethod
     def _ensure_save_folder(cls, filename: str) -> pathlib.PosixPath:
-        savepath: pathlib.PosixPath = BASE_DIR / cls.SAVE_FOLDER
+        savepath: pathlib.PosixPath = cls.get_save_folder()
         with contextlib.suppress(FileExistsError):
             savepath.mkdir()
 
@@ -226,8 +278,8 @@ class SavableMenuInterface(BaseMenuInterface, abc.ABC):
         return filename
 
     @classmethod
-    def _get_saved_files(cls) -> typing.Generator[pathlib.PosixPath, None, None]:
-        return (BASE_DIR / cls.SAVE_FOLDER).glob(f"*{cls.SAVE_SUFFIX}")
+    def _get_saved_files(cls, prefix: str = "", page: int = 0) -> list[SaveEntry]:
+        return cls.get_save_catalog().search(prefix, page, cls.SAVE_PAGE_SIZE)
 
     @classmethod
     @abc.abstractmethod
@@ -237,11 +289,8 @@ class SavableMenuInterface(BaseMenuInterface, abc.ABC):
     @classmethod
     def load_menu(cls, *args, **kwargs):
         print("請輸入加載的檔案名稱")
-        for idx, file in enumerate(cls._get_saved_files(), 1):
-            print(f"[{idx:02}] {file.name}")
-
         try:
-            filename: str = cls._ensure_suffix(input("> "))
+            filename: str = cls._ensure_suffix(cls._choose_saved_file())
             return cls.loading(cls._ensure_save_folder(filename), *args, **kwargs)
         except FileNotFoundError:
             print(SystemText.FILENAME_ERROR.value)
@@ -252,20 +301,28 @@ class SavableMenuInterface(BaseMenuInterface, abc.ABC):
         filename = self._ensure_save_folder(self._ensure_suffix(filename))
         self.saving(filename, *args, **kwargs)
 
+    def record_saving(self, filepath: pathlib.PosixPath, stat: os.stat_result):
+        # the written file's mtime survives the rename, so a later repair finds the entry up to date
+        self.get_save_catalog().record(SaveEntry(
+            name=filepath.name,
+            saved_at=stat.st_mtime,
+            size=stat.st_size,
+            **self.save_summary,
+        ))
+
+    @property
+    @abc.abstractmethod
+    def save_summary(self) -> dict[str, typing.Any]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def saving(self, filepath: pathlib.PosixPath, *args, **kwargs):
         raise NotImplementedError
 
     def save_menu(self, *args, **kwargs):
         print("請輸入儲存的檔案名稱")
-        saved_files: tuple = tuple(self._get_saved_files())
-        if saved_files:
-            print("已儲存的檔案名稱:")
-            for idx, file in enumerate(saved_files, 1):
-                print(f"[{idx:02}] {file.name}")
-
         try:
-            filename: str = self._ensure_suffix(input("> "))
+            filename: str = self._ensure_suffix(self._choose_saved_file())
             self.saving(self._ensure_save_folder(filename), *args, **kwargs)
         except FileNotFoundError:
             print(SystemText.FILENAME_ERROR.value)
@@ -1,9 +1,36 @@
 import abc
+import functools
 import re
 import typing
 
 import pydantic
 
+# CJK, full-width forms and pictographs (e.g. 🏠) take two terminal cells
+WIDE_CHARACTERS: str = (
+    r"["
+    r"\u1100-\u115f\u2e80-\u303e\u3041-\u33ff\u3400-\u4dbf\u4e00-\u9fff"
+    r"\ua000-\ua4cf\uac00-\ud7a3\uf900-\ufaff\ufe30-\ufe4f\uff00-\uff60\uffe0-\uffe6"
+    r"\U0001f300-\U0001f64f\U0001f900-\U0001f9ff\U00020000-\U0003fffd"
+    r"]"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def wide_character_re() -> re.Pattern:
+    # compiling the ranges takes longer than importing the module, so only the first wide text pays it
+    return re.compile(WIDE_CHARACTERS)
+
+
+@functools.lru_cache(maxsize=4096)
+def wide_length(text: str) -> int:
+    if text.isascii():
+        return 0
+    return len(wide_character_re().findall(text))
+
+
+def display_width(text: str) -> int:
+    return len(text) + wide_length(text)
+
 
 class BaseModelInterface(pydantic.BaseModel, abc.ABC):
     pass
@@ -40,10 +67,8 @@ class ChainableInterface(BaseModelInterface, abc.ABC):
 
 
 class BaseViewableModelInterface(BaseModelInterface, abc.ABC):
-    CHINESE_RE: str = r"[\u4e00-\u9fff]"
-
     def chinese_length(self, data: typing.Any) -> int:
-        return len(re.findall(self.CHINESE_RE, str(data)))
+        return wide_length(str(data))
 
 
 class ShowableModelInterface(BaseViewableModelInterface, abc.ABC):
@@ -5,7 +5,7 @@ import typing
 import pydantic
 
 from monopoly import configs
-from monopoly.constants import Area, SystemText
+from monopoly.constants import Area, EventType, SystemText
 
 from ..interfaces import TradableMenuInterface
 
@@ -49,14 +49,13 @@ class BaseLand(TradableMenuInterface, abc.ABC):
 
             player.pay(self.land_price)
 
-        credential = player.get_or_create_player_land(self)
-        board.get_or_create_credential(self, credential=credential)
-        self.has_owner = True
+        board.ownership.transfer(self, player)
+        board.events.emit(EventType.LAND_BOUGHT, player, self, 0 if is_free else self.land_price)
         print(SystemText.BUYING_SUCCESS.value)
 
     def sell(self, player: "BasePlayer", board: "Board"):
         with contextlib.suppress(self.Cancelled):
-            while self.has_owner and board.get_or_create_credential(self).player == player:
+            while self.has_owner and board.get_credential(self).player == player:
                 self.sell_menu(player, board)
 
     def selling(
@@ -66,11 +65,10 @@ class BaseLand(TradableMenuInterface, abc.ABC):
         *,
         silent: bool = False,
     ):
-        assert board.get_or_create_credential(self).player == player
+        assert board.get_credential(self).player == player
         player.earn(self.sale_value, income_tax_free=True)
-        player.delete_or_skip_player_land(self)
-        board.delete_or_skip_credential(self)
-        self.has_owner = False
+        board.ownership.transfer(self, None)
+        board.events.emit(EventType.LAND_SOLD, player, self, self.sale_value)
         if not silent:
             print(SystemText.SELLING_SUCCESS.value)
 
@@ -128,7 +126,7 @@ class Land(BaseLand):
             with contextlib.suppress(AttributeError):
                 self.stock.earn(self.land_price)
             if configs.UNLIMITED_BUILDING and not is_free:
-                board.get_or_create_credential(self).construct(board)
+                board.get_credential(self).construct(board)
 
     def selling(
         self,
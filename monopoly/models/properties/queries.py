@@ -0,0 +1,97 @@
+import functools
+import itertools
+import typing
+
+from monopoly.constants import Area
+
+# ranking keys, larger is "more" of the field
+STOCK_FIELDS: dict[str, typing.Callable[["Stock"], float]] = {
+    "市值": lambda stock: stock.amount * stock.value,
+    "低波動": lambda stock: -stock.beta,
+    "ESG": lambda stock: stock.esg_ratio,
+    "高股息": lambda stock: stock.payout_ratio,
+    "股價": lambda stock: stock.value,
+}
+# weighting schemes, an unknown field weighs by the field itself
+STOCK_WEIGHTINGS: dict[str, typing.Callable[["Stock"], float]] = {
+    **STOCK_FIELDS,
+    "等權重": lambda stock: 1.,
+}
+
+
+class AreaClause(typing.NamedTuple):
+    areas: frozenset[Area]
+
+    def apply(self, index: "StockIndex", positions: list[int]) -> list[int]:
+        return [position for position in positions if index.stocks[position].land.area in self.areas]
+
+
+class RankClause(typing.NamedTuple):
+    field: str
+    count: int
+    descending: bool
+
+    def apply(self, index: "StockIndex", positions: list[int]) -> list[int]:
+        return index.rank(positions, self.field, self.descending)[:self.count]
+
+
+Clause = typing.Union[AreaClause, RankClause]
+
+
+@functools.lru_cache(maxsize=None)
+def parse_filters(text: str) -> tuple[Clause, ...]:
+    # "GREEN+BLUE,市值|10,高股息|-5": areas, then the 10 largest, then the 5 lowest yields of those
+    clauses: list[Clause] = []
+    for cond in filter(None, text.split(",")):
+        if "|" not in cond:
+            clauses.append(AreaClause(frozenset(Area(area) for area in cond.split("+"))))
+            continue
+
+        field, number = cond.split("|")
+        if field not in STOCK_FIELDS:
+            raise ValueError(f"未知的篩選欄位: {field}")
+        clauses.append(RankClause(field, abs(int(number)), int(number) > 0))
+    return tuple(clauses)
+
+
+class StockIndex:
+    def __init__(self, stocks: typing.Iterable["Stock"]):
+        self.stocks = list(stocks)
+        self._ranks: dict[str, list[int]] = {}
+
+    def ranks(self, field: str) -> list[int]:
+        # dense rank of every stock by the field, equal keys share a rank, built once per field
+        if field not in self._ranks:
+            key = STOCK_WEIGHTINGS[field]
+            ordered = sorted(range(len(self.stocks)), key=lambda position: key(self.stocks[position]))
+            ranks = [0] * len(self.stocks)
+            for rank, (_, group) in enumerate(itertools.groupby(
+                ordered, key=lambda position: key(self.stocks[position]),
+            )):
+                for position in group:
+                    ranks[position] = rank
+            self._ranks[field] = ranks
+        return self._ranks[field]
+
+    def rank(self, positions: list[int], field: str, descending: bool = True) -> list[int]:
+        # a stable sort on integer ranks, ties keep their order in positions like sorted() on the keys
+        ranks, sign = self.ranks(field), -1 if descending else 1
+        return sorted(positions, key=lambda position: sign * ranks[position])
+
+    def select(self, clauses: typing.Sequence[Clause]) -> list["Stock"]:
+        positions = list(range(len(self.stocks)))
+        for clause in clauses:
+            positions = clause.apply(self, positions)
+        return [self.stocks[position] for position in positions]
+
+    def weigh(self, stocks: typing.Sequence["Stock"], weighting: str) -> list[tuple["Stock", float]]:
+        if weighting not in STOCK_WEIGHTINGS:
+            raise ValueError(f"未知的加權方式: {weighting}")
+
+        key = STOCK_WEIGHTINGS[weighting]
+        positions = {id(stock): position for position, stock in enumerate(self.stocks)}
+        ranked = [self.stocks[position] for position in self.rank(
+            [positions[id(stock)] for stock in stocks], weighting,
+        )]
+        summarize = sum(key(stock) for stock in ranked)
+        return [(stock, key(stock) / summarize) for stock in ranked]
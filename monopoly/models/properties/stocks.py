@@ -7,9 +7,10 @@ import typing
 import pydantic
 
 from monopoly import configs
-from monopoly.constants import StockType, SystemText, TaxFee
+from monopoly.constants import EventType, StockType, SystemText, TaxFee
 
 from ..interfaces import TradableMenuInterface
+from .queries import RankClause, StockIndex, parse_filters
 
 
 class BaseStock(TradableMenuInterface, abc.ABC):
@@ -40,6 +41,7 @@ class BaseStock(TradableMenuInterface, abc.ABC):
         player.pay(self.value)
         player.get_or_create_player_stock(self).increase()
         self.amount -= 1
+        board.events.emit(EventType.STOCK_BOUGHT, player, self, self.value)
         print(SystemText.BUYING_SUCCESS.value)
 
     def sell(self, player: "BasePlayer", board: "Board"):
@@ -58,6 +60,7 @@ class BaseStock(TradableMenuInterface, abc.ABC):
         player.get_or_create_player_stock(self).decrease()
         player.earn(self.sale_value, income_tax_free=True)
         self.amount += 1
+        board.events.emit(EventType.STOCK_SOLD, player, self, self.sale_value)
         if not silent:
             print(SystemText.SELLING_SUCCESS.value)
 
@@ -134,12 +137,11 @@ class Stock(BaseStock):
     transfer_tax: float = TaxFee.STOCK_TRANSFER_TAX.value
 
     def lands_affect(self, board: "Board") -> int:
-        if not getattr(self.land, "has_owner", False):
+        if self.land is None:
             return 0
 
-        credential = board.get_or_create_credential(self.land)
         base = configs.STOCK_SHUFFLE_BASE * self.beta * self.esg_ratio
-        return int(base * credential.houses / configs.BUILDING_UPPERBOUND)
+        return int(base * board.ownership.get_houses(self.land) / configs.BUILDING_UPPERBOUND)
 
     def earn(self, value: int):
         self.earning += int(value * self.payout_ratio)
@@ -189,12 +191,48 @@ class ETF(BaseStock):
     constituents: list[Constituent] = pydantic.Field(default_factory=list)
     transfer_tax: float = TaxFee.ETF_TRANSFER_TAX.value
 
-    def opening(self, **kwargs):
+    # the clauses the constituents were selected by, see StockIndex.select
+    filters: str = ""
+    weighting: str = "市值"
+    rebalance_interval: int = configs.ETF_REBALANCE_OPENINGS
+    openings: int = 0
+
+    @property
+    def ranked(self) -> bool:
+        return any(isinstance(clause, RankClause) for clause in parse_filters(self.filters))
+
+    @property
+    def rebalanceable(self) -> bool:
+        return self.weighting == "市值" and self.rebalance_interval > 0
+
+    def opening(self, *, index: typing.Union[StockIndex, None] = None, **kwargs):
         spread = sum(constituent.spread for constituent in self.constituents)
         self.spread = int(spread)
         self.value = math.ceil((self.value + spread) * (1 - self.expense_ratio))
+
+        self.openings += 1
+        if self.rebalanceable and self.openings % self.rebalance_interval == 0:
+            self.rebalance(index)
         self.set_history()
 
+    def rebalance(self, index: typing.Union[StockIndex, None] = None):
+        # a top-N ETF picks its members again from today's ranks, an area one keeps them
+        if index is not None and self.ranked:
+            self.constituents = [
+                ETF.Constituent(stock=stock, percent=0.)
+                for stock in index.select(parse_filters(self.filters))
+            ]
+
+        # only the weights change, the value carries on with every expense already charged
+        # a full pass over the k constituents, the caps move with every opening and every trade
+        caps = [max(constituent.stock.amount * constituent.stock.value, 0) for constituent in self.constituents]
+        total = sum(caps)
+        if total <= 0:
+            return
+
+        for constituent, cap in zip(self.constituents, caps):
+            constituent.percent = cap / total
+
     def reset(self):
         self.value = int(sum(constituent.value for constituent in self.constituents))
 
@@ -211,6 +249,6 @@ class ETF(BaseStock):
         for constituent in self.constituents:
             self.print_row(
                 f"{' ' * 2}"
-                f"{f'{constituent.stock}':<{self._width - len(constituent.stock.name) - 10}}"
+                f"{f'{constituent.stock}':<{self._width - self.chinese_length(constituent.stock.name) - 10}}"
                 f"{f'{round(100 * constituent.percent, 2)}%':<8}"
             )
@@ -0,0 +1,4 @@
+from .clients import LocalClient
+from .engines import AsyncServerEngine, BaseServerEngine, ShardedServerEngine
+from .shards import ShardWorker, relay_stream, route_table
+from .tables import QueueTerminal, TableOptions, TableSession
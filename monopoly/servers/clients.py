@@ -0,0 +1,52 @@
+import asyncio
+import codecs
+import typing
+
+
+class LocalClient:
+    # In-process stand-in for a remote player, talks the line protocol over loopback
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.output: str = ""
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._reader: typing.Union[asyncio.StreamReader, None] = None
+        self._writer: typing.Union[asyncio.StreamWriter, None] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+    async def connect(self, table_id: str) -> "LocalClient":
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        await self.send(table_id)
+        return self
+
+    async def read_closed(self, timeout: float = 5.) -> str:
+        while True:
+            data = await asyncio.wait_for(self._reader.read(65536), timeout)
+            if not data:
+                return self.output
+            self.output += self._decoder.decode(data)
+
+    async def read_until(self, text: str, timeout: float = 5.) -> str:
+        while text not in self.output:
+            data = await asyncio.wait_for(self._reader.read(65536), timeout)
+            if not data:
+                raise EOFError(f"connection closed before {text!r}")
+            self.output += self._decoder.decode(data)
+
+        index = self.output.index(text) + len(text)
+        result, self.output = self.output[:index], self.output[index:]
+        return result
+
+    async def send(self, *lines: str):
+        for line in lines:
+            self._writer.write(f"{line}\n".encode())
+        await self._writer.drain()
@@ -0,0 +1,269 @@
+import abc
+import asyncio
+import contextlib
+import pickle
+import time
+import typing
+
+import pydantic
+
+from monopoly import configs
+from monopoly.constants import SystemText
+from monopoly.engines import BaseEngine, TableEngine
+
+from .shards import ShardWorker, relay_stream, route_table
+from .tables import TableOptions, TableSession
+
+
+class BaseServerEngine(BaseEngine, abc.ABC):
+    host: str = configs.SERVER_HOST
+    port: int = configs.SERVER_PORT
+    max_tables: int = configs.SERVER_MAX_TABLES
+    idle_timeout: float = configs.SERVER_IDLE_TIMEOUT
+    send_timeout: float = configs.SERVER_SEND_TIMEOUT
+
+    _server: typing.Union[asyncio.AbstractServer, None] = pydantic.PrivateAttr(None)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def execute(self):
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(self.serve_forever())
+
+    @abc.abstractmethod
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        raise NotImplementedError
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def start(self):
+        self._server = await asyncio.start_server(self.handle_client, self.host, self.port)
+
+
+class AsyncServerEngine(BaseServerEngine):
+    outbox_size: int = 64
+
+    _clients: set[asyncio.Task] = pydantic.PrivateAttr(default_factory=set)
+    _sessions: dict[str, TableSession] = pydantic.PrivateAttr(default_factory=dict)
+    _snapshots: dict[str, bytes] = pydantic.PrivateAttr(default_factory=dict)
+
+    @property
+    def snapshots(self) -> dict[str, bytes]:
+        return self._snapshots
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "tables": len(self._sessions),
+            "attached": sum(session.attached for session in self._sessions.values()),
+            "evicted": len(self._snapshots),
+        }
+
+    @property
+    def table_ids(self) -> list[str]:
+        return sorted(set(self._sessions) | set(self._snapshots))
+
+    @property
+    def tables(self) -> dict[str, TableSession]:
+        return self._sessions
+
+    async def close(self):
+        await super().close()
+
+        sessions = tuple(self._sessions.values())
+        for session in sessions:
+            session.close()
+        if sessions:
+            await asyncio.wait([session.done for session in sessions])
+        # every client hangs up once its table is done
+        if self._clients:
+            await asyncio.wait(self._clients, timeout=self.send_timeout)
+
+    async def evict(self, table_id: str) -> typing.Union[bytes, None]:
+        session = self._sessions.get(table_id)
+        if session is not None:
+            session.close()
+            await session.done
+        return self._snapshots.pop(table_id, None)
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        session = pump = None
+        self._clients.add(asyncio.current_task())
+        try:
+            table_id = (await reader.readline()).decode().strip()
+            session = self.open_table(table_id)
+            session.attach()
+            pump = asyncio.create_task(session.pump(writer))
+            # the table finished or got evicted, hang up after the last output
+            pump.add_done_callback(lambda _: writer.close())
+            session.start()
+
+            while line := await reader.readline():
+                session.feed(line.decode())
+        except (AssertionError, OverflowError, ValueError) as error:
+            writer.write(f"{error}\n".encode())
+        except ConnectionError:
+            pass
+        finally:
+            if session is not None:
+                session.detach()
+            if pump is not None and not pump.done():
+                pump.cancel()
+            writer.close()
+            self._clients.discard(asyncio.current_task())
+
+    def open_table(self, table_id: str) -> TableSession:
+        if not table_id:
+            raise ValueError(SystemText.NAME_ERROR.value)
+
+        session = self._sessions.get(table_id)
+        if session is not None:
+            if session.attached:
+                raise AssertionError(f"{table_id} 遊戲桌已有連線")
+            return session
+
+        if len(self._sessions) >= self.max_tables:
+            raise OverflowError(f"遊戲桌已達上限 {self.max_tables}")
+
+        engine = TableEngine()
+        snapshot = self._snapshots.pop(table_id, None)
+        if snapshot is not None:
+            engine.board, engine.snapshot = pickle.loads(snapshot), snapshot
+
+        session = TableSession(
+            table_id,
+            engine,
+            asyncio.get_running_loop(),
+            TableOptions(
+                idle_timeout=self.idle_timeout,
+                send_timeout=self.send_timeout,
+                outbox_size=self.outbox_size,
+            ),
+        )
+        session.done.add_done_callback(lambda _: self._close_table(session))
+        self._sessions[table_id] = session
+        return session
+
+    def restore(self, table_id: str, snapshot: bytes):
+        assert table_id not in self._sessions
+        self._snapshots[table_id] = snapshot
+
+    def _close_table(self, session: TableSession):
+        if self._sessions.get(session.table_id) is session:
+            self._sessions.pop(session.table_id)
+        if session.engine.evicted and session.engine.snapshot is not None:
+            self._snapshots[session.table_id] = session.engine.snapshot
+
+
+class ShardedServerEngine(BaseServerEngine):
+    shards: int = configs.SERVER_SHARDS
+
+    _workers: list[ShardWorker] = pydantic.PrivateAttr(default_factory=list)
+    _routes: dict[str, int] = pydantic.PrivateAttr(default_factory=dict)
+
+    @property
+    def workers(self) -> list[ShardWorker]:
+        return self._workers
+
+    async def call(self, worker: ShardWorker, command: str, *args) -> typing.Any:
+        return await asyncio.get_running_loop().run_in_executor(None, worker.call, command, *args)
+
+    async def close(self):
+        await super().close()
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(None, worker.stop)
+            for worker in self._workers
+        ))
+        self._workers.clear()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            table_id = (await reader.readline()).decode().strip()
+            upstream_reader, upstream_writer = await asyncio.open_connection(
+                *self.route(table_id).address,
+            )
+        except ConnectionError:
+            writer.close()
+            return
+
+        upstream_writer.write(f"{table_id}\n".encode())
+        await asyncio.gather(
+            relay_stream(reader, upstream_writer),
+            relay_stream(upstream_reader, writer),
+        )
+
+    async def health(self, timeout: float = 1.) -> list[dict[str, typing.Any]]:
+        async def _health(worker: ShardWorker) -> dict[str, typing.Any]:
+            result = {"shard": worker.index, "alive": worker.alive, "responsive": False}
+            started = time.monotonic()
+            with contextlib.suppress(asyncio.TimeoutError, RuntimeError, TimeoutError):
+                result.update(await asyncio.wait_for(self.call(worker, "stats"), timeout))
+                result["responsive"] = True
+                result["latency"] = round(time.monotonic() - started, 6)
+            return result
+
+        return list(await asyncio.gather(*map(_health, self._workers)))
+
+    async def migrate(self, table_id: str, index: int):
+        source, target = self.route(table_id), self._workers[index]
+        if source is target:
+            return
+
+        # the source hangs up the table's client, who reconnects through the new route
+        snapshot = await self.call(source, "evict", table_id)
+        if snapshot is not None:
+            await self.call(target, "restore", table_id, snapshot)
+        self._routes[table_id] = index
+
+    async def rebalance(self) -> list[tuple[str, int, int]]:
+        loads: dict[int, list[str]] = {}
+        for worker in self._workers:
+            loads[worker.index] = await self.call(worker, "tables")
+
+        migrations = []
+        while True:
+            heaviest = max(loads, key=lambda index: len(loads[index]))
+            lightest = min(loads, key=lambda index: len(loads[index]))
+            if len(loads[heaviest]) - len(loads[lightest]) <= 1:
+                return migrations
+
+            table_id = loads[heaviest].pop()
+            await self.migrate(table_id, lightest)
+            loads[lightest].append(table_id)
+            migrations.append((table_id, heaviest, lightest))
+
+    def route(self, table_id: str) -> ShardWorker:
+        index = self._routes.get(table_id)
+        if index is None:
+            index = route_table(table_id, len(self._workers))
+        return self._workers[index]
+
+    async def start(self):
+        options = {
+            "max_tables": self.max_tables,
+            "idle_timeout": self.idle_timeout,
+            "send_timeout": self.send_timeout,
+        }
+        self._workers = [ShardWorker(index, self.host, options, AsyncServerEngine) for index in range(self.shards)]
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(None, worker.start)
+            for worker in self._workers
+        ))
+        await super().start()
@@ -0,0 +1,140 @@
+import asyncio
+import contextlib
+import multiprocessing
+import multiprocessing.connection
+import os
+import threading
+import time
+import typing
+import zlib
+
+
+class ShardWorker:
+    # Front-side handle of a worker process hosting its own server engine, built by the factory the front passes in
+    def __init__(
+        self,
+        index: int,
+        host: str,
+        options: dict[str, typing.Any],
+        factory: typing.Callable[..., typing.Any],
+    ):
+        self.index = index
+        self.address: typing.Union[tuple[str, int], None] = None
+        self._connection, child_connection = multiprocessing.Pipe()
+        self._lock = threading.Lock()
+        self._process = multiprocessing.Process(
+            target=serve_shard,
+            args=(child_connection, host, options, factory),
+            name=f"monopoly-shard-{index}",
+            daemon=True,
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self._process.is_alive()
+
+    @property
+    def pid(self) -> typing.Union[int, None]:
+        return self._process.pid
+
+    def call(self, command: str, *args, timeout: float = 5.) -> typing.Any:
+        with self._lock:
+            self._connection.send((command, *args))
+            if not self._connection.poll(timeout):
+                raise TimeoutError(f"shard {self.index} does not answer {command}")
+            status, result = self._connection.recv()
+        if status == "error":
+            raise RuntimeError(result)
+        return result
+
+    def start(self, timeout: float = 30.):
+        self._process.start()
+        if not self._connection.poll(timeout):
+            raise TimeoutError(f"shard {self.index} does not start")
+        self.address = tuple(self._connection.recv())
+
+    def stop(self, timeout: float = 10.):
+        with contextlib.suppress(EOFError, OSError, RuntimeError, TimeoutError):
+            self.call("stop", timeout=timeout)
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._connection.close()
+
+
+def route_table(table_id: str, shards: int) -> int:
+    # stable across processes and runs, unlike the salted builtin hash()
+    return zlib.crc32(table_id.encode()) % shards
+
+
+def serve_shard(
+    connection: multiprocessing.connection.Connection,
+    host: str,
+    options: dict[str, typing.Any],
+    factory: typing.Callable[..., typing.Any],
+):
+    engine = factory(host=host, port=0, **options)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve_shard(engine, connection))
+
+
+async def _control_shard(engine: typing.Any, command: str, *args) -> typing.Any:
+    if command == "evict":
+        return await engine.evict(*args)
+    if command == "ping":
+        return time.time()
+    if command == "restore":
+        return engine.restore(*args)
+    if command == "stats":
+        user_time, system_time, *_ = os.times()
+        return {
+            **engine.stats,
+            "pid": os.getpid(),
+            "threads": threading.active_count(),
+            "cpu_time": round(user_time + system_time, 3),
+        }
+    if command == "tables":
+        return engine.table_ids
+    raise ValueError(f"Unknown command {command}")
+
+
+async def _serve_shard(engine: typing.Any, connection: multiprocessing.connection.Connection):
+    await engine.start()
+    loop = asyncio.get_running_loop()
+    stopping = loop.create_future()
+
+    def _receive_commands():
+        while True:
+            try:
+                command, *args = connection.recv()
+            except (EOFError, OSError):
+                command, args = "stop", ()
+
+            if command == "stop":
+                with contextlib.suppress(RuntimeError):
+                    loop.call_soon_threadsafe(stopping.set_result, None)
+                with contextlib.suppress(OSError):
+                    connection.send(("ok", None))
+                return
+
+            future = asyncio.run_coroutine_threadsafe(_control_shard(engine, command, *args), loop)
+            try:
+                connection.send(("ok", future.result()))
+            except Exception as error:
+                connection.send(("error", repr(error)))
+
+    connection.send(engine.address)
+    threading.Thread(target=_receive_commands, name="shard-control", daemon=True).start()
+    try:
+        await stopping
+    finally:
+        await engine.close()
+
+
+async def relay_stream(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    with contextlib.suppress(ConnectionError):
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+    writer.close()
@@ -0,0 +1,144 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import threading
+import typing
+
+from monopoly import terminals
+
+# a parked table only holds a few frames of game code, so thousands of them fit in a process
+TABLE_STACK_SIZE: int = 512 * 1024
+
+
+class TableOptions(typing.NamedTuple):
+    idle_timeout: float
+    send_timeout: float
+    outbox_size: int
+    buffer_writes: int = 1024
+
+
+class QueueTerminal(terminals.BaseTerminal):
+    # Bridges the blocking input()/print() of a table thread to asyncio queues on the loop
+    def __init__(self, loop: asyncio.AbstractEventLoop, options: TableOptions):
+        self.loop = loop
+        self.options = options
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.outbox: asyncio.Queue = asyncio.Queue(maxsize=options.outbox_size)
+        self.connected: bool = False
+        self.closed: bool = False
+        self._buffer: list[str] = []
+
+    def flush(self):
+        if not self._buffer:
+            return
+
+        text, self._buffer = "".join(self._buffer), []
+        if self.closed or not self.connected:
+            return
+
+        future = asyncio.run_coroutine_threadsafe(self.outbox.put(text), self.loop)
+        try:
+            future.result(timeout=self.options.send_timeout)
+        except concurrent.futures.TimeoutError as error:
+            future.cancel()
+            self.closed = True
+            raise EOFError("client is too slow") from error
+
+    def readline(self) -> str:
+        self.flush()
+        if self.closed:
+            return ""
+
+        future = asyncio.run_coroutine_threadsafe(self.inbox.get(), self.loop)
+        try:
+            line = future.result(timeout=self.options.idle_timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            line = None
+
+        if line is None:
+            # idle or shutting down, input() raises EOFError and the table gets evicted
+            self.closed = True
+            return ""
+        return line if line.endswith("\n") else f"{line}\n"
+
+    def write(self, text: str) -> int:
+        self._buffer.append(text)
+        if len(self._buffer) >= self.options.buffer_writes:
+            self.flush()
+        return len(text)
+
+
+class TableSession:
+    # The game models block on input(), so every live table parks its engine on a small-stack thread while the
+    # one event loop does all the socket I/O; an idle table is evicted to a snapshot and gives its thread back.
+    def __init__(
+        self,
+        table_id: str,
+        engine: typing.Any,
+        loop: asyncio.AbstractEventLoop,
+        options: TableOptions,
+    ):
+        self.table_id = table_id
+        self.engine = engine
+        self.terminal = QueueTerminal(loop, options)
+        self.done: asyncio.Future = loop.create_future()
+        self._thread = threading.Thread(target=self._run, name=f"table-{table_id}", daemon=True)
+
+    @property
+    def attached(self) -> bool:
+        return self.terminal.connected
+
+    @property
+    def started(self) -> bool:
+        return self._thread.ident is not None
+
+    def attach(self):
+        assert not self.attached
+        self.terminal.connected = True
+
+    def close(self):
+        # wake up the table thread, it unwinds with EOFError from input()
+        self.terminal.inbox.put_nowait(None)
+
+    def detach(self):
+        self.terminal.connected = False
+
+    def feed(self, line: str):
+        self.terminal.inbox.put_nowait(line)
+
+    async def pump(self, writer: asyncio.StreamWriter):
+        while True:
+            text = await self.terminal.outbox.get()
+            if text is None:
+                return
+            writer.write(text.encode())
+            # a slow client fills the outbox and the table thread waits in flush()
+            await writer.drain()
+
+    def start(self):
+        if self.started:
+            return
+
+        # the stack size only applies to threads started while it is set
+        previous = threading.stack_size(TABLE_STACK_SIZE)
+        try:
+            self._thread.start()
+        finally:
+            threading.stack_size(previous)
+
+    def _finish(self):
+        self.terminal.loop.create_task(self.terminal.outbox.put(None))
+        if not self.done.done():
+            self.done.set_result(self.table_id)
+
+    def _run(self):
+        with terminals.attach(self.terminal):
+            try:
+                self.engine.execute()
+            finally:
+                with contextlib.suppress(EOFError):
+                    self.terminal.flush()
+                self.terminal.closed = True
+                with contextlib.suppress(RuntimeError):
+                    self.terminal.loop.call_soon_threadsafe(self._finish)
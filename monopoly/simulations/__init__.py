@@ -0,0 +1,5 @@
+from .aggregators import Distribution, GameAggregator, GameObserver, QuantileSketch, RunningStats
+from .bots import BotPolicy, BotTerminal
+from .games import GameResult, OwnershipTracker, simulate_game, simulate_games
+from .parameters import TUNABLE_PARAMETERS, tune_board, tuning, validate_parameters
+from .transpositions import TranspositionTable
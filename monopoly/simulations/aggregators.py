@@ -0,0 +1,244 @@
+import collections
+import functools
+import math
+import typing
+
+from monopoly.constants import EventType, StockType
+
+
+class RunningStats:
+    # Welford's online mean and variance, merged with Chan's parallel update
+    __slots__ = ("count", "mean", "m2", "minimum", "maximum")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = self.m2 = 0.
+        self.minimum, self.maximum = math.inf, -math.inf
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.
+
+    def merge(self, other: "RunningStats"):
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def push(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "min": self.minimum if self.count else 0.,
+            "max": self.maximum if self.count else 0.,
+        }
+
+
+class QuantileSketch:
+    # log-bucketed sketch, every quantile lies within relative_accuracy of the true value
+    __slots__ = ("gamma", "max_buckets", "count", "zeros", "positives", "negatives")
+
+    def __init__(self, relative_accuracy: float = .01, max_buckets: int = 2048):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.max_buckets = max_buckets
+        self.count = self.zeros = 0
+        self.positives: dict[int, int] = {}
+        self.negatives: dict[int, int] = {}
+
+    def add(self, value: float):
+        self.count += 1
+        if abs(value) < 1e-9:
+            self.zeros += 1
+            return
+
+        store = self.positives if value > 0 else self.negatives
+        key = math.ceil(math.log(abs(value), self.gamma))
+        store[key] = store.get(key, 0) + 1
+        if len(store) > self.max_buckets:
+            self._collapse(store)
+
+    def merge(self, other: "QuantileSketch"):
+        assert math.isclose(self.gamma, other.gamma)
+        self.count += other.count
+        self.zeros += other.zeros
+        for store, others in ((self.positives, other.positives), (self.negatives, other.negatives)):
+            for key, count in others.items():
+                store[key] = store.get(key, 0) + count
+            while len(store) > self.max_buckets:
+                self._collapse(store)
+
+    def quantile(self, rate: float) -> float:
+        if self.count == 0:
+            return 0.
+
+        rank, seen = rate * (self.count - 1), 0
+        for key in sorted(self.negatives, reverse=True):
+            seen += self.negatives[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zeros
+        if seen > rank:
+            return 0.
+        for key in sorted(self.positives):
+            seen += self.positives[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positives))
+
+    def _collapse(self, store: dict[int, int]):
+        # the smallest magnitudes lose their accuracy first
+        lowest = min(store)
+        count = store.pop(lowest)
+        following = min(store)
+        store[following] += count
+
+    def _value(self, key: int) -> float:
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+
+class Distribution:
+    __slots__ = ("stats", "sketch")
+
+    def __init__(self):
+        self.stats, self.sketch = RunningStats(), QuantileSketch()
+
+    def add(self, value: float):
+        self.stats.push(value)
+        self.sketch.add(value)
+
+    def merge(self, other: "Distribution"):
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+
+    def to_dict(self, *rates: float) -> dict[str, float]:
+        return {
+            **self.stats.to_dict(),
+            **{f"p{int(100 * rate):02}": self.sketch.quantile(rate) for rate in rates},
+        }
+
+
+class GameObserver:
+    # per-game state, dropped with the board while the aggregator keeps only totals
+    def __init__(self, aggregator: "GameAggregator", board: "Board"):
+        self.aggregator = aggregator
+        self.board = board
+        self.values = {stock.id: stock.value for stock in board.stocks.values()}
+        self.ticks: dict[str, tuple[int, int]] = {}
+        self.cards: dict[str, str] = {}
+
+    def __call__(self, event: "Event"):
+        if event.type == EventType.STOCK_TICK:
+            self.tick(event.subject)
+        elif event.type == EventType.CARD_DRAWN:
+            self.cards[event.player.name] = type(event.subject).__name__
+        elif event.type == EventType.BANKRUPTCY:
+            space = self.board.current_player.space.space
+            cause = self.cards.get(event.player.name, type(space).__name__)
+            self.aggregator.bankruptcies[cause] += 1
+        elif event.type == EventType.TURN_ENDED:
+            self.cards.clear()
+            self.ticks.clear()
+
+    def tick(self, stock: "BaseStock"):
+        previous, value = self.values[stock.id], stock.value
+        self.values[stock.id] = value
+        self.ticks[stock.id] = (previous, value)
+        if previous > 0:
+            self.aggregator.push_return(stock.id, value / previous - 1)
+
+        if stock.type == StockType.ETF and previous > 0:
+            # the index the ETF tracks, weighted the way ETF.reset values it
+            before = after = 0.
+            for constituent in stock.constituents:
+                start, end = self.ticks.get(constituent.stock.id, (constituent.stock.value,) * 2)
+                before += start * constituent.percent
+                after += end * constituent.percent
+            if before > 0:
+                self.aggregator.tracking[stock.id].push((value / previous - 1) - (after / before - 1))
+
+
+class GameAggregator:
+    EVENT_TYPES: typing.ClassVar[tuple[EventType, ...]] = (
+        EventType.BANKRUPTCY, EventType.CARD_DRAWN, EventType.STOCK_TICK, EventType.TURN_ENDED,
+    )
+
+    def __init__(self):
+        self.games = 0
+        # seat: [games, wins]
+        self.seats: dict[int, list[int]] = collections.defaultdict(functools.partial(list, (0, 0)))
+        self.turns = Distribution()
+        # toll income per land in each game the land was owned
+        self.tolls: dict[str, RunningStats] = collections.defaultdict(RunningStats)
+        self.bankruptcies: collections.Counter = collections.Counter()
+        self.returns: dict[str, Distribution] = collections.defaultdict(Distribution)
+        self.tracking: dict[str, RunningStats] = collections.defaultdict(RunningStats)
+
+    def attach(self, board: "Board") -> GameObserver:
+        observer = GameObserver(self, board)
+        board.events.subscribe(observer, *self.EVENT_TYPES)
+        return observer
+
+    def merge(self, other: "GameAggregator"):
+        self.games += other.games
+        for seat, (games, wins) in other.seats.items():
+            self.seats[seat][0] += games
+            self.seats[seat][1] += wins
+        self.turns.merge(other.turns)
+        self.bankruptcies.update(other.bankruptcies)
+        for mine, others in (
+            (self.tolls, other.tolls),
+            (self.returns, other.returns),
+            (self.tracking, other.tracking),
+        ):
+            for key, value in others.items():
+                mine[key].merge(value)
+
+    def push_return(self, stock_id: str, value: float):
+        self.returns[stock_id].add(value)
+
+    def record(self, result: "GameResult"):
+        self.games += 1
+        for seat, name, *_ in result.players:
+            self.seats[seat][0] += 1
+            self.seats[seat][1] += name == result.winner
+        self.turns.add(result.turns)
+
+        tolls: collections.Counter = collections.Counter()
+        for land_id, *_, toll in result.ownerships:
+            tolls[land_id] += toll
+        for land_id, toll in tolls.items():
+            self.tolls[land_id].push(toll)
+
+    def report(self) -> dict[str, typing.Any]:
+        return {
+            "games": self.games,
+            "win_rate": {
+                seat: wins / games for seat, (games, wins) in sorted(self.seats.items())
+            },
+            "turns": self.turns.to_dict(.5, .9),
+            "tolls": {land_id: stats.to_dict() for land_id, stats in sorted(self.tolls.items())},
+            "bankruptcies": dict(self.bankruptcies.most_common()),
+            "returns": {
+                stock_id: distribution.to_dict(.05, .95)
+                for stock_id, distribution in sorted(self.returns.items())
+            },
+            "tracking_error": {etf_id: stats.stdev for etf_id, stats in sorted(self.tracking.items())},
+        }
@@ -0,0 +1,169 @@
+import random
+import re
+import typing
+
+from monopoly.constants import SystemText
+from monopoly.terminals import BaseTerminal
+
+PLAYER_NAME_RE = re.compile(r"請輸入第(\d+)位玩家名稱")
+
+
+class BotPolicy(typing.NamedTuple):
+    reserve: int = 1000
+    stock_rate: float = .3
+    patience: int = 64
+
+
+class BotMemory:
+    # what the bot carries from one prompt to the next
+    def __init__(self):
+        self.stock: typing.Any = None
+        self.sold = False
+        self.last: typing.Union[tuple[typing.Union[str, None], str], None] = None
+        self.repeats = 0
+
+    def repeat(self, name: typing.Union[str, None], answer: str) -> int:
+        # how many times in a row the same answer went to the same prompt
+        if self.last == (name, answer):
+            self.repeats += 1
+        else:
+            self.last, self.repeats = (name, answer), 0
+        return self.repeats
+
+
+# Answers the same prompts a person would, by reading what the game just printed
+class BotTerminal(BaseTerminal):
+    RESPONSES: typing.ClassVar[tuple[tuple[str, str], ...]] = (
+        ("有幾個人要玩遊戲呢", "_answer_number"),
+        ("位玩家名稱", "_answer_name"),
+        ("想要變賣什麼呢", "_answer_trade_off"),
+        ("想要變賣哪個不動產呢", "_answer_sell_land"),
+        ("想要變賣哪張股票呢", "_answer_sell_stock"),
+        ("拆掉房屋嗎", "_answer_demolish"),
+        ("想要賣出", "_answer_sell"),
+        ("想買入哪檔股票呢", "_answer_choose_stock"),
+        ("想要買入", "_answer_buy"),
+        ("建造房屋嗎", "_answer_construct"),
+        ("[D]ice to Play", "_answer_play"),
+        ("要使用幾顆骰子", "_answer_default"),
+        ("選擇要往哪裡走", "_answer_direction"),
+        (SystemText.PRESS_ENTER_TO_CONTINUE.value, "_answer_default"),
+    )
+
+    def __init__(
+        self,
+        names: typing.Sequence[str],
+        policy: BotPolicy = BotPolicy(),
+        rng: typing.Union[random.Random, None] = None,
+    ):
+        self.board = None
+        self.names = tuple(names)
+        self.policy = policy
+        self.rng = rng or random.Random()
+
+        self._output: list[str] = []
+        self._memory = BotMemory()
+
+    @property
+    def player(self) -> typing.Any:
+        return self.board.current_player.player
+
+    @property
+    def space(self) -> typing.Any:
+        return self.board.current_player.space.space
+
+    def answer(self, text: str) -> str:
+        for keyword, name in self.RESPONSES:
+            if keyword in text:
+                answer = getattr(self, name)(text)
+                break
+        else:
+            # cancels listings and declines every (Y/N) question
+            name, answer = None, "C"
+
+        # never loop forever on a prompt the policy keeps accepting
+        if self._memory.repeat(name, answer) > self.policy.patience:
+            answer = "C"
+        return answer
+
+    def flush(self):
+        pass
+
+    def readline(self) -> str:
+        text = "".join(self._output)
+        self._output.clear()
+        return f"{self.answer(text)}\n"
+
+    def write(self, text: str) -> int:
+        self._output.append(text)
+        return len(text)
+
+    def _affordable(self, price: int) -> bool:
+        return self.player.cash >= price + self.policy.reserve
+
+    def _answer_buy(self, _: str) -> str:
+        stock = self._memory.stock
+        price = stock.value if stock is not None else self.space.land.land_price
+        return "B" if self._affordable(price) else "C"
+
+    def _answer_choose_stock(self, _: str) -> str:
+        if self._memory.stock is not None:
+            self._memory.stock = None
+            return "C"
+
+        stocks = [
+            stock
+            for stock in self.board.stocks.values()
+            if stock.amount > 0 and self._affordable(stock.value)
+        ]
+        if not stocks or self.rng.random() >= self.policy.stock_rate:
+            return "C"
+        stock = self._memory.stock = self.rng.choice(stocks)
+        return stock.id
+
+    def _answer_construct(self, _: str) -> str:
+        return "B" if self._affordable(self.space.land.house_price) else "C"
+
+    def _answer_default(self, _: str) -> str:
+        return ""
+
+    def _answer_demolish(self, _: str) -> str:
+        return "D"
+
+    def _answer_direction(self, _: str) -> str:
+        return str(self.rng.randrange(2))
+
+    def _answer_name(self, text: str) -> str:
+        return self.names[int(PLAYER_NAME_RE.findall(text)[-1]) - 1]
+
+    def _answer_number(self, _: str) -> str:
+        return str(len(self.names))
+
+    def _answer_play(self, _: str) -> str:
+        return "D"
+
+    def _answer_sell(self, _: str) -> str:
+        return "S"
+
+    def _answer_sell_land(self, _: str) -> str:
+        return self._sell_one(self.player.lands)
+
+    def _answer_sell_stock(self, _: str) -> str:
+        return self._sell_one(self.player.stocks)
+
+    def _answer_trade_off(self, _: str) -> str:
+        # the bot only ever buys what it can afford, so trading off means a forced payment
+        if self._memory.sold:
+            self._memory.sold = False
+            return "C"
+        if self.player.lands:
+            return "L"
+        if self.player.stocks:
+            return "S"
+        return "C"
+
+    def _sell_one(self, properties: dict[str, typing.Any]) -> str:
+        if self._memory.sold or not properties:
+            return "C"
+        self._memory.sold = True
+        return next(iter(properties))
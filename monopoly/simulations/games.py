@@ -0,0 +1,141 @@
+import contextlib
+import pickle
+import random
+import typing
+
+from monopoly import terminals
+from monopoly.loaders import FixtureLoader
+
+from .aggregators import GameAggregator
+from .bots import BotPolicy, BotTerminal
+from .parameters import tune_board, tuning
+
+
+class GameResult(typing.NamedTuple):
+    game_id: str
+    seed: int
+    turns: int
+    finished: bool
+    winner: str
+    # (seat, *Board.list_player_detail(player))
+    players: list[tuple]
+    # (land_id, area, seat, start_turn, end_turn, invested, tolls)
+    ownerships: list[tuple]
+    # (turn, stock_id, value)
+    prices: list[tuple]
+    snapshot: typing.Union[bytes, None] = None
+    # this game alone, merged by whoever collects the results
+    statistics: typing.Union[GameAggregator, None] = None
+
+
+class OwnershipTracker:
+    def __init__(self, seats: dict[str, int]):
+        self.seats = seats
+        self.records: list[tuple] = []
+        self._holding: dict[str, list] = {}
+
+    def close(self, land_id: str, turn: int):
+        credential, start, houses = self._holding.pop(land_id)
+        land = credential.land
+        self.records.append((
+            land.id,
+            land.area.value,
+            self.seats[credential.player.name],
+            start,
+            turn,
+            land.land_price + (land.house_price * houses if land.buildable else 0),
+            credential.tolls,
+        ))
+
+    def update(self, ownership: "Ownership", turn: int):
+        # a land changing hands gets a new credential, so the one held here is stale
+        for land_id, (credential, _, _) in tuple(self._holding.items()):
+            if ownership.get_credential(credential.land) is not credential:
+                self.close(land_id, turn)
+
+        for credential in ownership.credentials:
+            holding = self._holding.setdefault(credential.land.id, [credential, turn, 0])
+            holding[2] = max(holding[2], credential.houses)
+
+    def finish(self, turn: int) -> list[tuple]:
+        for land_id in tuple(self._holding):
+            self.close(land_id, turn)
+        return self.records
+
+
+@contextlib.contextmanager
+def seeded(seed: int) -> typing.Generator[None, None, None]:
+    # dices, cards and the loader all draw from the module random
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+def leader(board: "Board") -> "BasePlayer":
+    if board.finished:
+        return board.winner.player
+    return max(
+        (player for player in board.players if not (player.bankruptcy or player.surrender)),
+        key=lambda player: player.net_worth,
+    )
+
+
+def simulate_game(
+    seed: int,
+    *,
+    players: int = 2,
+    max_turns: int = 500,
+    policy: BotPolicy = BotPolicy(),
+    game_id: typing.Union[str, None] = None,
+    snapshot: bool = False,
+    statistics: bool = False,
+    parameters: typing.Union[dict[str, float], None] = None,
+) -> GameResult:
+    seats = {f"bot{idx}": idx - 1 for idx in range(1, players + 1)}
+    terminal = BotTerminal(list(seats), policy, random.Random(seed))
+
+    with seeded(seed), terminals.attach(terminal), tuning(parameters or {}):
+        board = FixtureLoader().execute()
+        tune_board(board, parameters or {})
+        board.start()
+        terminal.board = board
+        aggregator = GameAggregator() if statistics else None
+        if aggregator is not None:
+            aggregator.attach(board)
+
+        tracker, prices = OwnershipTracker(seats), []
+        while not board.finished and board.turns < max_turns:
+            board.run()
+            tracker.update(board.ownership, board.turns)
+            if board.current_player == board.start_player:
+                prices.extend(
+                    (board.turns, stock.id, stock.value)
+                    for stock in board.stocks.values()
+                )
+
+    result = GameResult(
+        game_id=game_id or f"{seed:08}",
+        seed=seed,
+        turns=board.turns,
+        finished=board.finished,
+        winner=leader(board).name,
+        players=[(seats[player.name], *board.list_player_detail(player)) for player in board.players],
+        ownerships=tracker.finish(board.turns),
+        prices=prices,
+        snapshot=pickle.dumps(board) if snapshot else None,
+        statistics=aggregator,
+    )
+    if aggregator is not None:
+        aggregator.record(result)
+    return result
+
+
+def simulate_games(
+    seeds: typing.Iterable[int],
+    **kwargs,
+) -> typing.Generator[GameResult, None, None]:
+    for seed in seeds:
+        yield simulate_game(seed, **kwargs)
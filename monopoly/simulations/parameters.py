@@ -0,0 +1,52 @@
+import contextlib
+import typing
+
+from monopoly import configs
+from monopoly.constants import StockType, TaxFee
+
+CONFIG_PARAMETERS: tuple[str, ...] = (
+    "AREA_ADDITION_RATE",
+    "HOUSE_DISCOUNT_RATE",
+    "PASS_START_POINT_CASH",
+    "STOCK_SHUFFLE_BASE",
+)
+TUNABLE_PARAMETERS: tuple[str, ...] = CONFIG_PARAMETERS + tuple(fee.name for fee in TaxFee)
+
+
+def validate_parameters(parameters: dict[str, float]):
+    unknown = set(parameters) - set(TUNABLE_PARAMETERS)
+    if unknown:
+        raise ValueError(f"無法調整的參數: {', '.join(sorted(unknown))}")
+
+
+@contextlib.contextmanager
+def tuning(parameters: dict[str, float]) -> typing.Generator[None, None, None]:
+    # configs are module globals, so this is process-wide until the block exits: one game at a time per process
+    # the TaxFee rates are left to tune_board, they live on the board
+    validate_parameters(parameters)
+    saved = {name: getattr(configs, name) for name in parameters if name in CONFIG_PARAMETERS}
+    try:
+        for name in saved:
+            setattr(configs, name, parameters[name])
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(configs, name, value)
+
+
+def tune_board(board: "Board", parameters: dict[str, float]):
+    # values the models copied from configs and TaxFee when they were defined or loaded
+    if "PASS_START_POINT_CASH" in parameters:
+        board.start_space.space.value = int(parameters["PASS_START_POINT_CASH"])
+
+    for name, value in parameters.items():
+        if name in TaxFee.__members__:
+            board.fees[TaxFee[name]] = value
+
+    fees = {
+        StockType.STOCK: parameters.get(TaxFee.STOCK_TRANSFER_TAX.name),
+        StockType.ETF: parameters.get(TaxFee.ETF_TRANSFER_TAX.name),
+    }
+    for stock in board.stocks.values():
+        if fees[stock.type] is not None:
+            stock.transfer_tax = fees[stock.type]
@@ -0,0 +1,156 @@
+import contextlib
+import functools
+import itertools
+import math
+import multiprocessing
+import random
+import typing
+
+from .aggregators import GameAggregator
+from .bots import BotPolicy
+from .games import simulate_game
+from .parameters import validate_parameters
+
+
+class SweepOptions(typing.NamedTuple):
+    games: int = 50
+    max_batches: int = 10
+    max_turns: int = 500
+    players: int = 2
+    seed: int = 0
+    processes: int = 1
+    metric: str = "turns"
+    # two-sided 95%
+    z_score: float = 1.96
+    policy: BotPolicy = BotPolicy()
+
+
+class SweepPoint(typing.NamedTuple):
+    parameters: dict[str, float]
+    aggregator: GameAggregator
+
+
+def _first_seat_interval(aggregator: GameAggregator, z_score: float) -> tuple[float, float]:
+    games, wins = aggregator.seats.get(0, (0, 0))
+    if not games:
+        return 0., math.inf
+
+    # Wilson interval, it keeps a width when every game went the same way, widened to be symmetric around the rate
+    rate, spread = wins / games, z_score * z_score / games
+    center = (rate + spread / 2) / (1 + spread)
+    half = z_score * math.sqrt(rate * (1 - rate) / games + spread / games / 4) / (1 + spread)
+    return rate, max(center + half - rate, rate - center + half)
+
+
+def _turns_interval(aggregator: GameAggregator, z_score: float) -> tuple[float, float]:
+    stats = aggregator.turns.stats
+    return stats.mean, z_score * stats.stdev / math.sqrt(stats.count) if stats.count > 1 else math.inf
+
+
+# metric: (mean, half width of its confidence interval)
+SWEEP_METRICS: dict[str, typing.Callable[[GameAggregator, float], tuple[float, float]]] = {
+    "first-seat": _first_seat_interval,
+    "turns": _turns_interval,
+}
+
+
+def grid_points(grid: dict[str, typing.Sequence[float]]) -> list[dict[str, float]]:
+    validate_parameters(grid)
+    return [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+
+
+def random_points(
+    ranges: dict[str, tuple[float, float]],
+    count: int,
+    seed: int = 0,
+) -> list[dict[str, float]]:
+    validate_parameters(ranges)
+    rng = random.Random(seed)
+    return [
+        {
+            name: rng.randint(low, high) if isinstance(low, int) and isinstance(high, int) else rng.uniform(low, high)
+            for name, (low, high) in ranges.items()
+        }
+        for _ in range(count)
+    ]
+
+
+def separated(intervals: typing.Sequence[tuple[float, float]]) -> bool:
+    # every pair of intervals is disjoint, so the ranking of the points is settled
+    ordered = sorted(intervals)
+    return all(
+        low_mean + low_width < high_mean - high_width
+        for (low_mean, low_width), (high_mean, high_width) in zip(ordered, ordered[1:])
+    )
+
+
+def _play(
+    task: tuple[int, dict[str, float], int],
+    *,
+    max_turns: int,
+    players: int,
+    policy: BotPolicy,
+) -> tuple[int, GameAggregator]:
+    index, parameters, seed = task
+    result = simulate_game(
+        seed,
+        players=players,
+        max_turns=max_turns,
+        policy=policy,
+        statistics=True,
+        parameters=parameters,
+    )
+    return index, result.statistics
+
+
+def run_sweep(
+    points: typing.Sequence[dict[str, float]],
+    options: SweepOptions = SweepOptions(),
+) -> tuple[list[SweepPoint], int]:
+    interval = SWEEP_METRICS[options.metric]
+    sweep = [SweepPoint(parameters, GameAggregator()) for parameters in points]
+    play = functools.partial(_play, max_turns=options.max_turns, players=options.players, policy=options.policy)
+
+    with (
+        multiprocessing.Pool(options.processes)
+        if options.processes > 1 else contextlib.nullcontext()
+    ) as pool:
+        for batch in range(1, options.max_batches + 1):
+            # every point replays the same seeds, so their differences come from the parameters
+            start = options.seed + (batch - 1) * options.games
+            tasks = [
+                (index, point.parameters, seed)
+                for index, point in enumerate(sweep)
+                for seed in range(start, start + options.games)
+            ]
+            results = map(play, tasks) if pool is None else pool.imap_unordered(play, tasks)
+            for index, aggregator in results:
+                sweep[index].aggregator.merge(aggregator)
+
+            if len(sweep) > 1 and separated([interval(point.aggregator, options.z_score) for point in sweep]):
+                break
+    return sweep, batch
+
+
+def sweep_table(
+    sweep: typing.Sequence[SweepPoint],
+    z_score: float = SweepOptions().z_score,
+) -> tuple[list[str], list[tuple]]:
+    names = list(dict.fromkeys(name for point in sweep for name in point.parameters))
+    columns = [*names, "games", "turns", "turns_ci", "turns_p50", "first_seat", "first_seat_ci", "bankruptcies"]
+    rows = []
+    for point in sweep:
+        aggregator = point.aggregator
+        turns, turns_ci = _turns_interval(aggregator, z_score)
+        first_seat, first_seat_ci = _first_seat_interval(aggregator, z_score)
+        rows.append((
+            *(point.parameters.get(name, "") for name in names),
+            aggregator.games,
+            round(turns, 1),
+            round(turns_ci, 1),
+            round(aggregator.turns.sketch.quantile(.5), 1),
+            round(first_seat, 3),
+            round(first_seat_ci, 3),
+            round(sum(aggregator.bankruptcies.values()) / max(aggregator.games, 1), 3),
+        ))
+    return columns, rows
@@ -0,0 +1,90 @@
+import contextlib
+import struct
+import typing
+from multiprocessing import shared_memory
+
+from monopoly import instruments
+
+TRANSPOSITION_SLOTS: int = 1 << 16
+
+_VALUE = struct.Struct("<d")
+_WORD = struct.Struct("<Q")
+
+
+class TranspositionTable:
+    # three words a slot: the key xor the other two, the value bits and the depth plus one (0 for an empty slot),
+    # so an entry torn by two processes writing at once no longer matches its key and reads as a miss
+    def __init__(
+        self,
+        slots: int = TRANSPOSITION_SLOTS,
+        name: typing.Union[str, None] = None,
+        *,
+        shared: bool = False,
+    ):
+        self.slots = slots
+        self._memory: typing.Union[shared_memory.SharedMemory, None] = None
+        self._owner = name is None
+        if shared or name is not None:
+            self._memory = shared_memory.SharedMemory(name=name, create=name is None, size=24 * slots)
+            buffer = self._memory.buf
+        else:
+            buffer = bytearray(24 * slots)
+        # shared memory comes in whole pages
+        self._words = memoryview(buffer)[:24 * slots].cast("Q")
+
+    @property
+    def name(self) -> typing.Union[str, None]:
+        return self._memory.name if self._memory is not None else None
+
+    @property
+    def nbytes(self) -> int:
+        return self._words.nbytes
+
+    def clear(self):
+        self._words.cast("B")[:] = bytes(self._words.nbytes)
+
+    def close(self):
+        self._words.release()
+        if self._memory is not None:
+            self._memory.close()
+            if self._owner:
+                self._memory.unlink()
+
+    def probe(self, key: int, depth: int = 0) -> typing.Union[float, None]:
+        # only a result searched at least as deep as asked for counts as a hit
+        offset = key % self.slots * 3
+        check, bits, stored = self._words[offset:offset + 3]
+        if stored > depth and check ^ bits ^ stored == key:
+            instruments.count("transposition.probe", "hit")
+            return _VALUE.unpack(_WORD.pack(bits))[0]
+
+        instruments.count("transposition.probe", "miss")
+        return None
+
+    def store(self, key: int, depth: int, value: float) -> bool:
+        # depth preferred, a shallower result never pushes a deeper one out of its slot
+        offset = key % self.slots * 3
+        if depth + 1 < self._words[offset + 2]:
+            instruments.count("transposition.store", "kept")
+            return False
+
+        bits, stored = _WORD.unpack(_VALUE.pack(value))[0], depth + 1
+        self._words[offset + 1], self._words[offset + 2] = bits, stored
+        self._words[offset] = key ^ bits ^ stored
+        instruments.count("transposition.store", "stored")
+        return True
+
+    def __del__(self):
+        # a mapping cannot close while a view of it is alive, and workers never close what they attached
+        with contextlib.suppress(AttributeError):
+            self._words.release()
+
+    def __enter__(self) -> "TranspositionTable":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __reduce__(self) -> tuple:
+        # a shared table attaches to the same memory in the worker, a private one arrives empty
+        return (self.__class__, (self.slots, self.name))
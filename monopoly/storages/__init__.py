@@ -0,0 +1,5 @@
+from .archives import Archive, ArchiveLocation
+from .autosavers import AutoSaver
+from .catalogs import SaveCatalog, SaveEntry
+from .codecs import CODECS, StreamDecoder, StreamEncoder, decode, decode_stream, encode, encode_stream
+from .results import RESULT_QUERIES, ResultStore
@@ -0,0 +1,245 @@
+import mmap
+import os
+import pathlib
+import struct
+import typing
+import zlib
+
+RECORD_HEADER = struct.Struct("<4sHII")
+RECORD_MAGIC = b"MNPA"
+INDEX_ENTRY = struct.Struct("<HIQI")
+TOMBSTONE = 0xFFFFFFFF
+
+
+class ArchiveLocation(typing.NamedTuple):
+    segment: int
+    offset: int
+    size: int
+
+
+class Archive:
+    def __init__(
+        self,
+        folder: pathlib.PosixPath,
+        *,
+        segment_size: int = 64 << 20,
+        compact_ratio: float = .5,
+        readonly: bool = False,
+    ):
+        self.folder = folder
+        self.segment_size = segment_size
+        self.compact_ratio = compact_ratio
+        self.readonly = readonly
+
+        self._index: dict[str, ArchiveLocation] = {}
+        self._maps: dict[int, mmap.mmap] = {}
+        self._files: dict[str, typing.BinaryIO] = {}
+
+        # reading never creates the folder or the index, a wrong path stays an error
+        if readonly and not folder.is_dir():
+            raise FileNotFoundError(folder)
+        if not readonly:
+            folder.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __enter__(self) -> "Archive":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def index_path(self) -> pathlib.PosixPath:
+        return self.folder / "index"
+
+    @property
+    def segments(self) -> list[int]:
+        return sorted(int(path.stem) for path in self.folder.glob("*.seg"))
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "records": len(self._index),
+            "segments": len(self.segments),
+            "live_bytes": sum(location.size for location in self._index.values()),
+            "total_bytes": sum(self.segment_path(segment).stat().st_size for segment in self.segments),
+        }
+
+    def close(self):
+        self.sync()
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+        for mapping in self._maps.values():
+            mapping.close()
+        self._maps.clear()
+
+    def compact(self):
+        # rewrite the live records into fresh segments, then swap the index in one rename
+        self._ensure_writable()
+        self.close()
+        segments, records = self.segments, dict(self._index)
+        self._index.clear()
+
+        temppath = self.index_path.with_name("index.tmp")
+        with open(temppath, "wb") as index_file:
+            self._files["index"] = index_file
+            self._open_segment((segments[-1] + 1) if segments else 0)
+            for key, location in records.items():
+                self._append(key, self._read(location), compact=False)
+            self.close()
+        os.replace(temppath, self.index_path)
+
+        for segment in segments:
+            self.segment_path(segment).unlink()
+        self._load_index()
+
+    def delete(self, key: str):
+        self._ensure_writable()
+        if self._index.pop(key, None) is not None:
+            self._write_index(key, ArchiveLocation(TOMBSTONE, 0, 0))
+
+    def get(self, key: str) -> bytes:
+        return self._read(self._index[key])
+
+    def keys(self) -> typing.KeysView[str]:
+        return self._index.keys()
+
+    def put(self, key: str, data: bytes):
+        self._append(key, data)
+        self._files["segment"].flush()
+        self._files["index"].flush()
+
+    def put_many(self, items: typing.Iterable[tuple[str, bytes]]) -> int:
+        # batch dumps only sync once at the end instead of per record
+        count = 0
+        for key, data in items:
+            self._append(key, data)
+            count += 1
+        self.sync()
+        return count
+
+    def segment_path(self, segment: int) -> pathlib.PosixPath:
+        return self.folder / f"{segment:05}.seg"
+
+    def sync(self):
+        for file in self._files.values():
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _append(self, key: str, data: bytes, compact: bool = True):
+        self._ensure_writable()
+        segment_file = self._files.get("segment")
+        if segment_file is None or segment_file.tell() >= self.segment_size:
+            segment_file = self._roll_segment(compact)
+
+        encoded = key.encode()
+        offset = segment_file.tell() + RECORD_HEADER.size + len(encoded)
+        segment_file.write(RECORD_HEADER.pack(RECORD_MAGIC, len(encoded), len(data), zlib.crc32(data)))
+        segment_file.write(encoded)
+        segment_file.write(data)
+
+        location = ArchiveLocation(int(pathlib.Path(segment_file.name).stem), offset, len(data))
+        self._index[key] = location
+        self._write_index(key, location)
+
+    def _ensure_writable(self):
+        if self.readonly:
+            raise PermissionError(f"{self.folder} is opened read-only")
+
+    def _load_index(self):
+        self._index.clear()
+        if not self.index_path.exists():
+            self._rebuild_index()
+            return
+
+        with open(self.index_path, "rb") as file:
+            content = file.read()
+        position = 0
+        while position + INDEX_ENTRY.size <= len(content):
+            key_size, segment, offset, size = INDEX_ENTRY.unpack_from(content, position)
+            position += INDEX_ENTRY.size
+            if position + key_size > len(content):
+                break
+            key = content[position:position + key_size].decode()
+            position += key_size
+            if segment == TOMBSTONE:
+                self._index.pop(key, None)
+            else:
+                self._index[key] = ArchiveLocation(segment, offset, size)
+
+    def _map(self, segment: int, end: int) -> mmap.mmap:
+        mapping = self._maps.get(segment)
+        if mapping is None or len(mapping) < end:
+            if mapping is not None:
+                mapping.close()
+            # the active segment keeps growing, it is remapped when a read passes its end
+            if "segment" in self._files:
+                self._files["segment"].flush()
+            with open(self.segment_path(segment), "rb") as file:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapping
+        return mapping
+
+    def _open_segment(self, segment: int) -> typing.BinaryIO:
+        if "segment" in self._files:
+            self._files.pop("segment").close()
+        if "index" not in self._files:
+            self._files["index"] = self.index_path.open("ab")
+        self._files["segment"] = self.segment_path(segment).open("ab")
+        return self._files["segment"]
+
+    def _read(self, location: ArchiveLocation) -> bytes:
+        end = location.offset + location.size
+        return self._map(location.segment, end)[location.offset:end]
+
+    def _rebuild_index(self):
+        # no index yet (or lost), recover it from the record headers in every segment
+        for segment in self.segments:
+            with open(self.segment_path(segment), "rb") as segment_file:
+                content = segment_file.read()
+            position = 0
+            while position + RECORD_HEADER.size <= len(content):
+                magic, key_size, size, checksum = RECORD_HEADER.unpack_from(content, position)
+                offset = position + RECORD_HEADER.size + key_size
+                if magic != RECORD_MAGIC or offset + size > len(content):
+                    break
+                if zlib.crc32(content[offset:offset + size]) == checksum:
+                    key = content[position + RECORD_HEADER.size:offset].decode()
+                    self._index[key] = ArchiveLocation(segment, offset, size)
+                position = offset + size
+
+        # a read-only archive keeps the recovered index in memory only
+        if self.readonly:
+            return
+        with open(self.index_path, "wb") as file:
+            self._files["index"] = file
+            for key, location in self._index.items():
+                self._write_index(key, location)
+            self._files.pop("index")
+
+    def _roll_segment(self, compact: bool) -> typing.BinaryIO:
+        segments = self.segments
+        if "segment" in self._files:
+            self._files["segment"].flush()
+            stats = self.stats
+            # periodic compaction, once the superseded records outweigh the ratio
+            if compact and stats["live_bytes"] < stats["total_bytes"] * (1 - self.compact_ratio):
+                self.compact()
+                segments = self.segments
+        elif segments and self.segment_path(segments[-1]).stat().st_size < self.segment_size:
+            return self._open_segment(segments[-1])
+        return self._open_segment((segments[-1] + 1) if segments else 0)
+
+    def _write_index(self, key: str, location: ArchiveLocation):
+        if "index" not in self._files:
+            self._files["index"] = self.index_path.open("ab")
+        encoded = key.encode()
+        self._files["index"].write(INDEX_ENTRY.pack(len(encoded), *location))
+        self._files["index"].write(encoded)
@@ -0,0 +1,168 @@
+import itertools
+import os
+import pathlib
+import pickle
+import threading
+import typing
+
+from .catalogs import SaveCatalog, SaveEntry
+from .codecs import CHUNK_SIZE, encode_stream
+
+
+class AutoSaverOptions(typing.NamedTuple):
+    turns: int
+    codec: str = "raw"
+    catalog: typing.Union[SaveCatalog, None] = None
+
+
+class SnapshotSlot:
+    # hands the newest snapshot to the writer thread, a newer one replaces the one still waiting
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.pending: typing.Union[tuple[bytes, typing.Union[dict[str, typing.Any], None]], None] = None
+        self.writing = False
+        self.closed = False
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def done(self):
+        with self.condition:
+            self.writing = False
+            self.condition.notify_all()
+
+    def put(self, snapshot: bytes, summary: typing.Union[dict[str, typing.Any], None]) -> bool:
+        with self.condition:
+            replaced = self.pending is not None
+            self.pending, self.closed = (snapshot, summary), False
+            self.condition.notify_all()
+            return replaced
+
+    def take(self) -> typing.Union[tuple[bytes, typing.Union[dict[str, typing.Any], None]], None]:
+        # waits for a snapshot, nothing once closed with every snapshot taken
+        with self.condition:
+            self.condition.wait_for(lambda: self.pending is not None or self.closed)
+            pending, self.pending = self.pending, None
+            self.writing = pending is not None
+            return pending
+
+    def wait_idle(self, timeout: typing.Union[float, None] = None) -> bool:
+        with self.condition:
+            return self.condition.wait_for(lambda: self.pending is None and not self.writing, timeout)
+
+
+class AutoSaver:
+    def __init__(
+        self,
+        folder: pathlib.PosixPath,
+        turns: int,
+        rotation: int,
+        *,
+        prefix: str = "_auto_saving_",
+        suffix: str = ".sav",
+        codec: str = "raw",
+        catalog: typing.Union[SaveCatalog, None] = None,
+    ):
+        self.options = AutoSaverOptions(turns, codec, catalog)
+        self.filepaths = [folder / f"{prefix}{index:02}{suffix}" for index in range(max(rotation, 1))]
+        self.stats = {"turns": 0, "captured": 0, "coalesced": 0, "written": 0}
+
+        self._slot = SnapshotSlot()
+        # created on the first write, once the previous run's files are known
+        self._rotation: typing.Union[typing.Iterator[pathlib.PosixPath], None] = None
+        self._thread: typing.Union[threading.Thread, None] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.options.turns > 0
+
+    def capture(self, board: typing.Any) -> bool:
+        if not self.enabled:
+            return False
+
+        self.stats["turns"] += 1
+        if self.stats["turns"] % self.options.turns:
+            return False
+
+        # the board keeps changing on the game thread, only the pickled bytes can leave it
+        self.submit(pickle.dumps(board), None if self.options.catalog is None else board.save_summary)
+        return True
+
+    def close(self, timeout: typing.Union[float, None] = None):
+        self.flush(timeout)
+        self._slot.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def flush(self, timeout: typing.Union[float, None] = None) -> bool:
+        return self._slot.wait_idle(timeout)
+
+    def submit(self, snapshot: bytes, summary: typing.Union[dict[str, typing.Any], None] = None):
+        # at most one write is in flight
+        if self._slot.put(snapshot, summary):
+            self.stats["coalesced"] += 1
+        self.stats["captured"] += 1
+
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="autosaver", daemon=True)
+            self._thread.start()
+
+    def write(
+        self,
+        snapshot: bytes,
+        summary: typing.Union[dict[str, typing.Any], None] = None,
+    ) -> pathlib.PosixPath:
+        folder = self.filepaths[0].parent
+        folder.mkdir(parents=True, exist_ok=True)
+        if self._rotation is None:
+            # resume the rotation from the missing or the oldest file left by a previous run
+            oldest = min(
+                self.filepaths,
+                key=lambda path: path.stat().st_mtime_ns if path.exists() else -1,
+            )
+            start = self.filepaths.index(oldest)
+            self._rotation = itertools.cycle(self.filepaths[start:] + self.filepaths[:start])
+        filepath = next(self._rotation)
+        temppath = filepath.with_name(f".{filepath.name}.tmp")
+
+        view = memoryview(snapshot)
+        with open(temppath, "wb") as file:
+            # compression runs here on the writer thread, streamed chunk by chunk into the file
+            for chunk in encode_stream(
+                (view[idx:idx + CHUNK_SIZE] for idx in range(0, len(view), CHUNK_SIZE)),
+                self.options.codec,
+            ):
+                file.write(chunk)
+            file.flush()
+            os.fsync(file.fileno())
+
+        # recorded before the save appears, with the mtime the rename keeps
+        if self.options.catalog is not None and summary is not None:
+            stat = temppath.stat()
+            self.options.catalog.record(SaveEntry(
+                name=filepath.name,
+                saved_at=stat.st_mtime,
+                size=stat.st_size,
+                **summary,
+            ))
+        os.replace(temppath, filepath)
+
+        # the rename itself is only durable after the folder entry is synced
+        descriptor = os.open(folder, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+        self.stats["written"] += 1
+        return filepath
+
+    def _run(self):
+        while (pending := self._slot.take()) is not None:
+            try:
+                self.write(*pending)
+            finally:
+                self._slot.done()
@@ -0,0 +1,106 @@
+import contextlib
+import datetime
+import pathlib
+import sqlite3
+import typing
+
+
+class SaveEntry(typing.NamedTuple):
+    name: str
+    players: str = ""
+    turns: int = 0
+    saved_at: float = 0.
+    size: int = 0
+    fixture_hash: str = ""
+
+    def __str__(self) -> str:
+        saved_at = datetime.datetime.fromtimestamp(self.saved_at)
+        return f"{self.name} ({self.players or '-'}, 第 {self.turns} 回合, {saved_at:%Y-%m-%d %H:%M})"
+
+
+class SaveCatalog:
+    SCHEMA: typing.ClassVar[tuple[str, ...]] = (
+        """
+        CREATE TABLE IF NOT EXISTS saves (
+            name TEXT PRIMARY KEY,
+            players TEXT NOT NULL,
+            turns INTEGER NOT NULL,
+            saved_at REAL NOT NULL,
+            size INTEGER NOT NULL,
+            fixture_hash TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS saves_saved_at ON saves (saved_at)",
+    )
+
+    def __init__(self, filepath: pathlib.PosixPath, timeout: float = 5.):
+        self.filepath = filepath
+        self.timeout = timeout
+        self.created = not filepath.exists()
+
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with self.connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+
+    @contextlib.contextmanager
+    def connect(self) -> typing.Generator[sqlite3.Connection, None, None]:
+        # one short-lived connection per call, the autosave thread records from its own thread
+        connection = sqlite3.connect(self.filepath, timeout=self.timeout)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def count(self, prefix: str = "") -> int:
+        with self.connect() as connection:
+            return connection.execute(
+                f"SELECT COUNT(*) FROM saves WHERE {self._prefix_clause(prefix)}",
+                self._prefix_params(prefix),
+            ).fetchone()[0]
+
+    def get(self, name: str) -> typing.Union[SaveEntry, None]:
+        with self.connect() as connection:
+            row = connection.execute("SELECT * FROM saves WHERE name = ?", (name,)).fetchone()
+        return None if row is None else SaveEntry(*row)
+
+    def reconcile(self, filepaths: typing.Iterable[pathlib.PosixPath]) -> int:
+        # a save whose row never got written, or was written before the save last changed, is indexed from stat()
+        # and a row whose save is gone is dropped, so a crash between the two writes never lasts
+        with self.connect() as connection:
+            saved_at = dict(connection.execute("SELECT name, saved_at FROM saves").fetchall())
+            stale = []
+            for filepath in filepaths:
+                stat = filepath.stat()
+                if saved_at.pop(filepath.name, -1.) < stat.st_mtime:
+                    stale.append(SaveEntry(name=filepath.name, saved_at=stat.st_mtime, size=stat.st_size))
+            connection.executemany("INSERT OR REPLACE INTO saves VALUES (?, ?, ?, ?, ?, ?)", stale)
+            connection.executemany("DELETE FROM saves WHERE name = ?", ((name,) for name in saved_at))
+        return len(stale) + len(saved_at)
+
+    def record(self, entry: SaveEntry):
+        with self.connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO saves VALUES (?, ?, ?, ?, ?, ?)", entry)
+
+    def remove(self, name: str):
+        with self.connect() as connection:
+            connection.execute("DELETE FROM saves WHERE name = ?", (name,))
+
+    def search(self, prefix: str = "", page: int = 0, per_page: int = 20) -> list[SaveEntry]:
+        with self.connect() as connection:
+            rows = connection.execute(
+                f"SELECT * FROM saves WHERE {self._prefix_clause(prefix)} ORDER BY name LIMIT ? OFFSET ?",
+                (*self._prefix_params(prefix), per_page, max(page, 0) * per_page),
+            ).fetchall()
+        return [SaveEntry(*row) for row in rows]
+
+    @staticmethod
+    def _prefix_clause(prefix: str) -> str:
+        # a range on the primary key instead of LIKE, which would scan without the index
+        return "name >= ? AND name < ?" if prefix else "1 = 1"
+
+    @staticmethod
+    def _prefix_params(prefix: str) -> tuple[str, ...]:
+        return (prefix, f"{prefix}\U0010ffff") if prefix else ()
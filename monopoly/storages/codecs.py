@@ -0,0 +1,179 @@
+import bz2
+import lzma
+import struct
+import typing
+import zlib
+
+CODEC_HEADER = struct.Struct("<4sBI")
+CODEC_MAGIC = b"MNPZ"
+CHUNK_SIZE = 1 << 20
+# what each decompressor raises on damaged data, bz2 reports it as OSError
+CODEC_ERRORS = (EOFError, OSError, lzma.LZMAError, zlib.error)
+# zlib-dict snapshots name their dictionary version in the header, a shipped version never changes
+DICTIONARY_VERSION = 1
+DICTIONARIES: dict[int, bytes] = {
+    1: b"".join((
+        b"monopoly.constants", b"Area", b"CardType", b"StockType", b"monopoly.models.hashes", b"StateHash",
+        b"monopoly.models.equipments.cards", b"monopoly.models.equipments.spaces", b"BoardSpace", b"LandSpace",
+        b"monopoly.models.properties.lands", b"Land", b"Ocean", b"land_price", b"house_price", b"buildable",
+        b"monopoly.models.properties.stocks", b"Stock", b"ETF", b"ETF.Constituent", b"constituents", b"percent",
+        b"filters", b"weighting", b"rebalance_interval", b"openings", b"expense_ratio", b"transfer_tax",
+        b"histories", b"spread", b"amount", b"earning", b"payment", b"payout_ratio", b"esg_ratio", b"beta",
+        b"monopoly.models.equipments.players", b"Player", b"PlayerLand", b"PlayerStock", b"cash", b"incoming",
+        b"bankruptcy", b"surrender", b"moving_point", b"can_free_tolling", b"can_three_dices", b"unmovable",
+        b"monopoly.models.boards", b"Board", b"BoardPlayer", b"start_player", b"current_player", b"start_space",
+        b"fixture_hash", b"backwards", b"forwards", b"state_hash", b"has_owner", b"tolls", b"lands", b"stocks",
+        b"players", b"spaces", b"__private_attribute_values__", b"__fields_set__", b"__dict__",
+    )),
+}
+
+
+class _IdentityStream:
+    def compress(self, data: bytes) -> bytes:
+        return bytes(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return bytes(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class Codec(typing.NamedTuple):
+    id: int
+    name: str
+    compressor: typing.Callable[[bytes], typing.Any]
+    decompressor: typing.Callable[[bytes], typing.Any]
+    dictionary: bool = False
+
+
+CODECS: dict[str, Codec] = {
+    codec.name: codec
+    for codec in (
+        Codec(0, "raw", lambda _: _IdentityStream(), lambda _: _IdentityStream()),
+        Codec(1, "zlib", lambda _: zlib.compressobj(6), lambda _: zlib.decompressobj()),
+        Codec(
+            2,
+            "zlib-dict",
+            lambda zdict: zlib.compressobj(9, zdict=zdict),
+            lambda zdict: zlib.decompressobj(zdict=zdict),
+            dictionary=True,
+        ),
+        Codec(3, "lzma", lambda _: lzma.LZMACompressor(preset=6), lambda _: lzma.LZMADecompressor()),
+        Codec(4, "bz2", lambda _: bz2.BZ2Compressor(9), lambda _: bz2.BZ2Decompressor()),
+    )
+}
+
+
+def get_dictionary(version: int) -> bytes:
+    try:
+        return DICTIONARIES[version]
+    except KeyError as error:
+        raise ValueError(f"dictionary version {version} mismatched") from error
+
+
+def get_codec(name: str) -> Codec:
+    try:
+        return CODECS[name]
+    except KeyError as error:
+        raise ValueError(f"unknown codec {name}") from error
+
+
+class StreamEncoder:
+    def __init__(self, codec: str):
+        self.codec = get_codec(codec)
+        version = DICTIONARY_VERSION if self.codec.dictionary else 0
+        dictionary = get_dictionary(version) if self.codec.dictionary else b""
+        # raw output stays a plain pickle, readable without this module
+        self.header = b"" if self.codec.name == "raw" else CODEC_HEADER.pack(CODEC_MAGIC, self.codec.id, version)
+        self._stream = self.codec.compressor(dictionary)
+
+    def flush(self) -> bytes:
+        return self._stream.flush()
+
+    def write(self, data: bytes) -> bytes:
+        return self._stream.compress(data)
+
+
+class StreamDecoder:
+    def __init__(self):
+        self._buffer = b""
+        self._stream = None
+
+    def flush(self) -> bytes:
+        if self._stream is None:
+            # never saw a header, the input was a plain uncompressed pickle
+            data, self._buffer = self._buffer, b""
+            return data
+        flush = getattr(self._stream, "flush", None)
+        try:
+            return b"" if flush is None else flush()
+        except CODEC_ERRORS as error:
+            raise ValueError(f"damaged data: {error}") from error
+
+    def write(self, data: bytes) -> bytes:
+        if self._stream is not None:
+            return self._decompress(data)
+
+        self._buffer += data
+        if len(self._buffer) < CODEC_HEADER.size:
+            return b""
+        if not self._buffer.startswith(CODEC_MAGIC):
+            self._stream = _IdentityStream()
+        else:
+            _, codec_id, version = CODEC_HEADER.unpack_from(self._buffer)
+            codec = next((codec for codec in CODECS.values() if codec.id == codec_id), None)
+            if codec is None:
+                raise ValueError(f"unknown codec id {codec_id}")
+
+            dictionary = get_dictionary(version) if codec.dictionary else b""
+            self._stream = codec.decompressor(dictionary)
+            self._buffer = self._buffer[CODEC_HEADER.size:]
+
+        data, self._buffer = self._buffer, b""
+        return self._decompress(data)
+
+    def _decompress(self, data: bytes) -> bytes:
+        try:
+            return self._stream.decompress(data)
+        except CODEC_ERRORS as error:
+            raise ValueError(f"damaged data: {error}") from error
+
+
+def encode(data: bytes, codec: str) -> bytes:
+    encoder = StreamEncoder(codec)
+    view = memoryview(data)
+    return b"".join((
+        encoder.header,
+        *(encoder.write(view[idx:idx + CHUNK_SIZE]) for idx in range(0, len(view), CHUNK_SIZE)),
+        encoder.flush(),
+    ))
+
+
+def decode(data: bytes) -> bytes:
+    # saves written before the codec layer are raw pickles without the header
+    if data[:len(CODEC_MAGIC)] != CODEC_MAGIC:
+        return data
+
+    decoder = StreamDecoder()
+    return decoder.write(data) + decoder.flush()
+
+
+def encode_stream(chunks: typing.Iterable[bytes], codec: str) -> typing.Generator[bytes, None, None]:
+    encoder = StreamEncoder(codec)
+    if encoder.header:
+        yield encoder.header
+    for chunk in chunks:
+        if data := encoder.write(chunk):
+            yield data
+    if data := encoder.flush():
+        yield data
+
+
+def decode_stream(chunks: typing.Iterable[bytes]) -> typing.Generator[bytes, None, None]:
+    decoder = StreamDecoder()
+    for chunk in chunks:
+        if data := decoder.write(chunk):
+            yield data
+    if data := decoder.flush():
+        yield data
@@ -0,0 +1,180 @@
+import pathlib
+import sqlite3
+import typing
+
+RESULT_TABLES: dict[str, tuple[str, ...]] = {
+    "games": ("game_id", "seed", "turns", "finished", "winner", "winner_seat", "players"),
+    "players": (
+        "game_id", "seat", "name", "cash", "property_worth", "stock_worth",
+        "net_worth", "bankruptcy", "surrender",
+    ),
+    "ownerships": ("game_id", "land_id", "area", "seat", "start_turn", "end_turn", "invested", "tolls"),
+    "prices": ("game_id", "turn", "stock_id", "value"),
+}
+
+RESULT_SCHEMA: tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS games (
+        game_id TEXT PRIMARY KEY,
+        seed INTEGER NOT NULL,
+        turns INTEGER NOT NULL,
+        finished INTEGER NOT NULL,
+        winner TEXT NOT NULL,
+        winner_seat INTEGER NOT NULL,
+        players INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS players (
+        game_id TEXT NOT NULL,
+        seat INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        cash INTEGER NOT NULL,
+        property_worth INTEGER NOT NULL,
+        stock_worth INTEGER NOT NULL,
+        net_worth INTEGER NOT NULL,
+        bankruptcy INTEGER NOT NULL,
+        surrender INTEGER NOT NULL,
+        PRIMARY KEY (game_id, seat)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS ownerships (
+        game_id TEXT NOT NULL,
+        land_id TEXT NOT NULL,
+        area TEXT NOT NULL,
+        seat INTEGER NOT NULL,
+        start_turn INTEGER NOT NULL,
+        end_turn INTEGER NOT NULL,
+        invested INTEGER NOT NULL,
+        tolls INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS prices (
+        game_id TEXT NOT NULL,
+        turn INTEGER NOT NULL,
+        stock_id TEXT NOT NULL,
+        value INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS games_winner_seat ON games (winner_seat, players)",
+    "CREATE INDEX IF NOT EXISTS players_seat ON players (seat)",
+    "CREATE INDEX IF NOT EXISTS ownerships_area ON ownerships (area)",
+    "CREATE INDEX IF NOT EXISTS ownerships_game ON ownerships (game_id, land_id)",
+    "CREATE INDEX IF NOT EXISTS prices_stock ON prices (stock_id, turn)",
+    "CREATE INDEX IF NOT EXISTS prices_game ON prices (game_id)",
+)
+
+RESULT_QUERIES: dict[str, str] = {
+    "win-rate": """
+        SELECT players.seat, COUNT(*) AS games, SUM(games.winner_seat = players.seat) AS wins,
+               ROUND(AVG(games.winner_seat = players.seat), 4) AS win_rate
+        FROM players JOIN games USING (game_id)
+        GROUP BY players.seat ORDER BY players.seat
+    """,
+    "roi": """
+        SELECT area, COUNT(*) AS holdings, SUM(invested) AS invested, SUM(tolls) AS tolls,
+               ROUND(CAST(SUM(tolls) AS REAL) / SUM(invested), 4) AS roi,
+               ROUND(AVG(end_turn - start_turn), 2) AS held_turns
+        FROM ownerships
+        GROUP BY area ORDER BY roi DESC
+    """,
+    "lands": """
+        SELECT land_id, area, COUNT(*) AS holdings, SUM(tolls) AS tolls,
+               ROUND(CAST(SUM(tolls) AS REAL) / SUM(invested), 4) AS roi
+        FROM ownerships
+        GROUP BY land_id ORDER BY roi DESC
+    """,
+    "turns": """
+        SELECT finished, COUNT(*) AS games, MIN(turns) AS min_turns,
+               ROUND(AVG(turns), 2) AS avg_turns, MAX(turns) AS max_turns
+        FROM games
+        GROUP BY finished
+    """,
+    "net-worth": """
+        SELECT seat, COUNT(*) AS games, ROUND(AVG(net_worth), 2) AS avg_net_worth,
+               SUM(bankruptcy) AS bankruptcies
+        FROM players
+        GROUP BY seat ORDER BY seat
+    """,
+}
+
+
+class ResultStore:
+    def __init__(self, filepath: typing.Union[pathlib.PosixPath, str], batch_size: int = 1000):
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(filepath)
+        self._pending: dict[str, list[tuple]] = {table: [] for table in RESULT_TABLES}
+        self._games: set[str] = set()
+
+        # batches of simulations only need the results to survive a crash of this process
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            for statement in RESULT_SCHEMA:
+                self.connection.execute(statement)
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        return sum(map(len, self._pending.values()))
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def flush(self):
+        with self.connection:
+            # a game recorded again replaces every row it had, ownerships and prices have no key to replace by
+            for table in RESULT_TABLES:
+                if table != "games":
+                    self.connection.executemany(
+                        f"DELETE FROM {table} WHERE game_id = ?",
+                        ((game_id,) for game_id in self._games),
+                    )
+            self._games.clear()
+            for table, rows in self._pending.items():
+                if rows:
+                    columns = RESULT_TABLES[table]
+                    self.connection.executemany(
+                        f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+                        f"VALUES ({', '.join('?' * len(columns))})",
+                        rows,
+                    )
+                    rows.clear()
+
+    def query(self, name: str) -> tuple[tuple[str, ...], list[tuple]]:
+        cursor = self.connection.execute(RESULT_QUERIES[name])
+        return tuple(column[0] for column in cursor.description), cursor.fetchall()
+
+    def record(self, result: typing.Any):
+        if result.game_id in self._games:
+            self.flush()
+        self._games.add(result.game_id)
+        seats = {name: seat for seat, name, *_ in result.players}
+        self._pending["games"].append((
+            result.game_id,
+            result.seed,
+            result.turns,
+            result.finished,
+            result.winner,
+            seats[result.winner],
+            len(result.players),
+        ))
+        self._pending["players"].extend(
+            (result.game_id, seat, name, cash, property_worth, stock_worth, net_worth,
+             bankruptcy == "True", surrender == "True")
+            for seat, name, cash, property_worth, stock_worth, net_worth, bankruptcy, surrender
+            in result.players
+        )
+        self._pending["ownerships"].extend((result.game_id, *ownership) for ownership in result.ownerships)
+        self._pending["prices"].extend((result.game_id, *price) for price in result.prices)
+
+        if self.pending >= self.batch_size:
+            self.flush()
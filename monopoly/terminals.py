@@ -0,0 +1,104 @@
+import abc
+import contextlib
+import io
+import sys
+import threading
+import typing
+
+_local = threading.local()
+
+
+# The game only talks through print() and input(), so a terminal replaces both per thread
+class BaseTerminal(abc.ABC):
+    @abc.abstractmethod
+    def flush(self):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def readline(self) -> str:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def write(self, text: str) -> int:
+        raise NotImplementedError
+
+
+class TerminalStream:
+    def __init__(self, stream: typing.TextIO):
+        self.stream = stream
+
+    @property
+    def terminal(self) -> typing.Union[BaseTerminal, None]:
+        return getattr(_local, "terminal", None)
+
+    def fileno(self) -> int:
+        # input() only falls back to readline() when the stream has no file descriptor
+        if self.terminal is not None:
+            raise io.UnsupportedOperation("fileno")
+        return self.stream.fileno()
+
+    def flush(self):
+        terminal = self.terminal
+        if terminal is None:
+            return self.stream.flush()
+        return terminal.flush()
+
+    def isatty(self) -> bool:
+        if self.terminal is not None:
+            return False
+        return self.stream.isatty()
+
+    def readline(self, *args) -> str:
+        terminal = self.terminal
+        if terminal is None:
+            return self.stream.readline(*args)
+        return terminal.readline()
+
+    def write(self, text: str) -> int:
+        terminal = self.terminal
+        if terminal is None:
+            return self.stream.write(text)
+        return terminal.write(text)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self.stream, name)
+
+
+class StreamInstaller:
+    # sys.stdin and sys.stdout stay swapped while any thread has a terminal attached
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.attached = 0
+
+    def install(self):
+        with self.lock:
+            # check the streams themselves, someone else (e.g. pytest) may have swapped them meanwhile
+            if not isinstance(sys.stdin, TerminalStream):
+                sys.stdin = TerminalStream(sys.stdin)
+            if not isinstance(sys.stdout, TerminalStream):
+                sys.stdout = TerminalStream(sys.stdout)
+            self.attached += 1
+
+    def uninstall(self):
+        with self.lock:
+            self.attached -= 1
+            if self.attached == 0:
+                if isinstance(sys.stdin, TerminalStream):
+                    sys.stdin = sys.stdin.stream
+                if isinstance(sys.stdout, TerminalStream):
+                    sys.stdout = sys.stdout.stream
+
+
+_installer = StreamInstaller()
+
+
+@contextlib.contextmanager
+def attach(terminal: BaseTerminal) -> typing.Generator[BaseTerminal, None, None]:
+    _installer.install()
+    previous = getattr(_local, "terminal", None)
+    _local.terminal = terminal
+    try:
+        yield terminal
+    finally:
+        _local.terminal = previous
+        _installer.uninstall()
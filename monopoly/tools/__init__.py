@@ -0,0 +1,12 @@
+import typing
+
+
+def print_table(columns: typing.Sequence[str], rows: typing.Sequence[typing.Sequence[typing.Any]]):
+    # right aligned, every column as wide as its widest value
+    widths = [
+        max(len(str(value)) for value in (column, *(row[idx] for row in rows)))
+        for idx, column in enumerate(columns)
+    ]
+    print("  ".join(f"{column:>{width}}" for column, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(f"{str(value):>{width}}" for value, width in zip(row, widths)))
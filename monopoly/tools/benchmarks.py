@@ -0,0 +1,252 @@
+import argparse
+import contextlib
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import typing
+
+from monopoly import terminals
+from monopoly.loaders import BoardSpec, FixtureLoader, GeneratedLoader
+from monopoly.models.boards import Board
+from monopoly.simulations import BotTerminal, simulate_game
+from monopoly.viewers import BoardViewer
+
+
+class Benchmark(typing.NamedTuple):
+    name: str
+    run: typing.Callable[[typing.Any], typing.Any]
+    setup: typing.Callable[[typing.Union[BoardSpec, None]], typing.ContextManager]
+    number: int
+    # whether it runs on generated boards of any size, not only the fixtures
+    sized: bool = True
+
+
+class BenchmarkResult(typing.NamedTuple):
+    seconds: float
+    median: float
+    number: int
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+# Declines every prompt, so hot paths that ask questions never block or buy anything
+class _DecliningTerminal(terminals.BaseTerminal):
+    def flush(self):
+        pass
+
+    def readline(self) -> str:
+        return "C\n"
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def load_board(spec: typing.Union[BoardSpec, None] = None) -> Board:
+    with terminals.attach(BotTerminal(("bot1", "bot2"))):
+        board = FixtureLoader().execute() if spec is None else GeneratedLoader().execute(spec=spec)
+    board.start()
+    return board
+
+
+@contextlib.contextmanager
+def board_setup(spec: typing.Union[BoardSpec, None] = None) -> typing.Generator[Board, None, None]:
+    board = load_board(spec)
+    with terminals.attach(_DecliningTerminal()):
+        yield board
+
+
+@contextlib.contextmanager
+def owner_setup(spec: typing.Union[BoardSpec, None] = None) -> typing.Generator[Board, None, None]:
+    with board_setup(spec) as board:
+        player = board.current_player.player
+        for land in list(board.lands.values())[::3]:
+            land.buying(player, board, is_free=True)
+        for stock in list(board.stocks.values())[::4]:
+            player.get_or_create_player_stock(stock).increase()
+        yield board
+
+
+@contextlib.contextmanager
+def saving_setup(
+    spec: typing.Union[BoardSpec, None] = None,
+) -> typing.Generator[tuple[Board, pathlib.PosixPath], None, None]:
+    # saves, and the catalog entries they record, stay in a throwaway folder
+    save_folder = Board.SAVE_FOLDER
+    with tempfile.TemporaryDirectory() as folder, owner_setup(spec) as board:
+        Board.SAVE_FOLDER = folder
+        try:
+            filepath = Board.get_save_folder() / f"_benchmark{Board.SAVE_SUFFIX}"
+            board.saving(filepath)
+            yield board, filepath
+        finally:
+            Board.SAVE_FOLDER = save_folder
+
+
+def benchmark(
+    name: str,
+    *,
+    number: int,
+    setup: typing.Callable[[typing.Union[BoardSpec, None]], typing.ContextManager] = contextlib.nullcontext,
+    sized: bool = True,
+) -> typing.Callable:
+    def decorator(func: typing.Callable) -> typing.Callable:
+        BENCHMARKS[name] = Benchmark(name, func, setup, number, sized)
+        return func
+    return decorator
+
+
+@benchmark("loader.execute", number=20)
+def bench_loader_execute(spec: typing.Union[BoardSpec, None]):
+    load_board(spec)
+
+
+@benchmark("board.start", number=1000, setup=board_setup)
+def bench_board_start(board: Board):
+    board.players.clear()
+    board.start()
+
+
+@benchmark("player.moving", number=20, setup=board_setup)
+def bench_player_moving(board: Board):
+    # one lap over the whole ring, every pass_by and the final arrive included
+    spaces, space = 1, board.start_space.forwards[0]
+    while space != board.start_space:
+        spaces, space = spaces + 1, space.forwards[0]
+    board.current_player.moving(spaces)
+
+
+@benchmark("land.tolling_value", number=200, setup=owner_setup)
+def bench_land_tolling_value(board: Board):
+    for credential in board.ownership.credentials:
+        _ = credential.tolling_value
+
+
+@benchmark("board.opening_stocks", number=50, setup=board_setup)
+def bench_board_opening_stocks(board: Board):
+    board.opening_stocks()
+
+
+@benchmark("player.net_worth", number=1000, setup=owner_setup)
+def bench_player_net_worth(board: Board):
+    _ = board.current_player.player.net_worth
+
+
+@benchmark("viewer.view", number=50, setup=owner_setup)
+def bench_viewer_view(board: Board):
+    BoardViewer(board).view()
+
+
+@benchmark("board.saving", number=20, setup=saving_setup)
+def bench_board_saving(context: tuple[Board, pathlib.PosixPath]):
+    board, filepath = context
+    board.saving(filepath)
+
+
+@benchmark("board.loading", number=20, setup=saving_setup)
+def bench_board_loading(context: tuple[Board, pathlib.PosixPath]):
+    _, filepath = context
+    Board.loading(filepath)
+
+
+@benchmark("game.headless", number=1, sized=False)
+def bench_game_headless(_: None):
+    simulate_game(0, max_turns=200)
+
+
+def run_benchmark(
+    bench: Benchmark,
+    repeat: int = 5,
+    number: typing.Union[int, None] = None,
+    spec: typing.Union[BoardSpec, None] = None,
+) -> BenchmarkResult:
+    number = number or bench.number
+    timings = []
+    for _ in range(repeat):
+        with bench.setup(spec) as context:
+            started = time.perf_counter()
+            for _ in range(number):
+                bench.run(context)
+            timings.append((time.perf_counter() - started) / number)
+    return BenchmarkResult(min(timings), statistics.median(timings), number)
+
+
+def run_benchmarks(
+    names: typing.Union[typing.Iterable[str], None] = None,
+    repeat: int = 5,
+    number: typing.Union[int, None] = None,
+    spec: typing.Union[BoardSpec, None] = None,
+) -> dict[str, BenchmarkResult]:
+    # a generated board keys its results by size, so one baseline holds the whole sweep
+    return {
+        name if spec is None else f"{name}@{spec.spaces}": run_benchmark(BENCHMARKS[name], repeat, number, spec)
+        for name in (names or BENCHMARKS)
+        if spec is None or BENCHMARKS[name].sized
+    }
+
+
+def compare(
+    results: dict[str, BenchmarkResult],
+    baseline: dict[str, typing.Any],
+    threshold: float = .2,
+) -> list[tuple[str, float, float]]:
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get("benchmarks", {}).get(name)
+        if expected is not None and result.seconds > expected["seconds"] * (1 + threshold):
+            regressions.append((name, expected["seconds"], result.seconds))
+    return regressions
+
+
+def dump(results: dict[str, BenchmarkResult]) -> dict[str, typing.Any]:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": {
+            name: {"seconds": result.seconds, "median": result.median, "number": result.number}
+            for name, result in results.items()
+        },
+    }
+
+
+def main(argv: typing.Union[typing.Sequence[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(description="量測遊戲主要流程的效能")
+    parser.add_argument("names", nargs="*", help=", ".join(BENCHMARKS))
+    parser.add_argument("--repeat", default=5, type=int)
+    parser.add_argument("--save", type=pathlib.Path, help="將結果存成 JSON 基準")
+    parser.add_argument("--compare", type=pathlib.Path, help="與 JSON 基準比較，變慢超過門檻即失敗")
+    parser.add_argument("--threshold", default=.2, type=float)
+    parser.add_argument("--spaces", action="append", type=int, help="改用產生的盤面，可重複指定以掃過多種格數")
+    parser.add_argument("--seed", default=0, type=int, help="產生盤面的亂數種子")
+    args = parser.parse_args(argv)
+    if unknown := set(args.names) - set(BENCHMARKS):
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for spaces in args.spaces or (None,):
+        spec = None if spaces is None else BoardSpec.scaled(spaces, args.seed)
+        results.update(run_benchmarks(args.names, args.repeat, spec=spec))
+        # a baseline never has their @N entries, so say so instead of dropping them quietly
+        if spec is not None and (skipped := [name for name in args.names or BENCHMARKS if not BENCHMARKS[name].sized]):
+            print(f"{spaces} 格的盤面不量測: {', '.join(skipped)}", file=sys.stderr)
+    for name, result in results.items():
+        print(f"{name:<32}{result.seconds * 1e6:>14.1f} us{result.median * 1e6:>14.1f} us (x{result.number})")
+
+    if args.save is not None:
+        args.save.write_text(json.dumps(dump(results), indent=2), encoding="utf-8")
+
+    if args.compare is not None:
+        regressions = compare(results, json.loads(args.compare.read_text(encoding="utf-8")), args.threshold)
+        for name, expected, current in regressions:
+            print(f"{name} 變慢 {current / expected - 1:.1%} ({expected * 1e6:.1f} -> {current * 1e6:.1f} us)")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
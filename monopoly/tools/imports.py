@@ -0,0 +1,89 @@
+import argparse
+import subprocess
+import sys
+import typing
+
+from monopoly.constants import BASE_DIR
+
+
+class ImportTiming(typing.NamedTuple):
+    module: str
+    own: int
+    cumulative: int
+
+
+# agreed cumulative microseconds of `python -X importtime -c "import <module>"`, from bytecode already cached
+IMPORT_BUDGETS: dict[str, int] = {
+    "run.py": 50_000,
+    "monopoly": 50_000,
+    "monopoly.simulations": 600_000,
+    "monopoly.engines": 800_000,
+}
+# modules that must stay out of an import, whatever it costs today
+IMPORT_EXCLUSIONS: dict[str, tuple[str, ...]] = {
+    "run.py": ("asyncio", "multiprocessing", "pydantic", "sqlite3", "monopoly.engines", "monopoly.models"),
+    "monopoly": ("pydantic", "monopoly.engines", "monopoly.models"),
+    "monopoly.engines": ("asyncio", "multiprocessing", "monopoly.servers"),
+    "monopoly.simulations": ("asyncio", "monopoly.engines", "monopoly.servers"),
+}
+# scripts measured by what they import up to their argument parsing, the script itself is not a module
+ENTRY_POINTS: dict[str, tuple[str, ...]] = {
+    "run.py": ("run.py", "--help"),
+}
+
+
+def measure_imports(module: str, repeat: int = 3) -> dict[str, ImportTiming]:
+    # the fastest of a few fresh interpreters, every module keeps its best run
+    timings: dict[str, ImportTiming] = {}
+    for _ in range(repeat):
+        process = subprocess.run(
+            (sys.executable, "-X", "importtime", *ENTRY_POINTS.get(module, ("-c", f"import {module}"))),
+            capture_output=True, check=True, cwd=BASE_DIR, text=True,
+        )
+        # interpreter startup ends with site, only the top level imports after it belong to an entry point
+        started, total = False, 0
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+
+            own, cumulative, name = line.removeprefix("import time:").split("|")
+            timing = ImportTiming(name.strip(), int(own), int(cumulative))
+            if timing.module not in timings or timing.cumulative < timings[timing.module].cumulative:
+                timings[timing.module] = timing
+            if name.startswith("  "):
+                continue
+            if started:
+                total += timing.cumulative
+            started = started or timing.module == "site"
+
+        if module in ENTRY_POINTS and (module not in timings or total < timings[module].cumulative):
+            timings[module] = ImportTiming(module, 0, total)
+    return timings
+
+
+def main(argv: typing.Union[typing.Sequence[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(description="量測匯入模組的時間")
+    parser.add_argument("modules", nargs="*", help=", ".join(IMPORT_BUDGETS))
+    parser.add_argument("--repeat", default=3, type=int)
+    parser.add_argument("--top", default=10, type=int, help="列出自身匯入最久的模組數量")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules or IMPORT_BUDGETS:
+        timings = measure_imports(module, args.repeat)
+        print(f"{module:<40}{timings[module].cumulative:>12,} us")
+        for timing in sorted(timings.values(), key=lambda timing: timing.own, reverse=True)[:args.top]:
+            print(f"  {timing.module:<38}{timing.own:>12,} us")
+
+        budget = IMPORT_BUDGETS.get(module)
+        if budget is not None and timings[module].cumulative > budget:
+            print(f"{module} 超出匯入時間預算 {budget:,} us", file=sys.stderr)
+            failed = True
+        if excluded := sorted(set(IMPORT_EXCLUSIONS.get(module, ())) & set(timings)):
+            print(f"{module} 不應匯入 {', '.join(excluded)}", file=sys.stderr)
+            failed = True
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import argparse
+import collections
+import enum
+import pickle
+import sys
+import tracemalloc
+import types
+import typing
+
+import pydantic
+
+from monopoly.models.boards import Board
+from monopoly.simulations import simulate_game
+
+from .benchmarks import load_board
+
+# classes, enum members and modules are shared by every board, never retained by one
+SHARED_TYPES = (type, enum.Enum, types.ModuleType, types.FunctionType, types.MethodType)
+
+
+class Footprint(typing.NamedTuple):
+    objects: int
+    size: int
+
+
+# agreed getsizeof bytes of a two-player board by turns played, about 20% above today's size
+MEMORY_BUDGETS: dict[int, int] = {
+    0: 320_000,
+    200: 360_000,
+}
+
+
+def build_board(turns: int = 0, seed: int = 0, players: int = 2) -> Board:
+    if turns <= 0:
+        return load_board()
+    result = simulate_game(seed, players=players, max_turns=turns, snapshot=True)
+    return pickle.loads(result.snapshot)
+
+
+def measure_allocations(factory: typing.Callable[[], typing.Any]) -> tuple[typing.Any, int]:
+    # bytes still allocated once the factory returns, transient buffers excluded
+    started = tracemalloc.is_tracing()
+    if not started:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = factory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not started:
+            tracemalloc.stop()
+    return result, sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def measure_board(board: Board) -> dict[str, Footprint]:
+    # every container and value is charged to the nearest model holding it
+    objects: collections.Counter = collections.Counter()
+    sizes: collections.Counter = collections.Counter()
+    seen: set[int] = set()
+    stack: list[tuple[typing.Any, str]] = [(board, type(board).__name__)]
+    while stack:
+        obj, owner = stack.pop()
+        if id(obj) in seen or isinstance(obj, SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+
+        children: typing.Iterable = ()
+        if isinstance(obj, pydantic.BaseModel):
+            owner = type(obj).__name__
+            objects[owner] += 1
+            children = [obj.__dict__, obj.__fields_set__, *(
+                getattr(obj, name, None) for name in obj.__private_attributes__
+            )]
+        elif isinstance(obj, dict):
+            children = [*obj.keys(), *obj.values()]
+        elif isinstance(obj, (frozenset, list, set, tuple)):
+            children = obj
+
+        sizes[owner] += sys.getsizeof(obj)
+        stack.extend((child, owner) for child in children)
+
+    return {
+        name: Footprint(objects[name], size)
+        for name, size in sorted(sizes.items(), key=lambda item: -item[1])
+    }
+
+
+def main(argv: typing.Union[typing.Sequence[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(description="量測主板各類型模型佔用的記憶體")
+    parser.add_argument("--turns", default=0, type=int, help="先以電腦玩家進行的回合數")
+    parser.add_argument("--seed", default=0, type=int)
+    parser.add_argument("--players", default=2, type=int)
+    args = parser.parse_args(argv)
+
+    if args.turns > 0:
+        # unpickling a played board measures what it retains, not what the game allocated
+        snapshot = pickle.dumps(build_board(args.turns, args.seed, args.players))
+        board, allocated = measure_allocations(lambda: pickle.loads(snapshot))
+    else:
+        board, allocated = measure_allocations(load_board)
+
+    footprints = measure_board(board)
+    total = sum(footprint.size for footprint in footprints.values())
+    print(f"{'type':<26}{'objects':>10}{'bytes':>12}")
+    for name, footprint in footprints.items():
+        print(f"{name:<26}{footprint.objects:>10}{footprint.size:>12,}")
+    print(f"{'total':<26}{sum(fp.objects for fp in footprints.values()):>10}{total:>12,}")
+    print(f"{'tracemalloc':<26}{'':>10}{allocated:>12,}")
+
+    budget = MEMORY_BUDGETS.get(args.turns)
+    if budget is not None and total > budget:
+        print(f"超出記憶體預算 {budget:,} bytes", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
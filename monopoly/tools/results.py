@@ -0,0 +1,29 @@
+import argparse
+import pathlib
+import sys
+import typing
+
+from monopoly.storages import RESULT_QUERIES, ResultStore
+
+from . import print_table
+
+
+def main(argv: typing.Union[typing.Sequence[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(description="查詢模擬遊戲的平衡數據")
+    parser.add_argument("database", type=pathlib.Path)
+    parser.add_argument("query", choices=tuple(RESULT_QUERIES))
+    args = parser.parse_args(argv)
+
+    if not args.database.exists():
+        print(f"{args.database} 不存在", file=sys.stderr)
+        return 1
+
+    with ResultStore(args.database) as store:
+        columns, rows = store.query(args.query)
+
+    print_table(columns, rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+import argparse
+import pathlib
+import sys
+import time
+import typing
+
+from monopoly.models.boards import Board
+from monopoly.storages import CODECS, decode, encode
+
+
+class CodecReport(typing.NamedTuple):
+    codec: str
+    size: int
+    ratio: float
+    encode_seconds: float
+    decode_seconds: float
+
+    def estimate(self, disk_speed: float) -> float:
+        # seconds to save one sample: compress on the CPU, then push the bytes to disk
+        return self.encode_seconds + self.size / disk_speed
+
+
+def benchmark_codecs(
+    samples: typing.Sequence[bytes],
+    codecs: typing.Iterable[str] = tuple(CODECS),
+    repeat: int = 3,
+) -> list[CodecReport]:
+    original = sum(map(len, samples))
+    reports = []
+    for codec in codecs:
+        encode_seconds = decode_seconds = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            encoded = [encode(sample, codec) for sample in samples]
+            encode_seconds = min(encode_seconds, time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for sample in encoded:
+                decode(sample)
+            decode_seconds = min(decode_seconds, time.perf_counter() - started)
+
+        size = sum(map(len, encoded))
+        reports.append(CodecReport(
+            codec=codec,
+            size=size,
+            ratio=original / size if size else 0.,
+            encode_seconds=encode_seconds / len(samples),
+            decode_seconds=decode_seconds / len(samples),
+        ))
+    return reports
+
+
+def pick_codec(reports: typing.Iterable[CodecReport], disk_speed: float) -> CodecReport:
+    return min(reports, key=lambda report: report.estimate(disk_speed))
+
+
+def main(argv: typing.Union[typing.Sequence[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(description="比較遊戲存檔的壓縮方式")
+    parser.add_argument("files", nargs="*", type=pathlib.Path)
+    parser.add_argument("--disk-speed", default=100., type=float, help="磁碟寫入速度(MB/s)")
+    parser.add_argument("--repeat", default=3, type=int)
+    args = parser.parse_args(argv)
+
+    files = args.files or sorted(Board.get_save_folder().glob(f"*{Board.SAVE_SUFFIX}"))
+    samples = [decode(file.read_bytes()) for file in files]
+    if not samples:
+        print("沒有可比較的存檔", file=sys.stderr)
+        return 1
+
+    disk_speed = args.disk_speed * (1 << 20)
+    reports = benchmark_codecs(samples, repeat=args.repeat)
+    print(f"{'codec':<10}{'size':>12}{'ratio':>8}{'encode MB/s':>14}{'decode MB/s':>14}{'save ms':>10}")
+    for report in reports:
+        original = report.size * report.ratio
+        print(
+            f"{report.codec:<10}{report.size:>12,}{report.ratio:>8.2f}"
+            f"{original / report.encode_seconds / (1 << 20):>14.1f}"
+            f"{original / report.decode_seconds / (1 << 20):>14.1f}"
+            f"{report.estimate(disk_speed) * 1000:>10.3f}"
+        )
+    print(f"建議使用 GAME_SAVE_CODEC = \"{pick_codec(reports, disk_speed).codec}\"")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
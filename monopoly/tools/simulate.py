@@ -0,0 +1,74 @@
+import argparse
+import contextlib
+import functools
+import json
+import multiprocessing
+import pathlib
+import sys
+import typing
+
+from monopoly import configs, instruments
+from monopoly.simulations import BotPolicy, GameAggregator, simulate_game
+from monopoly.storages import Archive, ResultStore, encode
+
+
+def main(argv: typing.Union[typing.Sequence[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(description="以電腦玩家批次模擬遊戲並記錄結果")
+    parser.add_argument("output", type=pathlib.Path, help="結果資料庫(SQLite)")
+    parser.add_argument("--games", default=100, type=int)
+    parser.add_argument("--seed", default=0, type=int, help="第一局的亂數種子，之後每局加一")
+    parser.add_argument("--players", default=2, type=int)
+    parser.add_argument("--max-turns", default=500, type=int)
+    parser.add_argument("--reserve", default=BotPolicy().reserve, type=int, help="電腦玩家保留的存款")
+    parser.add_argument("--processes", default=1, type=int)
+    parser.add_argument("--archive", type=pathlib.Path, help="另外封存每局結束時的主板")
+    parser.add_argument("--report", type=pathlib.Path, help="另外輸出串流統計的 JSON 報告")
+    parser.add_argument("--profile", type=pathlib.Path, help="量測各階段執行時間，.prom 為 Prometheus 格式，其餘為 JSON")
+    args = parser.parse_args(argv)
+    if args.profile is not None and args.processes > 1:
+        # every worker process keeps its own histograms
+        parser.error("--profile 只能搭配單一行程")
+
+    simulate = functools.partial(
+        simulate_game,
+        players=args.players,
+        max_turns=args.max_turns,
+        policy=BotPolicy(reserve=args.reserve),
+        snapshot=args.archive is not None,
+        statistics=args.report is not None,
+    )
+    seeds = range(args.seed, args.seed + args.games)
+    if args.profile is not None:
+        instruments.reset()
+        instruments.enable()
+
+    aggregator = GameAggregator()
+    with ResultStore(args.output) as store:
+        archive = None if args.archive is None else Archive(args.archive)
+        with (
+            multiprocessing.Pool(args.processes)
+            if args.processes > 1 else contextlib.nullcontext()
+        ) as pool:
+            results = map(simulate, seeds) if pool is None else pool.imap_unordered(simulate, seeds)
+            for count, result in enumerate(results, 1):
+                store.record(result)
+                if result.statistics is not None:
+                    aggregator.merge(result.statistics)
+                if archive is not None:
+                    # appended without a sync per game, closing the archive syncs once
+                    archive.put(result.game_id, encode(result.snapshot, configs.GAME_SAVE_CODEC))
+                print(f"\r{count}/{args.games}", end="", file=sys.stderr)
+        if archive is not None:
+            archive.close()
+    print(file=sys.stderr)
+
+    if args.report is not None:
+        args.report.write_text(json.dumps(aggregator.report(), indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.profile is not None:
+        instruments.dump(args.profile)
+        instruments.disable()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+import argparse
+import sys
+import typing
+
+from monopoly.simulations import TUNABLE_PARAMETERS, BotPolicy
+from monopoly.simulations.sweeps import SWEEP_METRICS, SweepOptions, grid_points, random_points, run_sweep, sweep_table
+
+from . import print_table
+
+
+def _number(text: str) -> float:
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def main(argv: typing.Union[typing.Sequence[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(description="以格狀或隨機搜尋調整遊戲參數並批次模擬")
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2", help="格狀搜尋的參數值")
+    parser.add_argument("--range", action="append", default=[], metavar="NAME=LOW:HIGH", help="隨機搜尋的參數範圍")
+    parser.add_argument("--random", default=10, type=int, help="隨機搜尋的組數")
+    parser.add_argument("--games", default=SweepOptions().games, type=int, help="每組參數每批的局數")
+    parser.add_argument("--max-batches", default=SweepOptions().max_batches, type=int)
+    parser.add_argument("--max-turns", default=SweepOptions().max_turns, type=int)
+    parser.add_argument("--players", default=2, type=int)
+    parser.add_argument("--seed", default=0, type=int)
+    parser.add_argument("--processes", default=1, type=int)
+    parser.add_argument("--metric", default="turns", help=f"信賴區間分開時提早結束: {', '.join(SWEEP_METRICS)}")
+    parser.add_argument("--reserve", default=BotPolicy().reserve, type=int, help="電腦玩家保留的存款")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.metric not in SWEEP_METRICS:
+            raise ValueError(f"未知的指標: {args.metric}")
+        if bool(args.grid) == bool(args.range):
+            raise ValueError("請擇一使用 --grid 或 --range")
+
+        if args.grid:
+            points = grid_points({
+                name: [_number(value) for value in values.split(",")]
+                for name, values in (item.split("=", 1) for item in args.grid)
+            })
+        else:
+            points = random_points({
+                name: tuple(map(_number, bounds.split(":", 1)))
+                for name, bounds in (item.split("=", 1) for item in args.range)
+            }, args.random, args.seed)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        print(f"可調整的參數: {', '.join(TUNABLE_PARAMETERS)}", file=sys.stderr)
+        return 1
+
+    options = SweepOptions(
+        games=args.games,
+        max_batches=args.max_batches,
+        max_turns=args.max_turns,
+        players=args.players,
+        seed=args.seed,
+        processes=args.processes,
+        metric=args.metric,
+        policy=BotPolicy(reserve=args.reserve),
+    )
+    sweep, batches = run_sweep(points, options)
+    columns, rows = sweep_table(sweep, options.z_score)
+
+    print_table(columns, rows)
+    print(f"{batches} 批後結束", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+import resource
+import sys
+import threading
+import time
+import typing
+
+from monopoly import configs
+from monopoly.servers import AsyncServerEngine, LocalClient
+
+
+class TablesResult(typing.NamedTuple):
+    tables: int
+    seconds: float
+    threads: int
+    # peak resident size of the whole process in KiB
+    max_rss: int
+
+
+async def open_tables(count: int, batch: int = 100, timeout: float = 60.) -> TablesResult:
+    # every table is live once its client sees the title menu, then all of them wait for input at once
+    engine = AsyncServerEngine(port=0, max_tables=count, idle_timeout=timeout)
+    await engine.start()
+    clients: list[LocalClient] = []
+    started = time.perf_counter()
+    try:
+        for offset in range(0, count, batch):
+            clients.extend(await asyncio.gather(*(
+                LocalClient(*engine.address).connect(f"table{idx}")
+                for idx in range(offset, min(offset + batch, count))
+            )))
+        await asyncio.gather(*(client.read_until("[C]ancel to Exit", timeout) for client in clients))
+        return TablesResult(
+            tables=engine.stats["tables"],
+            seconds=time.perf_counter() - started,
+            threads=threading.active_count(),
+            max_rss=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        )
+    finally:
+        await asyncio.gather(*(client.close() for client in clients))
+        await engine.close()
+
+
+def main(argv: typing.Union[typing.Sequence[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(description="量測單一行程同時進行的遊戲桌")
+    parser.add_argument("--tables", default=configs.SERVER_MAX_TABLES, type=int)
+    parser.add_argument("--batch", default=100, type=int, help="同時建立的連線數量")
+    args = parser.parse_args(argv)
+
+    # a table takes a socket on both ends of the loopback
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or hard > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    result = asyncio.run(open_tables(args.tables, args.batch))
+    print(f"{'tables':<12}{result.tables:>12,}")
+    print(f"{'seconds':<12}{result.seconds:>12.2f}")
+    print(f"{'threads':<12}{result.threads:>12,}")
+    print(f"{'max rss':<12}{result.max_rss:>12,} KiB")
+    if result.tables < args.tables:
+        print(f"只有 {result.tables:,} 張遊戲桌同時進行", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,2 @@
 from .boards import BoardViewer
+from .layouts import Layout, board_layout
@@ -1,9 +1,13 @@
 import contextlib
+import itertools
 import typing
 
 import pydantic
 
 from monopoly.models import Board
+from monopoly.models.interfaces.models import wide_length
+
+from .layouts import board_layout
 
 
 class BoardViewer:
@@ -12,60 +16,50 @@ class BoardViewer:
         houses: int = 0
         usernames: list[str] = pydantic.Field(default_factory=list)
 
-    deltas: list[tuple[int, int]] = [
-        (0, -1), (-1, 0), (0, 1), (1, 0),
-    ]
-
     def __init__(
         self,
         board: Board,
         board_size: int = 11,
         space_width: int = 16,
+        origin: typing.Union[tuple[int, int], None] = None,
     ):
         self.board = board
+        self.layout = board_layout(board)
         self.board_size = board_size
         self.space_width = space_width
-        self.views = [[None] * board_size for _ in range(board_size)]
+        self.origin = self.follow() if origin is None else origin
+        self.views: list[list[typing.Union[BoardViewer.Space, None]]] = []
         self._prepare()
 
-    def _prepare(self):
-        players = tuple(self.board.board_players)
-        current_space = self.board.start_space
-        diagonal_space = None
+    def follow(self) -> tuple[int, int]:
+        # centers the current player, a board that fits the viewport stays where it is
+        with contextlib.suppress(AttributeError, KeyError):
+            row, column = self.layout.positions[self.board.current_player.space.space.id]
+            return row - self.board_size // 2, column - self.board_size // 2
+        return 0, 0
 
-        def _prepare_space(x: int, y: int):
-            self.views[x][y] = self.Space(name=current_space.space.name)
-            with contextlib.suppress(AttributeError, KeyError):
-                self.views[x][y].houses = self.board.credentials[
-                    current_space.space.land.id
-                ].houses
+    def scroll(self, rows: int = 0, columns: int = 0):
+        self.origin = (self.origin[0] + rows, self.origin[1] + columns)
+        self._prepare()
 
-            self.views[x][y].usernames = [
-                player.player.name
-                for player in players
-                if player.space == current_space
-            ]
+    def _prepare(self):
+        rows, columns = min(self.board_size, self.layout.rows), min(self.board_size, self.layout.columns)
+        self.origin = (
+            max(min(self.origin[0], self.layout.rows - rows), 0),
+            max(min(self.origin[1], self.layout.columns - columns), 0),
+        )
 
-        # handle surrounding
-        x, y = self.board_size - 1, self.board_size - 1
-        for dx, dy in self.deltas:
-            while all((
-                0 <= x + dx < self.board_size,
-                0 <= y + dy < self.board_size,
-            )):
-                _prepare_space(x, y)
-                x, y = x + dx, y + dy
-                current_space = current_space.get_forwards()
-                if isinstance(current_space, list):
-                    current_space, diagonal_space = current_space
+        top, left, ownership = *self.origin, self.board.ownership
+        self.views = [[None] * columns for _ in range(rows)]
+        for row, column in itertools.product(range(rows), range(columns)):
+            cell = self.layout.cells.get((top + row, left + column))
+            if cell is None:
+                continue
 
-        # handle diagonal
-        x, y, dx, dy = self.board_size - 2, 1, -1, 1
-        current_space = diagonal_space
-        for _ in range(1, self.board_size - 2):
-            _prepare_space(x, y)
-            x, y = x + dx, y + dy
-            current_space = current_space.get_forwards()
+            usernames = list(self.board.occupants.get(cell.space_id, {}))
+            self.views[row][column] = self.Space(name=cell.name, usernames=usernames)
+            with contextlib.suppress(KeyError):
+                self.views[row][column].houses = ownership.houses[ownership.ordinals[cell.land_id]]
 
     def view(self):
         def _view_column(column: typing.Union[self.Space, None]) -> typing.Generator[str, None, None]:
@@ -73,10 +67,11 @@ class BoardViewer:
                 yield from (" " * self.space_width for _ in range(5))
                 return
 
+            houses, usernames = "🏠" * column.houses, ",".join(column.usernames)
             yield "-" * self.space_width
-            yield f"{'🏠' * column.houses:^{self.space_width - column.houses}}"
-            yield f"{column.name:^{self.space_width - self.board.chinese_length(column.name)}}"
-            yield f"{','.join(column.usernames):^{self.space_width - self.board.chinese_length(column.usernames)}}"
+            yield f"{houses:^{self.space_width - wide_length(houses)}}"
+            yield f"{column.name:^{self.space_width - wide_length(column.name)}}"
+            yield f"{usernames:^{self.space_width - wide_length(usernames)}}"
             yield "-" * self.space_width
 
         for row in self.views:
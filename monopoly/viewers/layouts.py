@@ -0,0 +1,137 @@
+import collections
+import hashlib
+import typing
+
+LAYOUT_CACHE_SIZE: int = 16
+
+
+class Cell(typing.NamedTuple):
+    space_id: str
+    land_id: typing.Union[str, None]
+    name: str
+
+
+class Layout(typing.NamedTuple):
+    rows: int
+    columns: int
+    cells: dict[tuple[int, int], Cell]
+    positions: dict[str, tuple[int, int]]
+
+
+# layouts by topology hash, and the topology hash of every fixture seen so a turn never walks the board
+_layouts: collections.OrderedDict[str, Layout] = collections.OrderedDict()
+_topologies: dict[str, str] = {}
+
+
+def walk_spaces(start: "BoardSpace") -> typing.Generator["BoardSpace", None, None]:
+    queue, seen = collections.deque([start]), {start.space.id}
+    while queue:
+        space = queue.popleft()
+        yield space
+        for other in space.forwards:
+            if other.space.id not in seen:
+                seen.add(other.space.id)
+                queue.append(other)
+
+
+def topology_hash(start: "BoardSpace") -> str:
+    digest = hashlib.sha1()
+    for space in walk_spaces(start):
+        digest.update(f"{space.space.id}\t{space.space.name}\t".encode())
+        digest.update(",".join(other.space.id for other in space.forwards).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def nearest_free(cells: dict[tuple[int, int], Cell], cell: tuple[int, int]) -> tuple[int, int]:
+    queue, seen = collections.deque([cell]), {cell}
+    while True:
+        row, column = queue.popleft()
+        if (row, column) not in cells:
+            return row, column
+        for delta_row, delta_column in ((0, -1), (-1, 0), (0, 1), (1, 0), (-1, -1), (-1, 1), (1, 1), (1, -1)):
+            other = (row + delta_row, column + delta_column)
+            if other not in seen:
+                seen.add(other)
+                queue.append(other)
+
+
+def ring_cells(count: int) -> typing.Generator[tuple[int, int], None, None]:
+    # wound counterclockwise around a square from its bottom right corner
+    side = max(-(-count // 4), 1)
+    row = column = side
+    for idx in range(count):
+        yield row, column
+        delta_row, delta_column = ((0, -1), (-1, 0), (0, 1), (1, 0))[min(idx // side, 3)]
+        row, column = row + delta_row, column + delta_column
+
+
+def detour_path(
+    branch: "BoardSpace",
+    positions: dict[str, tuple[int, int]],
+) -> tuple[list["BoardSpace"], "BoardSpace"]:
+    path, members = [], set()
+    while branch.space.id not in positions and branch.space.id not in members:
+        path.append(branch)
+        members.add(branch.space.id)
+        if not branch.forwards:
+            break
+        branch = branch.forwards[0]
+    return path, branch
+
+
+def shifted(cells: dict[tuple[int, int], Cell], positions: dict[str, tuple[int, int]]) -> Layout:
+    # detours pushed past the ring may sit at negative rows or columns
+    top, left = min(row for row, _ in cells), min(column for _, column in cells)
+    return Layout(
+        rows=max(row for row, _ in cells) - top + 1,
+        columns=max(column for _, column in cells) - left + 1,
+        cells={(row - top, column - left): cell for (row, column), cell in cells.items()},
+        positions={key: (row - top, column - left) for key, (row, column) in positions.items()},
+    )
+
+
+def compute_layout(start: "BoardSpace") -> Layout:
+    cells: dict[tuple[int, int], Cell] = {}
+    positions: dict[str, tuple[int, int]] = {}
+
+    def place(space: "BoardSpace", cell: tuple[int, int]):
+        land = getattr(space.space, "land", None)
+        cells[cell] = Cell(space.space.id, land.id if land is not None else None, space.space.name)
+        positions[space.space.id] = cell
+
+    # the ring follows the first link of every space back to the start point
+    ring, _ = detour_path(start, positions)
+    for space, cell in zip(ring, ring_cells(len(ring))):
+        place(space, cell)
+
+    # every detour steps diagonally from its fork towards where it rejoins, around whatever is in the way
+    queue = collections.deque(ring)
+    while queue:
+        fork = queue.popleft()
+        for branch in fork.forwards:
+            path, end = detour_path(branch, positions)
+            cell = positions[fork.space.id]
+            target = positions.get(end.space.id, cell)
+            for space in path:
+                cell = nearest_free(cells, (
+                    cell[0] + (target[0] > cell[0]) - (target[0] < cell[0]),
+                    cell[1] + (target[1] > cell[1]) - (target[1] < cell[1]),
+                ))
+                place(space, cell)
+            queue.extend(path)
+    return shifted(cells, positions)
+
+
+def board_layout(board: "Board") -> Layout:
+    key = _topologies.get(board.fixture_hash) or topology_hash(board.start_space)
+    if board.fixture_hash:
+        _topologies[board.fixture_hash] = key
+
+    if key in _layouts:
+        _layouts.move_to_end(key)
+    else:
+        _layouts[key] = compute_layout(board.start_space)
+        while len(_layouts) > LAYOUT_CACHE_SIZE:
+            _layouts.popitem(last=False)
+    return _layouts[key]
@@ -1,5 +1,21 @@
-from monopoly import StandAloneEngine
+import argparse
+
+import monopoly
+from monopoly import configs
 
 
 if __name__ == "__main__":
-    StandAloneEngine().execute()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--server", action="store_true")
+    parser.add_argument("--host", default=configs.SERVER_HOST)
+    parser.add_argument("--port", default=configs.SERVER_PORT, type=int)
+    parser.add_argument("--shards", default=0, type=int)
+    args = parser.parse_args()
+
+    # only the chosen engine gets imported, the server ones pull in asyncio and multiprocessing
+    if args.server and args.shards > 0:
+        monopoly.ShardedServerEngine(host=args.host, port=args.port, shards=args.shards).execute()
+    elif args.server:
+        monopoly.AsyncServerEngine(host=args.host, port=args.port).execute()
+    else:
+        monopoly.StandAloneEngine().execute()
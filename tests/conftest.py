@@ -1,6 +1,28 @@
+import pathlib
+import typing
+from unittest import mock
+
 import pytest
 
+from monopoly import instruments
 from monopoly.engines import BaseEngine, StandAloneEngine
+from monopoly.servers import AsyncServerEngine, ShardedServerEngine
+
+
+@pytest.fixture(name="save_folder", autouse=True)
+def fixture_save_folder(tmp_path: pathlib.PosixPath) -> typing.Generator[pathlib.PosixPath, None, None]:
+    # saves and the save catalog never touch the repository folder during tests
+    with mock.patch("monopoly.models.boards.Board.SAVE_FOLDER", new=str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.fixture(name="instruments_enabled")
+def fixture_instruments_enabled() -> typing.Generator[None, None, None]:
+    instruments.reset()
+    instruments.enable()
+    yield
+    instruments.disable()
+    instruments.reset()
 
 
 @pytest.fixture(name="engine")
@@ -11,3 +33,13 @@ def fixture_engine() -> BaseEngine:
 @pytest.fixture(name="stand_alone_engine")
 def fixture_stand_alone_engine() -> StandAloneEngine:
     return StandAloneEngine()
+
+
+@pytest.fixture(name="async_server_engine")
+def fixture_async_server_engine() -> AsyncServerEngine:
+    return AsyncServerEngine(port=0, idle_timeout=.5, send_timeout=.5)
+
+
+@pytest.fixture(name="sharded_server_engine")
+def fixture_sharded_server_engine() -> ShardedServerEngine:
+    return ShardedServerEngine(port=0, shards=2, idle_timeout=5., send_timeout=.5)
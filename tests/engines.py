@@ -120,6 +120,19 @@ class TestStandAloneEngineExecute:
 
         assert stand_alone_engine.board.run.call_count == 1
 
+    def test_success_auto_saving(
+        self,
+        stand_alone_engine: StandAloneEngine,
+    ):
+        stand_alone_engine.board = mock.Mock()
+        type(stand_alone_engine.board).finished = mock.PropertyMock(side_effect=(False, False, True))
+
+        with mock.patch("monopoly.storages.AutoSaver") as mock_autosaver:
+            stand_alone_engine.execute()
+
+            assert mock_autosaver.return_value.capture.call_count == 2
+            assert mock_autosaver.return_value.close.call_count == 1
+
     def test_failed_value_error(
         self,
         stand_alone_engine: StandAloneEngine,
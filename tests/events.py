@@ -0,0 +1,67 @@
+import pickle
+
+from monopoly.constants import EventType
+from monopoly.events import Event, EventBus
+
+
+class TestEventBus:
+    def test_success_filter(
+        self,
+    ):
+        bus, received = EventBus(), []
+        bus.subscribe(lambda event: received.append((event.type, event.value)), EventType.TOLL_PAID)
+
+        bus.emit(EventType.LAND_BOUGHT, value=1)
+        bus.emit(EventType.TOLL_PAID, value=2)
+
+        assert received == [(EventType.TOLL_PAID, 2)]
+        assert bus.listening(EventType.TOLL_PAID)
+        assert not bus.listening(EventType.LAND_BOUGHT)
+
+    def test_success_all(
+        self,
+    ):
+        bus, received = EventBus(), []
+        bus.subscribe(received.append)
+        bus.subscribe(received.append)
+
+        for event_type in EventType:
+            bus.emit(event_type)
+
+        assert [event.type for event in received] == list(EventType)
+        assert all(isinstance(event, Event) for event in received)
+
+    def test_success_preallocated(
+        self,
+    ):
+        bus, received = EventBus(), []
+        bus.subscribe(received.append, EventType.STOCK_TICK)
+
+        bus.emit(EventType.STOCK_TICK, subject="A", value=1)
+        bus.emit(EventType.STOCK_TICK, subject="B", value=2)
+
+        assert received[0] is received[1]
+        assert (received[1].subject, received[1].value) == ("B", 2)
+
+    def test_success_unsubscribe(
+        self,
+    ):
+        bus, received = EventBus(), []
+        subscriber = bus.subscribe(received.append, EventType.BANKRUPTCY, EventType.CARD_DRAWN)
+
+        bus.unsubscribe(subscriber, EventType.BANKRUPTCY)
+        bus.emit(EventType.BANKRUPTCY)
+        bus.emit(EventType.CARD_DRAWN)
+        assert len(received) == 1
+
+        bus.unsubscribe(subscriber)
+        bus.emit(EventType.CARD_DRAWN)
+        assert len(received) == 1
+
+    def test_success_pickle(
+        self,
+    ):
+        bus = EventBus()
+        bus.subscribe(lambda event: None)
+
+        assert not pickle.loads(pickle.dumps(bus)).listening(EventType.TURN_ENDED)
@@ -0,0 +1,67 @@
+import json
+import pathlib
+
+from monopoly import instruments
+from monopoly.simulations import simulate_game
+
+
+class TestHistogram:
+    def test_success(
+        self,
+    ):
+        histogram = instruments.Histogram((1., 2., 4.))
+        for value in (.5, 1.5, 1.5, 3., 10.):
+            histogram.observe(value)
+
+        assert histogram.buckets == [1, 2, 1, 1]
+        assert histogram.count == 5
+        assert histogram.total == 16.5
+        assert histogram.quantile(.5) == 2.
+        assert histogram.quantile(1.) == float("inf")
+
+
+class TestInstruments:
+    def test_success_disabled(
+        self,
+    ):
+        instruments.reset()
+        assert not instruments.enabled()
+        with instruments.timer("board.run", "show"):
+            instruments.count("board.turns")
+        assert instruments.snapshot() == {"counters": [], "histograms": []}
+
+    def test_success_game(
+        self,
+        instruments_enabled: None,
+    ):
+        result = simulate_game(0, max_turns=30)
+        data = instruments.snapshot()
+
+        counters = {counter["name"]: counter["value"] for counter in data["counters"]}
+        assert counters["board.turns"] == result.turns
+
+        histograms = {(histogram["name"], histogram["label"]): histogram for histogram in data["histograms"]}
+        for phase in ("show", "play", "advance", "winner"):
+            assert histograms["board.run", phase]["count"] == result.turns
+        assert histograms["board.run", "opening_stocks"]["count"] == result.turns // 2
+        assert ("market.tick", "etf") in histograms
+        assert any(name == "space.arrive" for name, _ in histograms)
+
+    def test_success_dump(
+        self,
+        instruments_enabled: None,
+        tmp_path: pathlib.PosixPath,
+    ):
+        with instruments.timer("board.run", "show"):
+            instruments.count("board.turns", value=2)
+
+        instruments.dump(tmp_path / "profile.json")
+        data = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+        assert data["counters"] == [{"name": "board.turns", "label": "", "value": 2}]
+        assert data["histograms"][0]["count"] == 1
+
+        instruments.dump(tmp_path / "profile.prom")
+        lines = (tmp_path / "profile.prom").read_text(encoding="utf-8").splitlines()
+        assert "monopoly_board_turns_total 2" in lines
+        assert 'monopoly_board_run_seconds_bucket{kind="show",le="+Inf"} 1' in lines
+        assert 'monopoly_board_run_seconds_count{kind="show"} 1' in lines
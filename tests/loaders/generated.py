@@ -0,0 +1,106 @@
+import collections
+import pickle
+
+import pytest
+
+from monopoly.constants import Area, CardType, StockType
+from monopoly.loaders import BoardSpec
+from monopoly.loaders.generated import generate_layout
+from monopoly.models.boards import Board, BoardSpace
+from monopoly.models.equipments.spaces import StartPointSpace
+from monopoly.tools.benchmarks import load_board
+
+
+def walk(board: Board, direction: str) -> dict[str, BoardSpace]:
+    queue, result = collections.deque([board.start_space]), {}
+    while queue:
+        space = queue.popleft()
+        if space.space.id not in result:
+            result[space.space.id] = space
+            queue.extend(getattr(space, direction))
+    return result
+
+
+class TestGeneratedLoader:
+    @pytest.mark.parametrize("spec", [
+        BoardSpec(),
+        BoardSpec(spaces=12, branches=0, etfs=0, cards=0),
+        BoardSpec.scaled(2000, seed=3),
+    ])
+    def test_success(
+        self,
+        spec: BoardSpec,
+    ):
+        board = load_board(spec)
+        forwards = walk(board, "forwards")
+
+        assert len(forwards) == len(walk(board, "backwards")) == spec.spaces
+        assert all(space.forwards and space.backwards for space in forwards.values())
+
+        land_spaces = [space for space in forwards if space in board.lands]
+        assert sorted(land_spaces) == sorted(board.lands)
+        assert len(board.lands) == round((spec.spaces - 1) * spec.lands)
+
+        stocks = [stock for stock in board.stocks.values() if stock.type == StockType.STOCK]
+        etfs = [stock for stock in board.stocks.values() if stock.type == StockType.ETF]
+        assert len(stocks) == sum(land.area != Area.OCEAN for land in board.lands.values())
+        assert len(etfs) == spec.etfs
+        assert all(etf.constituents and etf.value > 0 for etf in etfs)
+
+        assert set(board.cards) == set(CardType)
+        assert all(len(deck) >= spec.cards for deck in board.cards.values())
+
+    def test_success_pickled(
+        self,
+    ):
+        board = load_board(BoardSpec.scaled(2000, seed=3))
+        loaded = pickle.loads(pickle.dumps(board))
+        forwards = walk(loaded, "forwards")
+
+        assert list(forwards) == list(walk(board, "forwards"))
+        assert forwards == loaded.spaces
+        assert all(forwards[space.space.id] is space for space in walk(loaded, "backwards").values())
+        assert loaded.current_player.space is loaded.start_space
+
+    def test_success_reproducible(
+        self,
+    ):
+        spec = BoardSpec.scaled(300, seed=7)
+        board, other = load_board(spec), load_board(spec)
+
+        assert board.fixture_hash == other.fixture_hash != load_board(BoardSpec.scaled(300, seed=8)).fixture_hash
+        assert list(board.lands) == list(other.lands)
+        assert [
+            (etf.id, [constituent.stock.id for constituent in etf.constituents])
+            for etf in board.stocks.values() if etf.type == StockType.ETF
+        ] == [
+            (etf.id, [constituent.stock.id for constituent in etf.constituents])
+            for etf in other.stocks.values() if etf.type == StockType.ETF
+        ]
+
+    def test_success_branches(
+        self,
+    ):
+        spec = BoardSpec(spaces=200, branches=6, cycles=3, branch_length=5)
+        layout = generate_layout(spec)
+        forks = collections.Counter(backward for backward, _ in layout.links)
+
+        assert len(layout.kinds) == spec.spaces
+        assert len(layout.links) == spec.spaces + spec.branches + spec.cycles
+        assert sum(count - 1 for count in forks.values()) == spec.branches + spec.cycles
+
+        board = load_board(spec)
+        assert isinstance(board.start_space.space, StartPointSpace)
+        assert sum(len(space.forwards) - 1 for space in walk(board, "forwards").values()) == 9
+        assert sum(len(space.backwards) - 1 for space in walk(board, "forwards").values()) == 9
+
+    @pytest.mark.parametrize("spec", [
+        BoardSpec(spaces=10, branches=2, branch_length=4),
+        BoardSpec(spaces=20, branch_length=0),
+    ])
+    def test_failed(
+        self,
+        spec: BoardSpec,
+    ):
+        with pytest.raises(ValueError):
+            load_board(spec)
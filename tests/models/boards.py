@@ -1,7 +1,57 @@
+import pathlib
+import pickle
 from unittest import mock
 
-from monopoly.constants import DirectionAttr
+import pytest
+
+from monopoly.constants import DirectionAttr, EventType, SystemText
 from monopoly.models.boards import Board, BoardPlayer, BoardSpace
+from monopoly.models.hashes import compute_state_hash
+from monopoly.storages import Archive, SaveCatalog, SaveEntry, encode
+
+
+class TestBoardEvents:
+    def test_success(
+        self,
+        board: Board,
+    ):
+        received = []
+        board.events.subscribe(
+            lambda event: received.append((event.type, event.player.name, event.subject.id, event.value)),
+            EventType.LAND_BOUGHT,
+            EventType.TOLL_PAID,
+        )
+        player, other = board.current_player.player, board.current_player.get_forwards().player
+        land = next(land for land in board.lands.values() if land.buildable)
+
+        with mock.patch("monopoly.models.equipments.players.input"):
+            land.buying(player, board, is_free=True)
+            credential = board.get_credential(land)
+            credential.construction(board, is_free=True)
+            board.current_player = board.current_player.get_forwards()
+            credential.tolling(other, board)
+
+        assert received == [
+            (EventType.LAND_BOUGHT, player.name, land.id, 0),
+            (EventType.TOLL_PAID, other.name, land.id, credential.tolling_value),
+        ]
+
+    def test_success_shared(
+        self,
+        board: Board,
+    ):
+        received = []
+        board.events.subscribe(received.append, EventType.TURN_ENDED)
+
+        assert board.start_space.board.events is board.events
+        assert board.current_player.board.events is board.events
+        with mock.patch("monopoly.models.boards.BoardPlayer.play"):
+            board.run()
+        assert received[0].value == board.turns == 1
+
+        loaded = pickle.loads(pickle.dumps(board))
+        assert loaded.start_space.board.events is loaded.events
+        assert not loaded.events.listening(EventType.TURN_ENDED)
 
 
 class TestBoardLoad:
@@ -48,6 +98,27 @@ class TestBoardLoad:
                     assert mock_loads.call_count == 0
                 assert mock_read.call_count == 0
 
+    def test_success_archive(
+        self,
+        board: Board,
+        save_folder: pathlib.PosixPath,
+    ):
+        with Archive(save_folder / "archive") as archive:
+            board.archiving(archive, "_test_game")
+
+        loaded = Board.loading(save_folder / "archive", "_test_game")
+        assert isinstance(loaded, Board)
+        assert loaded.fixture_hash == board.fixture_hash
+        assert Board.loading(save_folder / "archive", "_test_missing") is None
+
+    def test_failed_archive_missing(
+        self,
+        save_folder: pathlib.PosixPath,
+    ):
+        with pytest.raises(FileNotFoundError):
+            Board.loading(save_folder / "_test_archive", "_test_game")
+        assert not (save_folder / "_test_archive").exists()
+
     def test_failed_filename(
         self,
         board: Board,
@@ -69,6 +140,18 @@ class TestBoardLoad:
                     assert board.load() is None
                 assert mock_read.call_count == 1
 
+    def test_failed_damaged(
+        self,
+        board: Board,
+        save_folder: pathlib.PosixPath,
+        capsys: pytest.CaptureFixture,
+    ):
+        data = encode(pickle.dumps(board), "bz2")
+        (save_folder / "_test_file.sav").write_bytes(data[:len(data) // 2] + b"\x00" * (len(data) // 2))
+
+        assert Board.loading(save_folder / "_test_file.sav") is None
+        assert SystemText.LOADING_FAILED.value in capsys.readouterr().out
+
 
 class TestBoardRepresentation:
     def test_success(
@@ -189,6 +272,72 @@ class TestBoardSave:
 
                     assert mock_write.call_count == 1
 
+    def test_success_catalog(
+        self,
+        board: Board,
+        capsys: pytest.CaptureFixture,
+    ):
+        board.turns = 7
+        with mock.patch("monopoly.models.interfaces.menus.input", return_value="_test_file"):
+            board.save()
+
+        capsys.readouterr()
+        with mock.patch("monopoly.models.interfaces.menus.input", side_effect=("?_test", "_test_file")):
+            with mock.patch("monopoly.models.boards.Board.loading") as mock_loading:
+                board.load()
+
+                assert mock_loading.call_args.args[0].name == "_test_file.sav"
+        assert "_test_file.sav (_test1,_test2, 第 7 回合" in capsys.readouterr().out
+
+        entry = board.get_save_catalog().get("_test_file.sav")
+        assert entry.fixture_hash == board.fixture_hash != ""
+
+    def test_success_catalog_cached(
+        self,
+        board: Board,
+        save_folder: pathlib.PosixPath,
+    ):
+        SaveCatalog(save_folder / board.SAVE_CATALOG).record(SaveEntry(name="_test_deleted.sav"))
+        (save_folder / "_test_copied.sav").write_bytes(b"_test")
+
+        # opening does not look at the saves, only an explicit repair does
+        catalog = board.get_save_catalog()
+        assert catalog is board.get_save_catalog()
+        assert [entry.name for entry in catalog.search()] == ["_test_deleted.sav"]
+
+        with mock.patch("monopoly.models.interfaces.menus.input", side_effect=("!", "_test_file")):
+            with mock.patch("monopoly.models.boards.Board.saving"):
+                board.save()
+        assert [entry.name for entry in catalog.search()] == ["_test_copied.sav"]
+
+    def test_success_catalog_created(
+        self,
+        board: Board,
+        save_folder: pathlib.PosixPath,
+    ):
+        # saves written before the catalog existed
+        (save_folder / "_test_old.sav").write_bytes(b"_test")
+
+        assert [entry.name for entry in board.get_save_catalog().search()] == ["_test_old.sav"]
+
+    def test_success_catalog_paging(
+        self,
+        board: Board,
+        capsys: pytest.CaptureFixture,
+    ):
+        for idx in range(4):
+            board.get_save_catalog().record(SaveEntry(name=f"_test_{idx}.sav"))
+
+        with mock.patch.object(Board, "SAVE_PAGE_SIZE", new=2):
+            with mock.patch("monopoly.models.interfaces.menus.input", side_effect=(">", ">", "<", "_test_file")):
+                with mock.patch("monopoly.models.boards.Board.saving"):
+                    board.save()
+
+        # the second > stays on the last page
+        output = capsys.readouterr().out
+        assert output.count("[03] _test_2.sav") == 2
+        assert output.count("[01] _test_0.sav") == 2
+
     def test_success_saving(
         self,
         board: Board,
@@ -203,6 +352,17 @@ class TestBoardSave:
                     assert mock_saving.call_args.args[0].name == f"{filename}.sav"
                 assert mock_write.call_count == 0
 
+    def test_success_saving_replaced(
+        self,
+        board: Board,
+        save_folder: pathlib.PosixPath,
+    ):
+        board.saving(save_folder / "_test_file.sav")
+
+        assert sorted(path.name for path in save_folder.glob("*.sav*")) == ["_test_file.sav"]
+        assert board.repair_save_catalog() == 0
+        assert board.get_save_catalog().get("_test_file.sav").turns == board.turns
+
     def test_failed_filename(
         self,
         board: Board,
@@ -234,6 +394,72 @@ class TestBoardStart:
         )
 
 
+class TestBoardStateHash:
+    def test_success(
+        self,
+        board: Board,
+    ):
+        player = board.current_player.player
+        land = next(land for land in board.lands.values() if land.buildable)
+        hashes = {board.state_hash.value}
+
+        def mutated():
+            assert board.state_hash.value == compute_state_hash(board)
+            assert board.state_hash.value not in hashes
+            hashes.add(board.state_hash.value)
+
+        with mock.patch("monopoly.models.interfaces.menus.input", return_value="c"):
+            board.current_player.moving(1)
+        mutated()
+        land.buying(player, board, is_free=True)
+        mutated()
+        board.get_credential(land).construction(board, is_free=True)
+        mutated()
+        player.pay(1000)
+        mutated()
+        with mock.patch("monopoly.models.properties.stocks.random.randint", return_value=3):
+            board.opening_stocks()
+        mutated()
+        board.reverse_direction()
+        mutated()
+
+    def test_success_restored(
+        self,
+        board: Board,
+    ):
+        player, value = board.current_player.player, board.state_hash.value
+
+        player.earn(50)
+        player.pay(50)
+        board.reverse_direction()
+        board.reverse_direction()
+
+        assert board.state_hash.value == value
+        assert player.state_hash is board.state_hash
+        assert board.ownership.state_hash is board.state_hash
+
+
+class TestBoardOccupants:
+    def test_success(
+        self,
+        board: Board,
+    ):
+        player, other = board.current_player, board.current_player.forwards
+        assert board.start_space.occupants == [player, other]
+
+        with mock.patch("monopoly.models.interfaces.menus.input", return_value="c"):
+            player.moving(1)
+            space = player.space
+            assert board.start_space.occupants == [other]
+            assert space.occupants == [player]
+
+        with mock.patch("monopoly.models.interfaces.lists.input", return_value="c"):
+            board.transport_start_point(player.player)
+        assert board.start_space.occupants == [other, player]
+        assert not space.occupants
+        assert list(board.occupants[board.start_space.space.id]) == [other.player.name, player.player.name]
+
+
 class TestBoardTheMostPlayer:
     def test_success(
         self,
@@ -1,8 +1,11 @@
+import csv
+import pickle
+import random
 from unittest import mock
 
 import pytest
 
-from monopoly.constants import CashType, TaxFee
+from monopoly.constants import CardType, CashType, EventType, FixturePath, TaxFee
 from monopoly.models.boards import Board, BoardPlayer
 from monopoly.models.equipments import cards as models
 from monopoly.models.equipments.players import Player, PlayerLand
@@ -151,7 +154,7 @@ class TestForeclosePropertyCard:
                 assert player.cash == _cash - int(new_land.land_price * TaxFee.FORECLOSE_FEE.value)
                 assert new_land.stock.earning == int(new_land.land_price * new_land.stock.payout_ratio)
                 assert player.lands[new_land.id].houses == 0
-                assert board.credentials[new_land.id].houses == 0
+                assert board.ownership.get_credential(new_land).houses == 0
 
     def test_success_construction(
         self,
@@ -195,8 +198,7 @@ class TestForeclosePropertyCard:
                 assert new_land.stock.earning == 0
                 with pytest.raises(KeyError):
                     assert player.lands[new_land.id]
-                with pytest.raises(KeyError):
-                    assert board.credentials[new_land.id]
+                assert board.ownership.get_credential(new_land) is None
                 assert mock_card_input.call_count == 2
 
     def test_failed_non_foreclosable(
@@ -209,9 +211,7 @@ class TestForeclosePropertyCard:
         new_land = board.lands["1002"]
         player, ocean = player_ocean.player, player_ocean.land
 
-        new_land.has_owner = True
-        credential = new_player.get_or_create_player_land(new_land)
-        board.get_or_create_credential(new_land, credential=credential)
+        board.ownership.transfer(new_land, new_player)
 
         with mock.patch("monopoly.models.interfaces.lists.input", side_effect=("0000", ocean.id, new_land.id, "c")):
             with mock.patch("monopoly.models.equipments.cards.input", return_value="y"):
@@ -245,8 +245,7 @@ class TestForeclosePropertyCard:
                 assert new_land.stock.earning == 0
                 with pytest.raises(KeyError):
                     assert player.lands[new_land.id]
-                with pytest.raises(KeyError):
-                    assert board.credentials[new_land.id]
+                assert board.ownership.get_credential(new_land) is None
 
 
 class TestFreeBuildingCard:
@@ -346,6 +345,10 @@ class TestImposePropertyCard:
         impose_property_card: models.ImposePropertyCard,
     ):
         player, land = player_land.player, player_land.land
+        received = []
+        board.events.subscribe(
+            lambda event: received.append((event.player, event.subject, event.value)), EventType.LAND_BOUGHT,
+        )
 
         with mock.patch("monopoly.models.interfaces.lists.input", side_effect=("0000", land.id)):
             with mock.patch("monopoly.models.equipments.cards.input", return_value="y"):
@@ -355,13 +358,15 @@ class TestImposePropertyCard:
 
                 impose_property_card.execute(new_player, board=board)
 
+                assert received == [(new_player, land, _value)]
+
                 assert player.cash == _cash + _value
                 assert player.incoming == _value
                 assert new_player.cash == _new_cash - _value
-                assert new_player.get_or_create_player_land(land).houses == player_land.houses
+                assert new_player.lands[land.id].houses == player_land.houses
                 with pytest.raises(KeyError):
                     assert player.lands[land.id]
-                assert board.get_or_create_credential(land).player == new_player
+                assert board.get_credential(land).player == new_player
 
     def test_success_houses(
         self,
@@ -371,7 +376,7 @@ class TestImposePropertyCard:
         impose_property_card: models.ImposePropertyCard,
     ):
         player, land = player_land.player, player_land.land
-        player_land.houses = 4
+        player_land.ownership.set_houses(player_land.land, 4)
         new_player.cash = (1 << 32) - 1
 
         with mock.patch("monopoly.models.interfaces.lists.input", side_effect=("0000", land.id)):
@@ -385,10 +390,10 @@ class TestImposePropertyCard:
                 assert player.cash == _cash + _value
                 assert player.incoming == _value
                 assert new_player.cash == _new_cash - _value
-                assert new_player.get_or_create_player_land(land).houses == player_land.houses
+                assert new_player.lands[land.id].houses == player_land.houses
                 with pytest.raises(KeyError):
                     assert player.lands[land.id]
-                assert board.get_or_create_credential(land).player == new_player
+                assert board.get_credential(land).player == new_player
 
     def test_success_cancelled(
         self,
@@ -409,10 +414,10 @@ class TestImposePropertyCard:
                 assert player.cash == _cash
                 assert player.incoming == 0
                 assert new_player.cash == _new_cash
-                assert player.get_or_create_player_land(land).houses == player_land.houses
+                assert player.lands[land.id].houses == player_land.houses
                 with pytest.raises(KeyError):
                     assert new_player.lands[land.id]
-                assert board.get_or_create_credential(land).player == player
+                assert board.get_credential(land).player == player
 
     def test_failed_non_imposable(
         self,
@@ -430,8 +435,8 @@ class TestImposePropertyCard:
 
                 assert player.cash == _cash
                 assert player.incoming == 0
-                assert player.get_or_create_player_land(land).houses == player_land.houses
-                assert board.get_or_create_credential(land).player == player
+                assert player.lands[land.id].houses == player_land.houses
+                assert board.get_credential(land).player == player
 
     def test_failed_insufficient_cash(
         self,
@@ -453,10 +458,10 @@ class TestImposePropertyCard:
                 assert player.cash == _cash
                 assert player.incoming == 0
                 assert new_player.cash == _new_cash
-                assert player.get_or_create_player_land(land).houses == player_land.houses
+                assert player.lands[land.id].houses == player_land.houses
                 with pytest.raises(KeyError):
                     assert new_player.lands[land.id]
-                assert board.get_or_create_credential(land).player == player
+                assert board.get_credential(land).player == player
 
 
 class TestReturnToStartPointCard:
@@ -510,6 +515,23 @@ class TestHouseTaxCard:
 
             assert player.cash == _cash - int(_value * TaxFee.HOUSE_TAX.value)
 
+    def test_success_board_fees(
+        self,
+        board: Board,
+        player: Player,
+        house_tax_card: models.HouseTaxCard,
+    ):
+        _value = 1000
+        board.fees[TaxFee.HOUSE_TAX] = .5
+
+        with mock.patch("monopoly.models.equipments.players.Player.house_worth", new=_value):
+            _cash = player.cash
+
+            house_tax_card.execute(player, board=board)
+
+            assert player.cash == _cash - 500
+            assert TaxFee.HOUSE_TAX.value == .03
+
     def test_failed_insufficient_cash(
         self,
         board: Board,
@@ -655,3 +677,86 @@ class TestStockHandlingFeeCard:
                 assert player.bankruptcy is True
                 assert player.cash == _cash - int(_value * TaxFee.STOCK_HANDLING_FEE.value)
                 assert mock_input.call_count == 1
+
+
+class TestDeck:
+    @pytest.fixture(name="deck")
+    def fixture_deck(
+        self,
+        board: Board,
+    ) -> models.Deck:
+        return board.cards[CardType.CHANCE]
+
+    def test_success_without_replacement(
+        self,
+        deck: models.Deck,
+    ):
+        rng = random.Random(0)
+        first = [id(deck.draw(rng)) for _ in range(len(deck))]
+        second = [id(deck.draw(rng)) for _ in range(len(deck))]
+
+        assert sorted(first) == sorted(second) == sorted(map(id, deck.cards))
+        assert first != second
+        assert deck.counts == [2] * len(deck)
+
+    def test_success_reproducible(
+        self,
+        deck: models.Deck,
+    ):
+        other = pickle.loads(pickle.dumps(deck))
+        assert [
+            deck.cards.index(deck.draw(random.Random(seed))) for seed in range(20)
+        ] == [
+            other.cards.index(other.draw(random.Random(seed))) for seed in range(20)
+        ]
+
+    def test_success_replacement(
+        self,
+        deck: models.Deck,
+    ):
+        deck.replacement = True
+        rng = random.Random(0)
+        for _ in range(10 * len(deck)):
+            deck.draw(rng)
+
+        assert sum(deck.counts) == 10 * len(deck)
+        assert max(deck.counts) > 10
+
+    def test_success_weighted(
+        self,
+    ):
+        deck = models.Deck(card_type=CardType.CHANCE)
+        for weight in (1, 3, 6):
+            deck.add(mock.Mock(), weight)
+
+        rng = random.Random(0)
+        for _ in range(10000):
+            deck.draw(rng)
+
+        assert deck.weighted
+        for count, expected in zip(deck.counts, (1000, 3000, 6000)):
+            assert abs(count - expected) < 200
+
+    def test_success_weighted_replacement(
+        self,
+    ):
+        deck = models.Deck(card_type=CardType.CHANCE, replacement=False)
+        deck.add(mock.Mock(), 1)
+        deck.add(mock.Mock(), 1)
+        assert not deck.weighted
+
+        deck.add(mock.Mock(), 2)
+        rng = random.Random(0)
+        for _ in range(30):
+            deck.draw(rng)
+
+        # a weighted deck always draws with replacement
+        assert deck.weighted
+        assert max(deck.counts) > 10
+
+    def test_success_registry(
+        self,
+    ):
+        with open(FixturePath.CARDS.value, "r", encoding="utf-8") as file:
+            assert {row["cls"] for row in csv.DictReader(file)} <= set(models.CARD_CLASSES)
+        assert "BaseCard" not in models.CARD_CLASSES
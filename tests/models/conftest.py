@@ -56,7 +56,7 @@ def fixture_cards(board: Board) -> dict[
 ]:
     return {
         (card.__class__.__name__, getattr(card, "cash_type", None)): card
-        for card in itertools.chain.from_iterable(board.cards.values())
+        for card in itertools.chain.from_iterable(deck.cards for deck in board.cards.values())
     }
 
 
@@ -104,16 +104,12 @@ def fixture_etf(board: Board) -> ETF:
 
 @pytest.fixture(name="player_land")
 def fixture_player_land(board: Board, player: Player, land: Land) -> PlayerLand:
-    land.has_owner = True
-    credential = player.get_or_create_player_land(land)
-    return board.get_or_create_credential(land, credential=credential)
+    return board.ownership.transfer(land, player)
 
 
 @pytest.fixture(name="player_ocean")
 def fixture_player_ocean(board: Board, player: Player, ocean: Ocean) -> PlayerLand:
-    ocean.has_owner = True
-    credential = player.get_or_create_player_land(ocean)
-    return board.get_or_create_credential(ocean, credential=credential)
+    return board.ownership.transfer(ocean, player)
 
 
 @pytest.fixture(name="player_stock")
@@ -0,0 +1,28 @@
+from monopoly.models.hashes import StateHash, state_key
+
+
+class TestStateKey:
+    def test_success(
+        self,
+    ):
+        # fixed across processes and runs, so fingerprints can be compared between machines
+        assert state_key("direction", "get_forwards") == 0x48bc0d44cd8a7a51
+        assert state_key("cash", "bot1", 36) != state_key("cash", "bot1", 37)
+        assert 0 <= state_key("cash", "bot1", 36) < 1 << 64
+
+
+class TestStateHash:
+    def test_success(
+        self,
+    ):
+        state_hash = StateHash()
+        state_hash.toggle("cash", "bot1", 36)
+        value = state_hash.value
+
+        state_hash.swap("cash", "bot1", old=36, new=37)
+        assert state_hash.value == state_key("cash", "bot1", 37)
+        state_hash.swap("cash", "bot1", old=37, new=37)
+        assert state_hash.value == state_key("cash", "bot1", 37)
+        state_hash.swap("cash", "bot1", old=37, new=36)
+        assert state_hash.value == value
+        assert repr(state_hash) == f"StateHash({value:016x})"
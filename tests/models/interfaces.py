@@ -0,0 +1,70 @@
+from unittest import mock
+
+import pytest
+
+from monopoly.models.boards import Board
+from monopoly.models.equipments.players import PlayerLand
+from monopoly.models.interfaces.models import display_width, wide_length
+
+
+class TestDisplayWidth:
+    @pytest.mark.parametrize(("text", "width"), (
+        ("", 0),
+        ("STARTPOINT", 10),
+        ("日本", 4),
+        ("骰子x3", 6),
+        ("名稱：", 6),
+        ("🏠🏠", 4),
+    ))
+    def test_success(
+        self,
+        text: str,
+        width: int,
+    ):
+        assert display_width(text) == width
+        assert wide_length(text) == width - len(text)
+
+
+class TestListColumns:
+    def test_success_static(
+        self,
+        board: Board,
+        capsys: pytest.CaptureFixture,
+    ):
+        board.list_columns(("1001", "日本", "2,600", "NULL"), static=3)
+        board.list_columns(("1001", "日本", "2,600", "NULL"))
+
+        static, dynamic = capsys.readouterr().out.splitlines()
+        assert static == dynamic
+        assert len({
+            display_width(column)
+            for column in static.strip("|").split("|")
+        }) == 1
+
+
+class TestListTable:
+    def test_success_lands(
+        self,
+        board: Board,
+        player_land: PlayerLand,
+    ):
+        with mock.patch("monopoly.models.interfaces.lists.sys") as mock_sys:
+            board.list_lands()
+
+            assert mock_sys.stdout.write.call_count == 1
+            table = mock_sys.stdout.write.call_args.args[0].splitlines()
+            assert len(table) == len(board.lands) + 4
+            assert any(
+                player_land.land.id in row and player_land.player.name in row
+                for row in table
+            )
+
+    def test_success_stocks_players(
+        self,
+        board: Board,
+    ):
+        with mock.patch("monopoly.models.interfaces.lists.sys") as mock_sys:
+            board.list_stocks()
+            board.list_players()
+
+            assert mock_sys.stdout.write.call_count == 2
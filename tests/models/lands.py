@@ -20,7 +20,7 @@ class TestBuyingLand:
                     assert player.cash == _cash - land.land_price
                     assert land.stock.earning == int(land.land_price * land.stock.payout_ratio)
                     assert player.lands[land.id].houses == 0
-                    assert board.credentials[land.id].houses == 0
+                    assert board.ownership.get_credential(land).houses == 0
                     assert mock_construct.call_count == 0
 
     def test_success_unlimited(self, board: Board, player: Player, land: Land):
@@ -35,7 +35,7 @@ class TestBuyingLand:
                     assert player.cash == _cash - land.land_price
                     assert land.stock.earning == int(land.land_price * land.stock.payout_ratio)
                     assert player.lands[land.id].houses == 0
-                    assert board.credentials[land.id].houses == 0
+                    assert board.ownership.get_credential(land).houses == 0
                     assert mock_construct.call_count == 1
 
     def test_success_opening(self, board: Board, player: Player, land: Land):
@@ -53,7 +53,7 @@ class TestBuyingLand:
                     assert player.cash == _cash - land.land_price
                     assert land.stock.earning == int(land.land_price * land.stock.payout_ratio)
                     assert player.lands[land.id].houses == 0
-                    assert board.credentials[land.id].houses == 0
+                    assert board.ownership.get_credential(land).houses == 0
                     assert mock_construct.call_count == 1
 
     def test_success_is_free(self, board: Board, player: Player, land: Land):
@@ -67,7 +67,7 @@ class TestBuyingLand:
                 assert player.cash == _cash
                 assert land.stock.earning == int(land.land_price * land.stock.payout_ratio)
                 assert player.lands[land.id].houses == 0
-                assert board.credentials[land.id].houses == 0
+                assert board.ownership.get_credential(land).houses == 0
                 assert mock_construct.call_count == 0
 
     def test_failed_insufficient_cash(self, board: Board, player: Player, land: Land):
@@ -83,8 +83,7 @@ class TestBuyingLand:
             assert land.stock.earning == 0
             with pytest.raises(KeyError):
                 assert player.lands[land.id]
-            with pytest.raises(KeyError):
-                assert board.credentials[land.id]
+            assert board.ownership.get_credential(land) is None
 
     def test_failed_has_owner(self, board: Board, player: Player, land: Land):
         land.has_owner = True
@@ -111,7 +110,7 @@ class TestBuyingOcean:
             assert ocean.has_owner is True
             assert player.cash == _cash - ocean.land_price
             assert player.lands[ocean.id].houses == 0
-            assert board.credentials[ocean.id].houses == 0
+            assert board.ownership.get_credential(ocean).houses == 0
 
     def test_success_is_free(self, board: Board, player: Player, ocean: Ocean):
         _cash = player.cash
@@ -121,7 +120,7 @@ class TestBuyingOcean:
         assert ocean.has_owner is True
         assert player.cash == _cash
         assert player.lands[ocean.id].houses == 0
-        assert board.credentials[ocean.id].houses == 0
+        assert board.ownership.get_credential(ocean).houses == 0
 
     def test_failed_insufficient_cash(self, board: Board, player: Player, ocean: Ocean):
         player.cash = 1
@@ -135,8 +134,7 @@ class TestBuyingOcean:
             assert player.cash == _cash
             with pytest.raises(KeyError):
                 assert player.lands[ocean.id]
-            with pytest.raises(KeyError):
-                assert board.credentials[ocean.id]
+            assert board.ownership.get_credential(ocean) is None
 
     def test_failed_has_owner(self, board: Board, player: Player, ocean: Ocean):
         ocean.has_owner = True
@@ -167,8 +165,7 @@ class TestSellingLand:
             assert player.incoming == 0
             with pytest.raises(KeyError):
                 assert player.lands[land.id]
-            with pytest.raises(KeyError):
-                assert board.credentials[land.id]
+            assert board.ownership.get_credential(land) is None
 
     def test_success_opening(self, board: Board, player_land: PlayerLand):
         player, land = player_land.player, player_land.land
@@ -186,8 +183,7 @@ class TestSellingLand:
             assert player.incoming == 0
             with pytest.raises(KeyError):
                 assert player.lands[land.id]
-            with pytest.raises(KeyError):
-                assert board.credentials[land.id]
+            assert board.ownership.get_credential(land) is None
 
     def test_success_silent(self, board: Board, player_land: PlayerLand):
         player, land = player_land.player, player_land.land
@@ -203,8 +199,7 @@ class TestSellingLand:
             assert player.incoming == 0
             with pytest.raises(KeyError):
                 assert player.lands[land.id]
-            with pytest.raises(KeyError):
-                assert board.credentials[land.id]
+            assert board.ownership.get_credential(land) is None
             assert mock_print.call_count == 0
 
     def test_failed_has_owner(self, board: Board, player_land: PlayerLand):
@@ -223,7 +218,7 @@ class TestSellingLand:
 
     def test_failed_credential_player(self, board: Board, player_land: PlayerLand, new_player: Player):
         player, land = player_land.player, player_land.land
-        player_land.player = new_player
+        board.ownership.transfer(land, new_player)
 
         with mock.patch("monopoly.models.interfaces.menus.input", side_effect=("i", "m", "s")):
             _cash = player.cash
@@ -250,8 +245,7 @@ class TestSellingOcean:
             assert player.incoming == 0
             with pytest.raises(KeyError):
                 assert player.lands[ocean.id]
-            with pytest.raises(KeyError):
-                assert board.credentials[ocean.id]
+            assert board.ownership.get_credential(ocean) is None
 
     def test_success_silent(self, board: Board, player_ocean: PlayerLand):
         player, ocean = player_ocean.player, player_ocean.land
@@ -266,8 +260,7 @@ class TestSellingOcean:
             assert player.incoming == 0
             with pytest.raises(KeyError):
                 assert player.lands[ocean.id]
-            with pytest.raises(KeyError):
-                assert board.credentials[ocean.id]
+            assert board.ownership.get_credential(ocean) is None
             assert mock_print.call_count == 0
 
     def test_failed_has_owner(self, board: Board, player_ocean: PlayerLand):
@@ -285,7 +278,7 @@ class TestSellingOcean:
 
     def test_failed_credential_player(self, board: Board, player_ocean: PlayerLand, new_player: Player):
         player, ocean = player_ocean.player, player_ocean.land
-        player_ocean.player = new_player
+        board.ownership.transfer(ocean, new_player)
 
         with mock.patch("monopoly.models.interfaces.menus.input", side_effect=("i", "m", "s")):
             _cash = player.cash
@@ -391,12 +384,11 @@ class TestConstructionLand:
                 assert land.stock.payment == int(land.sale_value * land.stock.payout_ratio)
                 with pytest.raises(KeyError):
                     assert player.lands[land.id]
-                with pytest.raises(KeyError):
-                    assert board.credentials[land.id]
+                assert board.ownership.get_credential(land) is None
 
     def test_failed_upperbound(self, board: Board, player_land: PlayerLand):
         player, land = player_land.player, player_land.land
-        player_land.houses = 4
+        player_land.ownership.set_houses(player_land.land, 4)
 
         with mock.patch("monopoly.models.interfaces.menus.input", side_effect=("i", "m", "b")):
             with mock.patch("monopoly.models.equipments.players.configs.BUILDING_UPPERBOUND", new=4):
@@ -428,7 +420,7 @@ class TestConstructionOcean:
 class TestDemolitionLand:
     def test_success(self, board: Board, player_land: PlayerLand):
         player, land = player_land.player, player_land.land
-        player_land.houses = 2
+        player_land.ownership.set_houses(player_land.land, 2)
 
         with mock.patch("monopoly.models.interfaces.menus.input", side_effect=("i", "m", "d", "c")):
             _cash = player.cash
@@ -443,7 +435,7 @@ class TestDemolitionLand:
 
     def test_success_twice(self, board: Board, player_land: PlayerLand):
         player, land = player_land.player, player_land.land
-        player_land.houses = 3
+        player_land.ownership.set_houses(player_land.land, 3)
 
         with mock.patch("monopoly.models.interfaces.menus.input", side_effect=("i", "m", "d", "d", "c")):
             _cash = player.cash
@@ -458,7 +450,7 @@ class TestDemolitionLand:
 
     def test_success_opening(self, board: Board, player_land: PlayerLand):
         player, land = player_land.player, player_land.land
-        player_land.houses = 2
+        player_land.ownership.set_houses(player_land.land, 2)
         for _ in range(10):
             board.opening_stocks()
 
@@ -475,7 +467,7 @@ class TestDemolitionLand:
 
     def test_success_silent(self, board: Board, player_land: PlayerLand):
         player, land = player_land.player, player_land.land
-        player_land.houses = 1
+        player_land.ownership.set_houses(player_land.land, 1)
 
         with mock.patch("monopoly.models.equipments.players.print") as mock_print:
             _cash = player.cash
@@ -491,7 +483,7 @@ class TestDemolitionLand:
 
     def test_failed_houses(self, board: Board, player_land: PlayerLand):
         player, land = player_land.player, player_land.land
-        player_land.houses = 0
+        player_land.ownership.set_houses(player_land.land, 0)
 
         with mock.patch("monopoly.models.interfaces.menus.input", side_effect=("i", "m", "d", "c")):
             _cash = player.cash
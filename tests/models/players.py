@@ -1,7 +1,10 @@
 from unittest import mock
 
+import pytest
+
 from monopoly.models.boards import Board
 from monopoly.models.equipments.players import Player, PlayerLand, PlayerStock
+from monopoly.models.properties import Land
 
 
 class TestPlayerBankrupt:
@@ -11,7 +14,7 @@ class TestPlayerBankrupt:
         player_land: PlayerLand,
         player_stock: PlayerStock,
     ):
-        player_land.houses = 1
+        player_land.ownership.set_houses(player_land.land, 1)
         player, land, stock = player_land.player, player_land.land, player_stock.stock
 
         _cash = player.cash
@@ -24,6 +27,55 @@ class TestPlayerBankrupt:
         )
 
 
+class TestOwnership:
+    def test_success_transfer(
+        self,
+        board: Board,
+        player_land: PlayerLand,
+        new_player: Player,
+    ):
+        player, land = player_land.player, player_land.land
+        board.ownership.set_houses(land, 2)
+        player_land.tolls = 100
+
+        credential = board.ownership.transfer(land, new_player)
+
+        assert credential is not player_land
+        assert credential.houses == player_land.houses == 2
+        assert board.ownership.get_owner(land) == new_player
+        assert list(board.ownership.credentials) == [credential]
+        assert new_player.lands == {land.id: credential}
+        assert new_player.count_area_lands(land.area) == 1
+        assert not player.lands
+        assert player.count_area_lands(land.area) == 0
+        # the old holding still tells whose it was and what it earned
+        assert player_land.player == player
+        assert player_land.tolls == 100
+
+    def test_success_bank(
+        self,
+        board: Board,
+        player_land: PlayerLand,
+    ):
+        player, land = player_land.player, player_land.land
+        board.ownership.set_houses(land, 2)
+
+        assert board.ownership.transfer(land, None) is None
+        assert land.has_owner is False
+        assert board.ownership.get_owner(land) is None
+        assert board.ownership.get_houses(land) == 0
+        assert not list(board.ownership.credentials)
+        assert not player.lands
+
+    def test_failed_houses(
+        self,
+        board: Board,
+        land: Land,
+    ):
+        with pytest.raises(AssertionError):
+            board.ownership.set_houses(land, 6)
+
+
 class TestPlayerPreparePayment:
     def test_success(
         self,
@@ -59,7 +111,7 @@ class TestPlayerPreparePayment:
         player_land: PlayerLand,
         player_stock: PlayerStock,
     ):
-        player_land.houses = 1
+        player_land.ownership.set_houses(player_land.land, 1)
         player, land, stock = player_land.player, player_land.land, player_stock.stock
 
         with mock.patch("monopoly.models.equipments.players.Player.bankrupt") as mock_bankrupt:
@@ -85,7 +137,7 @@ class TestPlayerPreparePayment:
         player_land: PlayerLand,
         player_stock: PlayerStock,
     ):
-        player_land.houses = 1
+        player_land.ownership.set_houses(player_land.land, 1)
         player, land, stock = player_land.player, player_land.land, player_stock.stock
 
         with mock.patch("monopoly.models.equipments.players.Player.bankrupt") as mock_bankrupt:
@@ -105,7 +157,7 @@ class TestPlayerPreparePayment:
         player_land: PlayerLand,
         player_stock: PlayerStock,
     ):
-        player_land.houses = 1
+        player_land.ownership.set_houses(player_land.land, 1)
         player, land, stock = player_land.player, player_land.land, player_stock.stock
 
         with mock.patch("monopoly.models.equipments.players.Player.bankrupt") as mock_bankrupt:
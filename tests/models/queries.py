@@ -0,0 +1,74 @@
+import pytest
+
+from monopoly.constants import Area, StockType
+from monopoly.models.properties.queries import AreaClause, RankClause, StockIndex, parse_filters
+from monopoly.tools.benchmarks import load_board
+
+
+@pytest.fixture(name="index")
+def fixture_index() -> StockIndex:
+    board = load_board()
+    return StockIndex(stock for stock in board.stocks.values() if stock.type == StockType.STOCK)
+
+
+class TestParseFilters:
+    def test_success(
+        self,
+    ):
+        assert parse_filters("GREEN+BLUE,市值|10,高股息|-5") == (
+            AreaClause(frozenset((Area.GREEN, Area.BLUE))),
+            RankClause("市值", 10, True),
+            RankClause("高股息", 5, False),
+        )
+        assert not parse_filters("")
+
+    @pytest.mark.parametrize("text", ["UNKNOWN", "市值", "未知|3", "市值|x"])
+    def test_failed(
+        self,
+        text: str,
+    ):
+        with pytest.raises(ValueError):
+            parse_filters(text)
+
+
+class TestStockIndex:
+    def test_success_select(
+        self,
+        index: StockIndex,
+    ):
+        stocks = index.select(parse_filters("市值|20,市值|-10"))
+        largest = sorted(index.stocks, key=lambda stock: stock.amount * stock.value, reverse=True)[:20]
+        assert stocks == sorted(largest, key=lambda stock: stock.amount * stock.value)[:10]
+
+        stocks = index.select(parse_filters("GREEN+RED,低波動|3"))
+        assert len(stocks) == 3
+        assert {stock.land.area for stock in stocks} <= {Area.GREEN, Area.RED}
+        assert [stock.beta for stock in stocks] == sorted(stock.beta for stock in stocks)
+
+    def test_success_stable_ties(
+        self,
+        index: StockIndex,
+    ):
+        for stock in index.stocks:
+            stock.payout_ratio = .5
+        positions = list(range(len(index.stocks)))[::-1]
+        assert index.rank(positions, "高股息") == positions
+
+    @pytest.mark.parametrize("weighting", ["市值", "高股息", "等權重"])
+    def test_success_weigh(
+        self,
+        index: StockIndex,
+        weighting: str,
+    ):
+        constituents = index.weigh(index.select(parse_filters("ESG|5")), weighting)
+        assert len(constituents) == 5
+        assert sum(percent for _, percent in constituents) == pytest.approx(1.)
+        percents = [percent for _, percent in constituents]
+        assert percents == sorted(percents, reverse=True)
+
+    def test_failed_weigh(
+        self,
+        index: StockIndex,
+    ):
+        with pytest.raises(ValueError):
+            index.weigh(index.stocks, "未知")
@@ -4,6 +4,7 @@ import pytest
 
 from monopoly.constants import CardType
 from monopoly.models.boards import Board, BoardPlayer
+from monopoly.models.equipments import Deck
 from monopoly.models.equipments import spaces as models
 from monopoly.models.equipments.players import Player, PlayerLand
 
@@ -30,7 +31,8 @@ class TestCardSpace:
         chance_space: models.CardSpace,
     ):
         mock_card = mock.Mock()
-        board.cards[CardType.CHANCE] = [mock_card]
+        board.cards[CardType.CHANCE] = Deck(card_type=CardType.CHANCE)
+        board.cards[CardType.CHANCE].add(mock_card)
 
         with mock.patch("monopoly.models.equipments.spaces.input") as mock_input:
             chance_space.arrive(player, board=board)
@@ -46,7 +48,8 @@ class TestCardSpace:
         community_chest_space: models.CardSpace,
     ):
         mock_card = mock.Mock()
-        board.cards[CardType.COMMUNITY_CHEST] = [mock_card]
+        board.cards[CardType.COMMUNITY_CHEST] = Deck(card_type=CardType.COMMUNITY_CHEST)
+        board.cards[CardType.COMMUNITY_CHEST].add(mock_card)
 
         with mock.patch("monopoly.models.equipments.spaces.input") as mock_input:
             community_chest_space.arrive(player, board=board)
@@ -148,11 +151,10 @@ class TestLandSpace:
 
                 land_space.arrive(player, board=board)
 
+                # what buying itself does is covered by TestBuyingLand
                 assert land.has_owner is True
                 assert player.cash == _cash - land.land_price
-                assert land.stock.earning == int(land.land_price * land.stock.payout_ratio)
-                assert player.lands[land.id].houses == 0
-                assert board.credentials[land.id].houses == 0
+                assert board.ownership.get_credential(land) is player.lands[land.id]
 
     def test_success_arrive_tolling(
         self,
@@ -208,8 +210,8 @@ class TestLandSpace:
     ):
         player, land = player_land.player, player_land.land
         board.current_player, new_player = new_board_player, new_board_player.player
-        player_land.houses = 1
-        player.get_or_create_player_land(board.lands["1002"])
+        player_land.ownership.set_houses(player_land.land, 1)
+        board.ownership.transfer(board.lands["1002"], player)
 
         with mock.patch("monopoly.models.equipments.players.input") as mock_input:
             _cash = player.cash
@@ -2,6 +2,7 @@ from unittest import mock
 
 import pytest
 
+from monopoly.constants import StockType
 from monopoly.models.boards import Board
 from monopoly.models.equipments.players import Player, PlayerStock
 from monopoly.models.properties.stocks import ETF, Stock
@@ -353,3 +354,64 @@ class TestSellingEtf:
                 assert etf.amount == _amount
                 assert player.incoming == 0
                 assert player.stocks[etf.id].amount == 0
+
+
+class TestRebalancingEtf:
+    def test_success(self, board: Board, etf: ETF):
+        etf.rebalance_interval = 3
+        for _ in range(3):
+            board.opening_stocks()
+
+        caps = [constituent.stock.amount * constituent.stock.value for constituent in etf.constituents]
+        for constituent, cap in zip(etf.constituents, caps):
+            assert constituent.percent == pytest.approx(cap / sum(caps))
+        assert etf.openings == 3
+
+    def test_success_value_continuous(self, board: Board, etf: ETF):
+        stock = etf.constituents[0].stock
+        stock.value *= 2
+        etf.value = value = int(sum(constituent.value for constituent in etf.constituents) * .9)
+        percent = etf.constituents[0].percent
+
+        etf.rebalance()
+
+        assert etf.value == value
+        assert etf.constituents[0].percent > percent
+        assert sum(constituent.percent for constituent in etf.constituents) == pytest.approx(1)
+        assert board.stocks[stock.id].value == stock.value
+
+    def test_success_not_due(self, board: Board, etf: ETF):
+        etf.rebalance_interval = 3
+        percents = [constituent.percent for constituent in etf.constituents]
+        for constituent in etf.constituents:
+            constituent.stock.value *= 2
+
+        board.opening_stocks()
+
+        assert [constituent.percent for constituent in etf.constituents] == percents
+
+    def test_success_reselected(self, board: Board, etf: ETF):
+        ranked = board.stocks["0025"]
+        ranked.rebalance_interval = etf.rebalance_interval = 1
+        members = {constituent.stock.id for constituent in etf.constituents}
+        outsider = next(
+            stock for stock in board.stocks.values()
+            if stock.type == StockType.STOCK
+            and stock.id not in {constituent.stock.id for constituent in ranked.constituents}
+        )
+        outsider.value = 1 << 24
+
+        board.opening_stocks()
+
+        assert ranked.filters == "市值|10"
+        assert len(ranked.constituents) == 10
+        assert ranked.constituents[0].stock.id == outsider.id
+        assert sum(constituent.percent for constituent in ranked.constituents) == pytest.approx(1)
+        # an area ETF keeps its members
+        assert not etf.ranked
+        assert {constituent.stock.id for constituent in etf.constituents} == members
+
+    def test_success_static_weighting(self, board: Board):
+        etf = board.stocks["0026"]
+        assert etf.weighting == "高股息"
+        assert not etf.rebalanceable
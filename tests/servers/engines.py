@@ -0,0 +1,161 @@
+import asyncio
+from unittest import mock
+
+from monopoly.servers import AsyncServerEngine, LocalClient, ShardedServerEngine, route_table
+
+
+class TestAsyncServerEngine:
+    def test_success_tables(
+        self,
+        async_server_engine: AsyncServerEngine,
+    ):
+        async def _execute():
+            await async_server_engine.start()
+            try:
+                first = await LocalClient(*async_server_engine.address).connect("_test1")
+                second = await LocalClient(*async_server_engine.address).connect("_test2")
+                await first.read_until("[C]ancel to Exit")
+                await second.read_until("[C]ancel to Exit")
+
+                # an idle table never blocks the others
+                await first.send("n", "2", "_test1", "_test2")
+                await first.read_until("[SAVE] Game")
+                assert async_server_engine.stats == {"tables": 2, "attached": 2, "evicted": 0}
+
+                await first.send("c", "y")
+                assert "_test2 優勝!!" in await first.read_closed()
+            finally:
+                await async_server_engine.close()
+            assert async_server_engine.stats == {"tables": 0, "attached": 0, "evicted": 0}
+
+        asyncio.run(_execute())
+
+    def test_success_eviction(
+        self,
+        async_server_engine: AsyncServerEngine,
+    ):
+        async def _execute():
+            await async_server_engine.start()
+            try:
+                client = await LocalClient(*async_server_engine.address).connect("_test")
+                await client.read_until("[C]ancel to Exit")
+                await client.send("n", "2", "_test1", "_test2")
+                await client.read_until("[SAVE] Game")
+                await client.close()
+
+                await asyncio.sleep(async_server_engine.idle_timeout * 2)
+                assert tuple(async_server_engine.snapshots) == ("_test",)
+                assert async_server_engine.stats["tables"] == 0
+
+                client = await LocalClient(*async_server_engine.address).connect("_test")
+                assert "_test1 請選擇要執行的動作" in await client.read_until("[SAVE] Game")
+                assert async_server_engine.stats == {"tables": 1, "attached": 1, "evicted": 0}
+            finally:
+                await async_server_engine.close()
+            assert tuple(async_server_engine.snapshots) == ("_test",)
+
+        asyncio.run(_execute())
+
+    def test_failed_table_error(
+        self,
+        async_server_engine: AsyncServerEngine,
+    ):
+        async def _execute():
+            await async_server_engine.start()
+            try:
+                client = await LocalClient(*async_server_engine.address).connect("_test")
+                await client.read_until("[C]ancel to Exit")
+                with mock.patch("monopoly.engines.Board.run", side_effect=ValueError):
+                    await client.send("n", "2", "_test1", "_test2")
+                    # the crash ends its own table, the server keeps hosting the others
+                    assert "出現非預期錯誤" in await client.read_closed()
+
+                other = await LocalClient(*async_server_engine.address).connect("_other")
+                await other.read_until("[C]ancel to Exit")
+                assert async_server_engine.stats == {"tables": 1, "attached": 1, "evicted": 1}
+            finally:
+                await async_server_engine.close()
+
+        with mock.patch("monopoly.engines.configs.DEBUG_MODE", new=False):
+            with mock.patch("monopoly.engines.sys.exit") as mock_exit:
+                asyncio.run(_execute())
+
+                assert mock_exit.call_count == 0
+
+    def test_failed_attached(
+        self,
+        async_server_engine: AsyncServerEngine,
+    ):
+        async def _execute():
+            await async_server_engine.start()
+            try:
+                first = await LocalClient(*async_server_engine.address).connect("_test")
+                await first.read_until("[C]ancel to Exit")
+                client = await LocalClient(*async_server_engine.address).connect("_test")
+                assert "已有連線" in await client.read_closed()
+            finally:
+                await async_server_engine.close()
+
+        asyncio.run(_execute())
+
+
+class TestShardedServerEngine:
+    def test_success_migrate(
+        self,
+        sharded_server_engine: ShardedServerEngine,
+    ):
+        async def _execute():
+            await sharded_server_engine.start()
+            try:
+                client = await LocalClient(*sharded_server_engine.address).connect("_test")
+                await client.read_until("[C]ancel to Exit")
+                await client.send("n", "2", "_test1", "_test2")
+                await client.read_until("[SAVE] Game")
+
+                source = route_table("_test", sharded_server_engine.shards)
+                health = await sharded_server_engine.health()
+                assert all(shard["alive"] and shard["responsive"] for shard in health)
+                assert [shard["tables"] for shard in health] == [
+                    int(index == source) for index in range(sharded_server_engine.shards)
+                ]
+
+                target = 1 - source
+                await sharded_server_engine.migrate("_test", target)
+                await client.read_closed()
+                assert sharded_server_engine.route("_test").index == target
+
+                client = await LocalClient(*sharded_server_engine.address).connect("_test")
+                assert "_test1 請選擇要執行的動作" in await client.read_until("[SAVE] Game")
+                health = await sharded_server_engine.health()
+                assert health[target]["tables"] == 1
+                assert health[source]["tables"] == health[source]["evicted"] == 0
+            finally:
+                await sharded_server_engine.close()
+
+        asyncio.run(_execute())
+
+    def test_success_rebalance(
+        self,
+        sharded_server_engine: ShardedServerEngine,
+    ):
+        table_ids = [
+            f"_test{idx}"
+            for idx in range(32)
+            if route_table(f"_test{idx}", sharded_server_engine.shards) == 0
+        ][:3]
+
+        async def _execute():
+            await sharded_server_engine.start()
+            try:
+                for table_id in table_ids:
+                    client = await LocalClient(*sharded_server_engine.address).connect(table_id)
+                    await client.read_until("[C]ancel to Exit")
+
+                migrations = await sharded_server_engine.rebalance()
+                assert len(migrations) == 1
+                assert sharded_server_engine.route(migrations[0][0]).index == 1
+            finally:
+                await sharded_server_engine.close()
+            assert not sharded_server_engine.workers
+
+        asyncio.run(_execute())
@@ -0,0 +1,88 @@
+import pickle
+import random
+import statistics
+
+import pytest
+
+from monopoly.simulations import GameAggregator, QuantileSketch, RunningStats, simulate_game
+
+
+class TestRunningStats:
+    def test_success(
+        self,
+    ):
+        values = [random.Random(0).gauss(10, 3) for _ in range(500)]
+        stats, left, right = RunningStats(), RunningStats(), RunningStats()
+        for value in values:
+            stats.push(value)
+        for value in values[:123]:
+            left.push(value)
+        for value in values[123:]:
+            right.push(value)
+        left.merge(right)
+
+        for merged in (stats, left):
+            assert merged.count == 500
+            assert merged.mean == pytest.approx(statistics.mean(values))
+            assert merged.variance == pytest.approx(statistics.variance(values))
+            assert (merged.minimum, merged.maximum) == (min(values), max(values))
+
+
+class TestQuantileSketch:
+    def test_success(
+        self,
+    ):
+        rng = random.Random(0)
+        values = sorted(rng.uniform(-1, 1) * 10 ** rng.randint(0, 3) for _ in range(2000))
+        sketch, left, right = QuantileSketch(.01), QuantileSketch(.01), QuantileSketch(.01)
+        for idx, value in enumerate(values):
+            sketch.add(value)
+            (left if idx % 2 else right).add(value)
+        left.merge(right)
+
+        for rate in (.05, .25, .5, .75, .95):
+            expected = values[int(rate * (len(values) - 1))]
+            assert sketch.quantile(rate) == pytest.approx(expected, rel=.011)
+            assert left.quantile(rate) == sketch.quantile(rate)
+
+    def test_success_bounded(
+        self,
+    ):
+        sketch = QuantileSketch(.01, max_buckets=16)
+        for value in range(1, 10000):
+            sketch.add(value)
+
+        assert len(sketch.positives) <= 16
+        assert sketch.quantile(1.) == pytest.approx(9999, rel=.011)
+
+
+class TestGameAggregator:
+    def test_success(
+        self,
+    ):
+        results = [simulate_game(seed, max_turns=100, statistics=True) for seed in range(3)]
+        aggregator = GameAggregator()
+        for result in results:
+            aggregator.merge(pickle.loads(pickle.dumps(result.statistics)))
+
+        report = aggregator.report()
+        assert report["games"] == 3
+        assert sum(report["win_rate"].values()) == pytest.approx(1.)
+        assert report["turns"]["mean"] == pytest.approx(statistics.mean(result.turns for result in results))
+        assert report["turns"]["count"] == 3
+        assert sum(report["bankruptcies"].values()) == sum(result.finished for result in results)
+        assert set(report["returns"]) == {stock_id for _, stock_id, _ in results[0].prices}
+        assert report["tracking_error"]
+        assert all(value >= 0 for value in report["tracking_error"].values())
+
+    def test_success_record(
+        self,
+    ):
+        result = simulate_game(0, max_turns=50)
+        aggregator = GameAggregator()
+        aggregator.record(result)
+
+        assert result.statistics is None
+        assert aggregator.games == 1
+        assert {land_id for land_id, *_ in result.ownerships} == set(aggregator.tolls)
+        assert not aggregator.returns
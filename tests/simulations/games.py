@@ -0,0 +1,54 @@
+import pickle
+import random
+
+from monopoly.models.hashes import compute_state_hash
+from monopoly.simulations import BotPolicy, BotTerminal, simulate_game
+
+
+class TestSimulateGame:
+    def test_success(
+        self,
+    ):
+        state = random.getstate()
+        result = simulate_game(1, max_turns=300)
+
+        assert random.getstate() == state
+        assert result == simulate_game(1, max_turns=300)
+        assert 0 < result.turns <= 300
+        assert [player[:2] for player in result.players] == [(0, "bot1"), (1, "bot2")]
+        assert result.winner in ("bot1", "bot2")
+        assert all(start <= end <= result.turns for _, _, _, start, end, _, _ in result.ownerships)
+        assert result.snapshot is None
+
+    def test_success_max_turns(
+        self,
+    ):
+        result = simulate_game(0, players=3, max_turns=5, snapshot=True)
+
+        assert result.turns == 5
+        assert result.finished is False
+        assert len(result.players) == 3
+        assert result.snapshot
+
+    def test_success_state_hash(
+        self,
+    ):
+        board = pickle.loads(simulate_game(2, players=3, max_turns=100, snapshot=True).snapshot)
+        other = pickle.loads(simulate_game(2, players=3, max_turns=100, snapshot=True).snapshot)
+
+        assert board.state_hash.value == compute_state_hash(board) == other.state_hash.value
+        assert all(player.state_hash is board.state_hash for player in board.players)
+
+
+class TestBotTerminal:
+    def test_success_patience(
+        self,
+    ):
+        terminal = BotTerminal(("bot1", "bot2"), BotPolicy(patience=2))
+
+        answers = []
+        for _ in range(5):
+            terminal.write("[D]ice to Play\n")
+            answers.append(terminal.readline())
+
+        assert answers == ["D\n", "D\n", "D\n", "C\n", "C\n"]
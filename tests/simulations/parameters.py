@@ -0,0 +1,53 @@
+import pickle
+
+import pytest
+
+from monopoly import configs
+from monopoly.constants import StockType, TaxFee
+from monopoly.simulations import simulate_game, tuning
+
+
+class TestTuning:
+    def test_success(
+        self,
+    ):
+        with tuning({"AREA_ADDITION_RATE": 1., "HOUSE_TAX": .5}):
+            assert configs.AREA_ADDITION_RATE == 1.
+            assert TaxFee.HOUSE_TAX.value == .03
+        assert configs.AREA_ADDITION_RATE == .25
+
+    def test_success_restored_on_error(
+        self,
+    ):
+        with pytest.raises(RuntimeError), tuning({"STOCK_SHUFFLE_BASE": 0}):
+            raise RuntimeError
+        assert configs.STOCK_SHUFFLE_BASE == 100
+
+    def test_failed_unknown(
+        self,
+    ):
+        with pytest.raises(ValueError), tuning({"DEBUG_MODE": True}):
+            pass
+
+
+class TestTuneBoard:
+    def test_success(
+        self,
+    ):
+        result = simulate_game(0, max_turns=1, snapshot=True, parameters={
+            "PASS_START_POINT_CASH": 123,
+            "HOUSE_TAX": .5,
+            "STOCK_TRANSFER_TAX": .1,
+        })
+        board = pickle.loads(result.snapshot)
+
+        assert board.start_space.space.value == 123
+        assert board.fees[TaxFee.HOUSE_TAX] == .5
+        assert board.fees[TaxFee.INCOMING_TAX] == TaxFee.INCOMING_TAX.value
+        for stock in board.stocks.values():
+            if stock.type == StockType.STOCK:
+                assert stock.transfer_tax == .1
+            else:
+                assert stock.transfer_tax == TaxFee.ETF_TRANSFER_TAX.value
+        assert configs.PASS_START_POINT_CASH == 1000
+        assert TaxFee.HOUSE_TAX.value == .03
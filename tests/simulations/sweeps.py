@@ -0,0 +1,82 @@
+import math
+
+import pytest
+
+from monopoly.simulations.aggregators import GameAggregator
+from monopoly.simulations.sweeps import (
+    SWEEP_METRICS, SweepOptions, grid_points, random_points, run_sweep, separated, sweep_table,
+)
+
+
+class TestPoints:
+    def test_success_grid(
+        self,
+    ):
+        assert grid_points({"HOUSE_TAX": [.01, .05], "PASS_START_POINT_CASH": [500]}) == [
+            {"HOUSE_TAX": .01, "PASS_START_POINT_CASH": 500},
+            {"HOUSE_TAX": .05, "PASS_START_POINT_CASH": 500},
+        ]
+
+    def test_success_random(
+        self,
+    ):
+        ranges = {"HOUSE_DISCOUNT_RATE": (.5, .9), "PASS_START_POINT_CASH": (500, 1500)}
+        points = random_points(ranges, 5, seed=1)
+        assert points == random_points(ranges, 5, seed=1)
+        for point in points:
+            assert .5 <= point["HOUSE_DISCOUNT_RATE"] <= .9
+            assert isinstance(point["PASS_START_POINT_CASH"], int)
+
+    def test_failed_unknown(
+        self,
+    ):
+        with pytest.raises(ValueError):
+            grid_points({"UNKNOWN": [1]})
+
+
+class TestSeparated:
+    @pytest.mark.parametrize("intervals, expected", [
+        ([(10, 1), (13, 1), (20, 5)], True),
+        ([(10, 2), (13, 2)], False),
+        ([(10, math.inf), (100, 1)], False),
+    ])
+    def test_success(
+        self,
+        intervals: list[tuple[float, float]],
+        expected: bool,
+    ):
+        assert separated(intervals) is expected
+
+
+class TestFirstSeatInterval:
+    @pytest.mark.parametrize("wins", [0, 10])
+    def test_success(
+        self,
+        wins: int,
+    ):
+        aggregator = GameAggregator()
+        aggregator.seats[0] = [10, wins]
+
+        rate, half = SWEEP_METRICS["first-seat"](aggregator, 1.96)
+        assert rate == wins / 10
+        assert half == pytest.approx(.2775, abs=1e-4)
+
+    def test_success_empty(
+        self,
+    ):
+        assert SWEEP_METRICS["first-seat"](GameAggregator(), 1.96) == (0., math.inf)
+
+
+class TestRunSweep:
+    def test_success(
+        self,
+    ):
+        points = grid_points({"PASS_START_POINT_CASH": [500, 2000]})
+        sweep, batches = run_sweep(points, SweepOptions(games=2, max_batches=2, max_turns=20))
+
+        assert 1 <= batches <= 2
+        assert [point.aggregator.games for point in sweep] == [2 * batches] * 2
+
+        columns, rows = sweep_table(sweep)
+        assert columns[:2] == ["PASS_START_POINT_CASH", "games"]
+        assert [row[0] for row in rows] == [500, 2000]
@@ -0,0 +1,91 @@
+import multiprocessing
+import pickle
+from multiprocessing import shared_memory
+
+from monopoly import instruments
+from monopoly.simulations import TranspositionTable, simulate_game
+
+
+def _search(table: TranspositionTable) -> float:
+    table.store(7, 3, 2.5)
+    return table.probe(1)
+
+
+class TestTranspositionTable:
+    def test_success(
+        self,
+    ):
+        key = pickle.loads(simulate_game(0, max_turns=10, snapshot=True).snapshot).state_hash.value
+        with TranspositionTable(64) as table:
+            assert table.probe(key) is None
+            assert table.store(key, 2, -1.5) is True
+            assert table.probe(key) == table.probe(key, 2) == -1.5
+            assert table.probe(key, 3) is None
+            assert table.nbytes == 64 * 24
+            assert table.name is None
+
+            table.clear()
+            assert table.probe(key) is None
+
+    def test_success_depth_preferred(
+        self,
+    ):
+        with TranspositionTable(8) as table:
+            table.store(1, 3, 1.)
+
+            # another position in the same slot only replaces a result searched as deep
+            assert table.store(9, 2, 2.) is False
+            assert table.probe(1) == 1.
+            assert table.probe(9) is None
+            assert table.store(9, 3, 2.) is True
+            assert table.probe(1) is None
+            assert table.probe(9) == 2.
+
+    def test_success_shared(
+        self,
+    ):
+        with TranspositionTable(64, shared=True) as table:
+            table.store(1, 0, .5)
+            with multiprocessing.get_context("fork").Pool(2) as pool:
+                assert pool.map(_search, (table, table)) == [.5, .5]
+            assert table.probe(7, 3) == 2.5
+
+            attached = pickle.loads(pickle.dumps(table))
+            assert attached.name == table.name
+            assert attached.probe(7) == 2.5
+            attached.close()
+
+        assert pickle.loads(pickle.dumps(TranspositionTable(8))).probe(7) is None
+
+    def test_success_instruments(
+        self,
+        instruments_enabled: None,
+    ):
+        with TranspositionTable(8) as table:
+            table.store(1, 1, 1.)
+            table.store(9, 0, 1.)
+            table.probe(1)
+            table.probe(1, 2)
+
+        counters = {
+            (counter["name"], counter["label"]): counter["value"]
+            for counter in instruments.snapshot()["counters"]
+        }
+        assert counters == {
+            ("transposition.probe", "hit"): 1,
+            ("transposition.probe", "miss"): 1,
+            ("transposition.store", "kept"): 1,
+            ("transposition.store", "stored"): 1,
+        }
+
+    def test_failed_torn(
+        self,
+    ):
+        with TranspositionTable(8, shared=True) as table:
+            table.store(1, 0, 1.)
+            # a value half written by another process no longer matches the key
+            memory = shared_memory.SharedMemory(table.name)
+            memory.buf[32] ^= 1
+            memory.close()
+
+            assert table.probe(1) is None
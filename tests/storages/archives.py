@@ -0,0 +1,97 @@
+import pathlib
+
+import pytest
+
+from monopoly.storages import Archive
+
+
+class TestArchivePut:
+    def test_success(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        with Archive(tmp_path, segment_size=64) as archive:
+            archive.put("_test1", b"_test_data1")
+            assert archive.put_many((f"_test{idx}", b"_test" * idx) for idx in range(2, 10)) == 8
+            archive.put("_test1", b"_test_data2")
+
+            assert len(archive) == 9
+            assert archive.get("_test1") == b"_test_data2"
+            assert archive.get("_test9") == b"_test" * 9
+            assert archive.stats["segments"] > 1
+
+        with Archive(tmp_path) as archive:
+            assert len(archive) == 9
+            assert archive.get("_test1") == b"_test_data2"
+
+    def test_success_rebuild(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        with Archive(tmp_path, segment_size=64) as archive:
+            archive.put_many((f"_test{idx}", b"_test" * idx) for idx in range(10))
+        (tmp_path / "index").unlink()
+
+        with Archive(tmp_path) as archive:
+            assert sorted(archive.keys()) == sorted(f"_test{idx}" for idx in range(10))
+            assert archive.get("_test3") == b"_test" * 3
+
+
+class TestArchiveCompact:
+    def test_success(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        with Archive(tmp_path, segment_size=1 << 20) as archive:
+            for idx in range(10):
+                archive.put("_test", b"_test" * idx)
+            archive.put("_test_deleted", b"_test")
+            archive.delete("_test_deleted")
+            before = archive.stats
+
+            archive.compact()
+
+            assert archive.stats["total_bytes"] < before["total_bytes"]
+            assert archive.stats["live_bytes"] == before["live_bytes"]
+            assert archive.get("_test") == b"_test" * 9
+            assert "_test_deleted" not in archive
+
+        with Archive(tmp_path) as archive:
+            assert list(archive.keys()) == ["_test"]
+
+    def test_success_periodic(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        with Archive(tmp_path, segment_size=128, compact_ratio=.5) as archive:
+            for idx in range(100):
+                archive.put("_test", b"_test%03d" % idx)
+
+            assert archive.stats["segments"] <= 3
+            assert archive.get("_test") == b"_test099"
+
+
+class TestArchiveReadonly:
+    def test_success(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        with Archive(tmp_path) as archive:
+            archive.put("_test", b"_test_data")
+        (tmp_path / "index").unlink()
+
+        with Archive(tmp_path, readonly=True) as archive:
+            assert archive.get("_test") == b"_test_data"
+            with pytest.raises(PermissionError):
+                archive.put("_test", b"_test_data")
+            with pytest.raises(PermissionError):
+                archive.delete("_test")
+        assert not (tmp_path / "index").exists()
+
+    def test_failed_missing(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        with pytest.raises(FileNotFoundError):
+            Archive(tmp_path / "_test_missing", readonly=True)
+        assert not (tmp_path / "_test_missing").exists()
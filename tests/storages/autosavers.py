@@ -0,0 +1,73 @@
+import pathlib
+import pickle
+import threading
+from unittest import mock
+
+from monopoly.storages import AutoSaver
+
+
+class TestAutoSaverCapture:
+    def test_success(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        autosaver = AutoSaver(tmp_path, turns=2, rotation=2)
+        results = [autosaver.capture({"turn": turn}) for turn in range(6)]
+        autosaver.close()
+
+        assert results == [False, True] * 3
+        assert autosaver.stats["captured"] == 3
+        assert autosaver.stats["written"] + autosaver.stats["coalesced"] == 3
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            path.name
+            for path in autosaver.filepaths
+        ][:autosaver.stats["written"]]
+        assert pickle.loads(autosaver.filepaths[0].read_bytes())["turn"] % 2 == 1
+
+    def test_success_disabled(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        autosaver = AutoSaver(tmp_path, turns=0, rotation=2)
+
+        assert autosaver.capture({"turn": 0}) is False
+        assert not tuple(tmp_path.iterdir())
+
+
+class TestAutoSaverSubmit:
+    def test_success_coalesced(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        autosaver = AutoSaver(tmp_path, turns=1, rotation=3)
+        writing, release = threading.Event(), threading.Event()
+        write = autosaver.write
+
+        def _write(snapshot: bytes, summary: None) -> pathlib.PosixPath:
+            writing.set()
+            release.wait()
+            return write(snapshot, summary)
+
+        with mock.patch.object(autosaver, "write", side_effect=_write):
+            autosaver.submit(b"first")
+            writing.wait()
+            for snapshot in (b"second", b"third", b"fourth"):
+                autosaver.submit(snapshot)
+            release.set()
+            autosaver.close()
+
+        assert autosaver.stats == {"turns": 0, "captured": 4, "coalesced": 2, "written": 2}
+        assert {path.read_bytes() for path in tmp_path.iterdir()} == {b"first", b"fourth"}
+
+    def test_success_rotation(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        autosaver = AutoSaver(tmp_path, turns=1, rotation=2)
+        for snapshot in (b"first", b"second", b"third"):
+            autosaver.submit(snapshot)
+            autosaver.flush()
+        autosaver.close()
+
+        assert len(tuple(tmp_path.iterdir())) == 2
+        assert {path.read_bytes() for path in tmp_path.iterdir()} == {b"second", b"third"}
@@ -0,0 +1,86 @@
+import pathlib
+
+import pytest
+
+from monopoly.storages import SaveCatalog, SaveEntry
+
+
+@pytest.fixture(name="catalog")
+def fixture_catalog(tmp_path: pathlib.PosixPath) -> SaveCatalog:
+    catalog = SaveCatalog(tmp_path / "catalog.sqlite3")
+    for idx in range(25):
+        catalog.record(SaveEntry(
+            name=f"_test_{'a' if idx % 2 else 'b'}{idx:02}.sav",
+            players="_test1,_test2",
+            turns=idx,
+            saved_at=1700000000. + idx,
+            size=1024,
+            fixture_hash="_test_hash",
+        ))
+    return catalog
+
+
+class TestSaveCatalogSearch:
+    def test_success_paging(
+        self,
+        catalog: SaveCatalog,
+    ):
+        pages = [catalog.search(page=page, per_page=10) for page in range(4)]
+
+        assert [len(page) for page in pages] == [10, 10, 5, 0]
+        assert catalog.count() == 25
+        names = [entry.name for page in pages for entry in page]
+        assert names == sorted(names)
+
+    def test_success_prefix(
+        self,
+        catalog: SaveCatalog,
+    ):
+        entries = catalog.search("_test_a")
+
+        assert len(entries) == catalog.count("_test_a") == 12
+        assert all(entry.turns % 2 for entry in entries)
+        assert not catalog.search("_test_c")
+
+
+class TestSaveCatalogRecord:
+    def test_success_replace(
+        self,
+        catalog: SaveCatalog,
+    ):
+        catalog.record(SaveEntry(name="_test_a01.sav", players="_test3", turns=99))
+        catalog.remove("_test_b00.sav")
+
+        assert catalog.count() == 24
+        assert catalog.get("_test_a01.sav").players == "_test3"
+        assert catalog.get("_test_b00.sav") is None
+
+
+class TestSaveCatalogReconcile:
+    def test_success(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        for idx in range(3):
+            (tmp_path / f"_test_{idx}.sav").write_bytes(b"_test" * idx)
+
+        catalog = SaveCatalog(tmp_path / "catalog.sqlite3")
+        assert catalog.created
+        assert catalog.reconcile(tmp_path.glob("*.sav")) == 3
+
+        assert [entry.size for entry in catalog.search()] == [0, 5, 10]
+        assert SaveCatalog(tmp_path / "catalog.sqlite3").created is False
+        assert catalog.reconcile(tmp_path.glob("*.sav")) == 0
+
+    def test_success_crashed(
+        self,
+        catalog: SaveCatalog,
+        tmp_path: pathlib.PosixPath,
+    ):
+        # saved over an indexed save but crashed before recording it, every other row lost its save
+        (tmp_path / "_test_a01.sav").write_bytes(b"_test")
+
+        assert catalog.reconcile(tmp_path.glob("*.sav")) == 25
+        assert [entry.name for entry in catalog.search()] == ["_test_a01.sav"]
+        assert catalog.get("_test_a01.sav").turns == 0
+        assert catalog.get("_test_a01.sav").size == 5
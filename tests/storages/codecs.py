@@ -0,0 +1,73 @@
+import pickle
+from unittest import mock
+
+import pytest
+
+from monopoly.loaders import FixtureLoader
+from monopoly.storages import CODECS, decode, decode_stream, encode, encode_stream
+from monopoly.storages.codecs import CODEC_HEADER, DICTIONARY_VERSION
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("codec", tuple(CODECS))
+    def test_success(
+        self,
+        codec: str,
+    ):
+        data = pickle.dumps({"_test": list(range(1000))})
+        encoded = encode(data, codec)
+
+        assert decode(encoded) == data
+        assert b"".join(decode_stream(
+            encoded[idx:idx + 7]
+            for idx in range(0, len(encoded), 7)
+        )) == data
+        assert b"".join(encode_stream((data[:10], data[10:]), codec)) == encoded
+
+    def test_success_raw_compatible(
+        self,
+    ):
+        data = pickle.dumps("_test")
+
+        assert encode(data, "raw") == data
+        assert decode(data) == data
+
+    @pytest.mark.parametrize("codec", ("zlib", "zlib-dict", "lzma", "bz2"))
+    def test_failed_damaged(
+        self,
+        codec: str,
+    ):
+        encoded = encode(pickle.dumps({"_test": list(range(1000))}), codec)
+        damaged = encoded[:CODEC_HEADER.size] + b"\x00_test" * 32
+
+        with pytest.raises(ValueError):
+            decode(damaged)
+
+    def test_failed_codec(
+        self,
+    ):
+        with pytest.raises(ValueError):
+            encode(b"_test", "_test_codec")
+
+
+class TestDictionary:
+    def test_success(
+        self,
+    ):
+        with mock.patch("monopoly.loaders.fixture.input", side_effect=("2", "_test1", "_test2")):
+            board = FixtureLoader().execute()
+        board.start()
+        data = pickle.dumps(board.players)
+        encoded = encode(data, "zlib-dict")
+
+        assert CODEC_HEADER.unpack_from(encoded)[2] == DICTIONARY_VERSION
+        assert len(encoded) < len(encode(data, "zlib")) * .8
+
+    def test_failed_version(
+        self,
+    ):
+        encoded = encode(pickle.dumps("_test"), "zlib-dict")
+        magic, codec_id, _ = CODEC_HEADER.unpack_from(encoded)
+
+        with pytest.raises(ValueError):
+            decode(CODEC_HEADER.pack(magic, codec_id, DICTIONARY_VERSION + 1) + encoded[CODEC_HEADER.size:])
@@ -0,0 +1,59 @@
+import pathlib
+
+from monopoly.simulations import GameResult
+from monopoly.storages import ResultStore
+
+
+def make_result(game_id: str, winner: int) -> GameResult:
+    return GameResult(
+        game_id=game_id,
+        seed=0,
+        turns=100,
+        finished=True,
+        winner=f"bot{winner + 1}",
+        players=[
+            (seat, f"bot{seat + 1}", 1000, 2000, 300, 3000, str(seat != winner), "False")
+            for seat in range(2)
+        ],
+        ownerships=[("1001", "RED", winner, 10, 100, 2000, 500), ("2001", "BLUE", 1 - winner, 20, 50, 1000, 0)],
+        prices=[(2, "1001", 100), (4, "1001", 110)],
+    )
+
+
+class TestResultStore:
+    def test_success(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        with ResultStore(tmp_path / "results.sqlite3", batch_size=10) as store:
+            store.record(make_result("_test1", 0))
+            assert store.pending == 7
+            store.record(make_result("_test2", 0))
+            assert store.pending == 0
+            store.record(make_result("_test3", 1))
+
+        with ResultStore(tmp_path / "results.sqlite3") as store:
+            columns, rows = store.query("win-rate")
+            assert columns == ("seat", "games", "wins", "win_rate")
+            assert rows == [(0, 3, 2, .6667), (1, 3, 1, .3333)]
+
+            _, rows = store.query("roi")
+            assert rows[0][:5] == ("RED", 3, 6000, 1500, .25)
+            assert store.connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+    def test_success_recorded_again(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        with ResultStore(tmp_path / "results.sqlite3") as store:
+            store.record(make_result("_test1", 0))
+            store.record(make_result("_test1", 1))
+
+        with ResultStore(tmp_path / "results.sqlite3") as store:
+            store.record(make_result("_test1", 1))
+            store.flush()
+
+            for table, count in (("games", 1), ("players", 2), ("ownerships", 2), ("prices", 2)):
+                assert store.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone() == (count,)
+            _, rows = store.query("win-rate")
+            assert rows == [(0, 1, 0, 0.), (1, 1, 1, 1.)]
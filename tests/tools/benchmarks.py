@@ -0,0 +1,105 @@
+import json
+import pathlib
+
+import pytest
+
+from monopoly.loaders import BoardSpec
+from monopoly.tools.benchmarks import (
+    BENCHMARKS, BenchmarkResult, compare, dump, main, run_benchmark, run_benchmarks,
+)
+
+
+class TestRunBenchmark:
+    @pytest.mark.parametrize("name", tuple(BENCHMARKS))
+    def test_success(
+        self,
+        name: str,
+    ):
+        result = run_benchmark(BENCHMARKS[name], repeat=1, number=1)
+
+        assert result.seconds == result.median > 0
+        assert result.number == 1
+
+    @pytest.mark.parametrize("name", tuple(name for name, bench in BENCHMARKS.items() if bench.sized))
+    def test_success_generated(
+        self,
+        name: str,
+    ):
+        result = run_benchmark(BENCHMARKS[name], repeat=1, number=1, spec=BoardSpec.scaled(200))
+
+        assert result.seconds > 0
+
+
+class TestRunBenchmarks:
+    def test_success_generated(
+        self,
+    ):
+        results = run_benchmarks(["board.start", "game.headless"], repeat=1, number=1, spec=BoardSpec.scaled(100))
+
+        assert tuple(results) == ("board.start@100",)
+
+
+class TestCompare:
+    def test_success(
+        self,
+    ):
+        baseline = dump({
+            "_test_fast": BenchmarkResult(1., 1., 10),
+            "_test_slow": BenchmarkResult(1., 1., 10),
+        })
+
+        assert compare({
+            "_test_fast": BenchmarkResult(1.1, 1.1, 10),
+            "_test_slow": BenchmarkResult(1.5, 1.5, 10),
+            "_test_new": BenchmarkResult(9., 9., 10),
+        }, baseline, threshold=.2) == [("_test_slow", 1., 1.5)]
+
+
+class TestMain:
+    def test_success(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        baseline = tmp_path / "baseline.json"
+        assert main(["board.start", "--repeat", "1", "--save", str(baseline)]) == 0
+        assert tuple(json.loads(baseline.read_text(encoding="utf-8"))["benchmarks"]) == ("board.start",)
+
+        assert main(["board.start", "--repeat", "1", "--compare", str(baseline), "--threshold", "100"]) == 0
+
+    def test_success_spaces(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        baseline = tmp_path / "baseline.json"
+        assert main([
+            "board.start", "--repeat", "1", "--spaces", "100", "--spaces", "400", "--save", str(baseline),
+        ]) == 0
+        assert tuple(json.loads(baseline.read_text(encoding="utf-8"))["benchmarks"]) == (
+            "board.start@100", "board.start@400",
+        )
+
+    def test_success_spaces_skipped(
+        self,
+        capsys: pytest.CaptureFixture,
+    ):
+        assert main(["board.saving", "game.headless", "--repeat", "1", "--spaces", "300"]) == 0
+
+        captured = capsys.readouterr()
+        assert "board.saving@300" in captured.out
+        assert "game.headless" not in captured.out
+        assert captured.err.splitlines() == ["300 格的盤面不量測: game.headless"]
+
+    def test_failed_regression(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(dump({"board.start": BenchmarkResult(1e-12, 1e-12, 1)})), encoding="utf-8")
+
+        assert main(["board.start", "--repeat", "1", "--compare", str(baseline)]) == 1
+
+    def test_failed_unknown(
+        self,
+    ):
+        with pytest.raises(SystemExit):
+            main(["_test_unknown"])
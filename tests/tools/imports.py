@@ -0,0 +1,62 @@
+import pytest
+
+import monopoly
+from monopoly import engines
+from monopoly.tools import imports
+
+
+class TestMeasureImports:
+    @pytest.mark.parametrize("module", sorted(imports.IMPORT_EXCLUSIONS))
+    def test_success_exclusions(
+        self,
+        module: str,
+    ):
+        timings = imports.measure_imports(module, repeat=1)
+
+        assert module in timings
+        assert not set(imports.IMPORT_EXCLUSIONS[module]) & set(timings)
+
+    @pytest.mark.timing
+    @pytest.mark.parametrize("module", sorted(imports.IMPORT_BUDGETS))
+    def test_success_budget(
+        self,
+        module: str,
+    ):
+        timings = imports.measure_imports(module)
+
+        assert timings[module].cumulative <= imports.IMPORT_BUDGETS[module]
+
+
+class TestLazyAttributes:
+    def test_success(
+        self,
+    ):
+        assert monopoly.StandAloneEngine is engines.StandAloneEngine
+        assert {"AsyncServerEngine", "ShardedServerEngine", "StandAloneEngine"} <= set(dir(monopoly))
+
+    def test_failed(
+        self,
+    ):
+        with pytest.raises(AttributeError):
+            _ = monopoly.UnknownEngine
+
+
+class TestMain:
+    def test_success(
+        self,
+        capsys: pytest.CaptureFixture,
+    ):
+        assert imports.main(["monopoly", "--repeat", "1", "--top", "3"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].split()[0] == "monopoly"
+        assert len(lines) == 4
+
+    def test_failed_budget(
+        self,
+        capsys: pytest.CaptureFixture,
+    ):
+        budgets = {**imports.IMPORT_BUDGETS, "monopoly.constants": 1}
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(imports, "IMPORT_BUDGETS", budgets)
+            assert imports.main(["monopoly.constants", "--repeat", "1"]) == 1
+        assert "monopoly.constants" in capsys.readouterr().err
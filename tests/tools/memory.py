@@ -0,0 +1,43 @@
+import pytest
+
+from monopoly.tools import memory
+
+
+class TestMeasureBoard:
+    @pytest.mark.parametrize("turns", sorted(memory.MEMORY_BUDGETS))
+    def test_success_budget(
+        self,
+        turns: int,
+    ):
+        footprints = memory.measure_board(memory.build_board(turns))
+        assert sum(footprint.size for footprint in footprints.values()) <= memory.MEMORY_BUDGETS[turns]
+
+    def test_success_types(
+        self,
+    ):
+        board = memory.build_board()
+        footprints = memory.measure_board(board)
+        assert footprints["Land"].objects >= len(board.lands)
+        assert footprints["Player"].objects >= len(board.players)
+        for name in ("BoardPlayer", "BoardSpace", "CashCard", "Constituent", "ETF", "Stock"):
+            assert footprints[name].size > 0
+
+
+class TestMeasureAllocations:
+    def test_success(
+        self,
+    ):
+        result, allocated = memory.measure_allocations(lambda: bytearray(1 << 20))
+        assert len(result) == 1 << 20
+        assert allocated >= 1 << 20
+
+
+class TestMain:
+    def test_success(
+        self,
+        capsys: pytest.CaptureFixture,
+    ):
+        assert memory.main(["--turns", "20"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].split() == ["type", "objects", "bytes"]
+        assert lines[-1].startswith("tracemalloc")
@@ -0,0 +1,54 @@
+import pathlib
+
+import pytest
+
+from monopoly.tools.savebench import CodecReport, benchmark_codecs, main, pick_codec
+
+
+class TestBenchmarkCodecs:
+    def test_success(
+        self,
+    ):
+        reports = benchmark_codecs([b"_test" * 1000, b"_test_data" * 100], repeat=1)
+
+        assert [report.codec for report in reports] == ["raw", "zlib", "zlib-dict", "lzma", "bz2"]
+        assert reports[0].ratio == 1.
+        assert all(report.ratio > 1. for report in reports[1:])
+
+
+class TestPickCodec:
+    @pytest.mark.parametrize(("disk_speed", "codec"), (
+        (1e3, "lzma"),
+        (1e9, "raw"),
+    ))
+    def test_success(
+        self,
+        disk_speed: float,
+        codec: str,
+    ):
+        reports = (
+            CodecReport("raw", 1000, 1., 1e-6, 1e-6),
+            CodecReport("zlib", 300, 3.3, 1e-4, 1e-5),
+            CodecReport("lzma", 200, 5., 1e-3, 1e-4),
+        )
+
+        assert pick_codec(reports, disk_speed).codec == codec
+
+
+class TestMain:
+    def test_success(
+        self,
+        save_folder: pathlib.PosixPath,
+        capsys: pytest.CaptureFixture,
+    ):
+        (save_folder / "_test.sav").write_bytes(b"_test" * 1000)
+
+        assert main(["--repeat", "1"]) == 0
+        assert "GAME_SAVE_CODEC" in capsys.readouterr().out
+
+    def test_failed_empty(
+        self,
+        capsys: pytest.CaptureFixture,
+    ):
+        assert main([]) == 1
+        assert capsys.readouterr().err
@@ -0,0 +1,55 @@
+import json
+import pathlib
+
+import pytest
+
+from monopoly.storages import Archive
+from monopoly.tools import results, simulate
+
+
+class TestMain:
+    def test_success(
+        self,
+        tmp_path: pathlib.PosixPath,
+        capsys: pytest.CaptureFixture,
+    ):
+        database = tmp_path / "results.sqlite3"
+        assert simulate.main([
+            str(database), "--games", "3", "--max-turns", "50", "--archive", str(tmp_path / "archive"),
+        ]) == 0
+        with Archive(tmp_path / "archive") as archive:
+            assert len(archive) == 3
+
+        capsys.readouterr()
+        assert results.main([str(database), "win-rate"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].split() == ["seat", "games", "wins", "win_rate"]
+        assert len(lines) == 3
+
+    def test_success_report(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        assert simulate.main([
+            str(tmp_path / "results.sqlite3"), "--games", "2", "--max-turns", "30", "--processes", "2",
+            "--report", str(tmp_path / "report.json"),
+        ]) == 0
+        report = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+        assert report["games"] == 2
+        assert report["turns"]["count"] == 2
+
+    def test_success_profile(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        assert simulate.main([
+            str(tmp_path / "results.sqlite3"), "--games", "1", "--max-turns", "20",
+            "--profile", str(tmp_path / "profile.prom"),
+        ]) == 0
+        assert "monopoly_board_turns_total 20" in (tmp_path / "profile.prom").read_text(encoding="utf-8")
+
+    def test_failed_missing(
+        self,
+        tmp_path: pathlib.PosixPath,
+    ):
+        assert results.main([str(tmp_path / "results.sqlite3"), "roi"]) == 1
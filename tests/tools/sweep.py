@@ -0,0 +1,30 @@
+import pytest
+
+from monopoly.tools import sweep
+
+
+class TestMain:
+    def test_success(
+        self,
+        capsys: pytest.CaptureFixture,
+    ):
+        assert sweep.main([
+            "--range", "AREA_ADDITION_RATE=0.1:0.5", "--random", "2", "--games", "1", "--max-batches", "1",
+            "--max-turns", "10",
+        ]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].split()[:2] == ["AREA_ADDITION_RATE", "games"]
+        assert len(lines) == 3
+
+    @pytest.mark.parametrize("argv", [
+        [],
+        ["--grid", "HOUSE_TAX=0.1", "--range", "HOUSE_TAX=0.1:0.2"],
+        ["--grid", "UNKNOWN=1"],
+        ["--grid", "HOUSE_TAX"],
+        ["--grid", "HOUSE_TAX=0.1", "--metric", "unknown"],
+    ])
+    def test_failed(
+        self,
+        argv: list[str],
+    ):
+        assert sweep.main(argv) == 1
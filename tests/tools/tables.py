@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+from monopoly.tools import tables
+
+
+class TestOpenTables:
+    def test_success(
+        self,
+    ):
+        result = asyncio.run(tables.open_tables(50, batch=20))
+
+        assert result.tables == 50
+        # one parked thread a table on top of the main thread
+        assert result.threads >= 51
+        assert result.max_rss > 0
+
+
+class TestMain:
+    def test_success(
+        self,
+        capsys: pytest.CaptureFixture,
+    ):
+        assert tables.main(["--tables", "20"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].split() == ["tables", "20"]
+        assert len(lines) == 4
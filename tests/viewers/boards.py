@@ -0,0 +1,37 @@
+from monopoly.loaders import BoardSpec
+from monopoly.tools.benchmarks import load_board
+from monopoly.viewers import BoardViewer
+
+
+class TestBoardViewer:
+    def test_success_classic(
+        self,
+    ):
+        board = load_board()
+        viewer = BoardViewer(board)
+
+        assert viewer.origin == (0, 0)
+        assert viewer.views[10][10].name == board.start_space.space.name
+        assert viewer.views[10][10].usernames == ["bot1", "bot2"]
+        assert viewer.views[5][0] is not None and viewer.views[5][5] is not None and viewer.views[5][3] is None
+
+        viewer.scroll(3, -3)
+        assert viewer.origin == (0, 0)
+
+    def test_success_generated(
+        self,
+    ):
+        board = load_board(BoardSpec.scaled(2000))
+        for _ in range(30):
+            board.current_player.set_space(board.current_player.space.forwards[0])
+        viewer = BoardViewer(board, board_size=9)
+        row, column = viewer.layout.positions[board.current_player.space.space.id]
+
+        assert len(viewer.views) == len(viewer.views[0]) == 9
+        top, left = viewer.origin
+        assert (top, left) == (min(row - 4, viewer.layout.rows - 9), max(column - 4, 0))
+        assert viewer.views[row - top][column - left].usernames == [board.current_player.player.name]
+
+        viewer.scroll(-1000, 2000)
+        assert viewer.origin == (0, viewer.layout.columns - 9)
+        assert len(viewer.views) == len(viewer.views[0]) == 9
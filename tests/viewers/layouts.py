@@ -0,0 +1,53 @@
+import pytest
+
+from monopoly.loaders import BoardSpec
+from monopoly.tools.benchmarks import load_board
+from monopoly.viewers import board_layout
+from monopoly.viewers.layouts import compute_layout, topology_hash
+
+
+class TestComputeLayout:
+    def test_success_classic(
+        self,
+    ):
+        layout = compute_layout(load_board().start_space)
+
+        assert (layout.rows, layout.columns) == (11, 11)
+        assert len(layout.cells) == 48
+        assert {key: layout.positions[key] for key in (
+            "STARTPOINT", "EARNING01", "TRANSTARTPOINT", "EARNING02", "9004", "EARNING03", "5005",
+        )} == {
+            "STARTPOINT": (10, 10),
+            "EARNING01": (10, 0),
+            "TRANSTARTPOINT": (0, 0),
+            "EARNING02": (0, 10),
+            "9004": (9, 1),
+            "EARNING03": (2, 8),
+            "5005": (1, 10),
+        }
+
+    @pytest.mark.parametrize("spec", [
+        BoardSpec(spaces=13, branches=0),
+        BoardSpec(spaces=200, branches=6, cycles=4, branch_length=6),
+        BoardSpec.scaled(1000, seed=2),
+    ])
+    def test_success_generated(
+        self,
+        spec: BoardSpec,
+    ):
+        layout = compute_layout(load_board(spec).start_space)
+
+        assert len(layout.cells) == len(layout.positions) == spec.spaces
+        assert all(layout.cells[cell].space_id == key for key, cell in layout.positions.items())
+        assert all(0 <= row < layout.rows and 0 <= column < layout.columns for row, column in layout.cells)
+
+
+class TestBoardLayout:
+    def test_success(
+        self,
+    ):
+        board, other = load_board(), load_board(BoardSpec.scaled(100))
+
+        assert topology_hash(board.start_space) != topology_hash(other.start_space)
+        assert board_layout(board) is board_layout(load_board())
+        assert board_layout(other) is not board_layout(board)